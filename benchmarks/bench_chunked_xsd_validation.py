@@ -0,0 +1,45 @@
+"""A benchmark for validating large Datasets against a Schema in chunks, using a number of threads.
+
+Compares the time taken by `iati.validator.validate_is_iati_xml()` to validate a whole Dataset at once against the time taken to validate it in chunks of activities with different numbers of threads.
+
+Usage::
+
+    python benchmarks/bench_chunked_xsd_validation.py
+
+Note:
+    The speedup from additional threads depends on the number of CPUs available. Validating in chunks is faster regardless when a Dataset contains many errors, since lxml collects errors more slowly as the number of errors in a single log grows.
+
+"""
+import os
+import time
+import common
+import iati.default
+import iati.validator
+
+
+ACTIVITY_COUNTS = [1000, 10000, 20000]
+"""The numbers of activities within the Datasets that are validated."""
+
+THREAD_COUNTS = sorted({1, 2, 4, os.cpu_count() or 1})
+"""The numbers of threads to validate each Dataset with. A single thread validates the whole Dataset at once."""
+
+
+def main():
+    """Run the benchmark and print the results."""
+    schema = iati.default.activity_schema('2.02', False)
+
+    print('{0:>10} {1:>8} {2:>10} {3:>10} {4:>8}'.format('activities', 'threads', 'time (s)', 'speedup', 'errors'))
+    for activity_count in ACTIVITY_COUNTS:
+        dataset = common.create_dataset(activity_count)
+        single_thread_duration = None
+        for thread_count in THREAD_COUNTS:
+            start_time = time.perf_counter()
+            error_count = len(iati.validator.validate_is_iati_xml(dataset, schema, threads=thread_count))
+            duration = time.perf_counter() - start_time
+            if single_thread_duration is None:
+                single_thread_duration = duration
+            print('{0:>10} {1:>8} {2:>10.2f} {3:>10.2f} {4:>8}'.format(activity_count, thread_count, duration, single_thread_duration / duration, error_count))
+
+
+if __name__ == '__main__':
+    main()
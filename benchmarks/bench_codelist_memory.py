@@ -0,0 +1,52 @@
+"""A benchmark for the memory used by the default Codelists.
+
+Shows how much memory is allocated when the default Codelists for each fully supported version of the Standard are loaded and held.
+
+Usage::
+
+    python benchmarks/bench_codelist_memory.py
+
+"""
+import gc
+import tracemalloc
+import iati.default
+import iati.version
+
+
+def load_codelists(version):
+    """Load the default Codelists for a version of the Standard.
+
+    Args:
+        version (iati.Version): The version of the Standard to load Codelists for.
+
+    Returns:
+        tuple: The number of Codelists and the total number of Codes loaded.
+
+    """
+    codelists = iati.default._codelists(version, True)  # pylint: disable=protected-access
+
+    return len(codelists), sum(len(codelist.codes) for codelist in codelists.values())
+
+
+def main():
+    """Run the benchmark and print the results."""
+    # load a Codelist before tracing so that only the Codelists themselves are measured
+    iati.default.codelist('Version', iati.version.STANDARD_VERSION_LATEST)
+    iati.default._CODELISTS.clear()  # pylint: disable=protected-access
+    gc.collect()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    print('{0:>8} {1:>10} {2:>8} {3:>14}'.format('version', 'codelists', 'codes', 'total (KiB)'))
+    for version in iati.version.STANDARD_VERSIONS_SUPPORTED:
+        codelist_count, code_count = load_codelists(version)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        print('{0:>8} {1:>10} {2:>8} {3:>14.1f}'.format(str(version), codelist_count, code_count, (current - baseline) / 1024))
+
+    tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""A benchmark for validating Datasets with limits on the number of errors to find.
+
+Compares the time taken by `iati.validator.full_validation()` to find every error within Datasets containing many errors against the time taken when validation stops at the first error, or once a number of errors have been found.
+
+Usage::
+
+    python benchmarks/bench_error_limits.py
+
+"""
+import time
+import common
+import iati.default
+import iati.validator
+
+
+ACTIVITY_COUNTS = [1000, 10000]
+"""The numbers of activities within the Datasets that are validated."""
+
+LIMITS = [
+    ('none', {}),
+    ('stop_on_first_error', {'stop_on_first_error': True}),
+    ('max_errors=100', {'max_errors': 100}),
+    ('max_errors_per_code=10', {'max_errors_per_code': 10})
+]
+"""The limits to validate each Dataset with, along with a description of each."""
+
+
+def main():
+    """Run the benchmark and print the results."""
+    schema = iati.default.activity_schema('2.02')
+
+    print('{0:>10} {1:>24} {2:>10} {3:>8}'.format('activities', 'limit', 'time (s)', 'errors'))
+    for activity_count in ACTIVITY_COUNTS:
+        dataset = common.create_dataset(activity_count)
+        for description, limits in LIMITS:
+            start_time = time.perf_counter()
+            error_count = len(iati.validator.full_validation(dataset, schema, **limits))
+            duration = time.perf_counter() - start_time
+            print('{0:>10} {1:>24} {2:>10.2f} {3:>8}'.format(activity_count, description, duration, error_count))
+
+        start_time = time.perf_counter()
+        iati.validator.is_valid(dataset, schema)
+        print('{0:>10} {1:>24} {2:>10.2f} {3:>8}'.format(activity_count, 'is_valid()', time.perf_counter() - start_time, '-'))
+
+
+if __name__ == '__main__':
+    main()
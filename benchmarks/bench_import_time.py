@@ -0,0 +1,62 @@
+"""A benchmark for the time taken to import the IATI library.
+
+Shows how long `import iati` takes in a fresh interpreter, and which heavy dependencies are imported as a result.
+
+Usage::
+
+    python benchmarks/bench_import_time.py
+
+"""
+import subprocess
+import sys
+import timeit
+
+
+RUNS = 20
+"""The number of fresh interpreters to time the import within."""
+
+HEAVY_DEPENDENCIES = ['chardet', 'jsonschema', 'lxml.etree', 'pkg_resources', 'semantic_version', 'yaml']
+"""Dependencies that are slow to import, so should only be imported when required."""
+
+
+def time_import(statement):
+    """Time a statement within a fresh interpreter.
+
+    Args:
+        statement (str): The Python statement to execute.
+
+    Returns:
+        float: The fastest time taken to start an interpreter and execute the statement, in seconds.
+
+    """
+    return min(timeit.repeat(
+        lambda: subprocess.check_call([sys.executable, '-c', statement]),
+        number=1,
+        repeat=RUNS
+    ))
+
+
+def imported_dependencies():
+    """Determine which heavy dependencies are imported by `import iati`.
+
+    Returns:
+        list of str: The names of the heavy dependencies that are imported.
+
+    """
+    statement = 'import sys, iati; print(" ".join(name for name in {0!r} if name in sys.modules))'.format(HEAVY_DEPENDENCIES)
+
+    return subprocess.check_output([sys.executable, '-c', statement]).decode('utf-8').split()
+
+
+def main():
+    """Run the benchmark and print the results."""
+    baseline = time_import('pass')
+    with_iati = time_import('import iati')
+
+    print('Interpreter startup: {0:8.1f}ms'.format(baseline * 1000))
+    print('import iati:         {0:8.1f}ms'.format((with_iati - baseline) * 1000))
+    print('Heavy dependencies imported: {0}'.format(', '.join(imported_dependencies()) or 'none'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""A benchmark for checking a Dataset against the Standard Ruleset.
+
+Compares checking each Rule in turn, checking Rules grouped by context, and checking Rules with a compiled XSLT stylesheet, for Datasets containing different numbers of activities.
+
+Usage::
+
+    python benchmarks/bench_ruleset_evaluation.py
+
+"""
+import timeit
+import iati.data
+import iati.default
+import iati.ruleset_xslt
+
+
+ACTIVITY_COUNTS = [1, 10, 100, 1000]
+"""The numbers of activities within the Datasets that are checked."""
+
+ACTIVITY_XML = '''
+  <iati-activity>
+    <iati-identifier>AA-AAA-123456789-ABC123</iati-identifier>
+    <reporting-org ref="AA-AAA-123456789" type="40"/>
+    <participating-org ref="AA-AAA-123456789" role="1"/>
+    <activity-date type="1" iso-date="2010-01-01"/>
+    <activity-date type="2" iso-date="2010-02-01"/>
+    <activity-date type="3" iso-date="2011-01-01"/>
+    <activity-date type="4" iso-date="2011-02-01"/>
+    <recipient-country code="AF" percentage="60"/>
+    <recipient-region code="289" percentage="40"/>
+    <sector code="11110"/>
+    <budget>
+      <period-start iso-date="2010-01-01"/>
+      <period-end iso-date="2010-12-31"/>
+      <value value-date="2010-01-01">100</value>
+    </budget>
+    <transaction>
+      <transaction-type code="1"/>
+      <transaction-date iso-date="2010-01-01"/>
+      <value value-date="2010-01-01">100</value>
+      <provider-org ref="AA-AAA-123456789"/>
+    </transaction>
+  </iati-activity>
+'''
+"""An activity that passes each Standard Ruleset Rule that has an `//iati-activity` context, so that each Rule is checked against every activity."""
+
+RUNS = 3
+"""The number of times to check each Dataset, with the fastest time being reported."""
+
+
+def create_dataset(activity_count):
+    """Create a Dataset containing the specified number of activities.
+
+    Args:
+        activity_count (int): The number of activities to include.
+
+    Returns:
+        iati.Dataset: A Dataset containing copies of `ACTIVITY_XML`.
+
+    """
+    return iati.data.Dataset('<iati-activities version="2.02">{0}</iati-activities>'.format(ACTIVITY_XML * activity_count))
+
+
+def check_each_rule(ruleset, dataset):
+    """Check a Dataset against each Rule in a Ruleset in turn.
+
+    Args:
+        ruleset (iati.Ruleset): The Ruleset to check against.
+        dataset (iati.Dataset): The Dataset to check.
+
+    """
+    for rule in ruleset.rules:
+        try:
+            rule.is_valid_for(dataset)
+        except ValueError:
+            pass
+
+
+def main():
+    """Run the benchmark and print the results."""
+    ruleset = iati.default.ruleset('2.02')
+    compiled_ruleset = iati.ruleset_xslt.CompiledRuleset(ruleset)
+
+    print('{0:>10} {1:>16} {2:>16} {3:>16}'.format('activities', 'each rule (ms)', 'grouped (ms)', 'xslt (ms)'))
+    for activity_count in ACTIVITY_COUNTS:
+        dataset = create_dataset(activity_count)
+        each_rule = min(timeit.repeat(lambda: check_each_rule(ruleset, dataset), number=1, repeat=RUNS))
+        grouped = min(timeit.repeat(lambda: ruleset.results_for(dataset), number=1, repeat=RUNS))
+        xslt = min(timeit.repeat(lambda: compiled_ruleset.results_for(dataset), number=1, repeat=RUNS))
+        print('{0:>10} {1:>16.1f} {2:>16.1f} {3:>16.1f}'.format(activity_count, each_rule * 1000, grouped * 1000, xslt * 1000))
+
+
+if __name__ == '__main__':
+    main()
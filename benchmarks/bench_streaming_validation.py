@@ -0,0 +1,92 @@
+"""A benchmark for validating large files with and without streaming.
+
+Compares the time taken and the peak memory used by `iati.validator.full_validation()` and `iati.streaming.validate()`, for files containing different numbers of activities.
+
+Each measurement is made in a new process, since most of the memory is allocated by libxml2 and is not seen by `tracemalloc`.
+
+Usage::
+
+    python benchmarks/bench_streaming_validation.py
+
+Note:
+    Peak memory is measured with the `resource` module, so this benchmark runs only on Unix.
+
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import common
+import iati.default
+import iati.streaming
+import iati.utilities
+import iati.validator
+
+
+ACTIVITY_COUNTS = [100, 1000, 10000, 20000]
+"""The numbers of activities within the files that are validated."""
+
+MODES = ['full', 'streaming']
+"""The ways of validating each file."""
+
+
+def write_file(path, activity_count):
+    """Write a file containing the specified number of activities.
+
+    Args:
+        path (str): The path to write the file to.
+        activity_count (int): The number of activities to include.
+
+    """
+    with open(path, 'w') as xml_file:
+        xml_file.write('<iati-activities version="2.02">')
+        for _ in range(activity_count):
+            xml_file.write(common.ACTIVITY_XML)
+        xml_file.write('\n</iati-activities>\n')
+
+
+def measure(mode, path):
+    """Validate a file and print the time taken and peak memory used.
+
+    Args:
+        mode (str): The way to validate the file. One of `MODES`.
+        path (str): The path to the file to validate.
+
+    """
+    schema = iati.default.activity_schema('2.02')
+    start_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start_time = time.perf_counter()
+    if mode == 'full':
+        error_count = len(iati.validator.full_validation(iati.utilities.load_as_dataset(path), schema))
+    else:
+        error_count = sum(1 for _ in iati.streaming.validate(path, schema))
+    duration = time.perf_counter() - start_time
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(duration, (peak_memory - start_memory) / 1024, error_count)
+
+
+def main():
+    """Run the benchmark and print the results."""
+    print('{0:>10} {1:>10} {2:>10} {3:>14} {4:>8}'.format('activities', 'mode', 'time (s)', 'memory (MiB)', 'errors'))
+    for activity_count in ACTIVITY_COUNTS:
+        file_descriptor, path = tempfile.mkstemp(suffix='.xml')
+        os.close(file_descriptor)
+        try:
+            write_file(path, activity_count)
+            for mode in MODES:
+                output = subprocess.check_output([sys.executable, __file__, mode, path], universal_newlines=True)
+                duration, memory, error_count = output.split()
+                print('{0:>10} {1:>10} {2:>10.2f} {3:>14.1f} {4:>8}'.format(activity_count, mode, float(duration), float(memory), error_count))
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], sys.argv[2])
+    else:
+        main()
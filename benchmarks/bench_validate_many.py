@@ -0,0 +1,76 @@
+"""A benchmark for validating a number of files in worker processes.
+
+Compares the time taken to validate a batch of files with `iati.validator.full_validation()`, one file after another, against `iati.validator.validate_many()` with different numbers of worker processes.
+
+Usage::
+
+    python benchmarks/bench_validate_many.py
+
+Note:
+    The speedup that is possible depends on the number of CPUs available. Worker counts above the number of CPUs are not expected to be faster.
+
+"""
+import os
+import shutil
+import tempfile
+import time
+import iati.default
+import iati.tests.resources
+import iati.utilities
+import iati.validator
+
+
+FILE_COUNT = 200
+"""The number of files within the batch that is validated."""
+
+DATASET_NAMES = ['valid_iati', 'valid_iati_invalid_code', 'ruleset-std/invalid_std_ruleset_multiple_rule_errors', 'invalid_iati_missing_required_element']
+"""The test Datasets that the files are copied from, in rotation."""
+
+WORKER_COUNTS = sorted({1, 2, 4, os.cpu_count() or 1})
+"""The numbers of worker processes to validate the batch with."""
+
+
+def write_files(directory):
+    """Write the batch of files to validate.
+
+    Args:
+        directory (str): The directory to write the files to.
+
+    Returns:
+        list of str: The paths to the files.
+
+    """
+    paths = list()
+    for index in range(FILE_COUNT):
+        path = os.path.join(directory, '{0}.xml'.format(index))
+        shutil.copyfile(iati.tests.resources.get_test_data_path(DATASET_NAMES[index % len(DATASET_NAMES)], '2.02'), path)
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    """Run the benchmark and print the results."""
+    schema = iati.default.activity_schema('2.02')
+    directory = tempfile.mkdtemp()
+
+    try:
+        paths = write_files(directory)
+
+        start_time = time.perf_counter()
+        error_count = sum(len(iati.validator.full_validation(iati.utilities.load_as_dataset(path), schema)) for path in paths)
+        serial_duration = time.perf_counter() - start_time
+
+        print('{0:>10} {1:>10} {2:>10} {3:>8}'.format('workers', 'time (s)', 'speedup', 'errors'))
+        print('{0:>10} {1:>10.2f} {2:>10.2f} {3:>8}'.format('serial', serial_duration, 1, error_count))
+        for worker_count in WORKER_COUNTS:
+            start_time = time.perf_counter()
+            error_count = sum(len(error_log) for _, error_log in iati.validator.validate_many(paths, schema, workers=worker_count))
+            duration = time.perf_counter() - start_time
+            print('{0:>10} {1:>10.2f} {2:>10.2f} {3:>8}'.format(worker_count, duration, serial_duration / duration, error_count))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""A benchmark for the creation of ValidationErrors.
+
+Shows how the cost of creating ValidationErrors changes with the number of errors created.
+
+Usage::
+
+    python benchmarks/bench_validation_errors.py
+
+"""
+import timeit
+import iati.codelists
+import iati.data
+import iati.tests.resources
+import iati.validator
+
+
+ERROR_COUNTS = [10, 100, 1000, 10000, 50000]
+"""The numbers of errors to create in each run of the benchmark."""
+
+
+def create_errors(count, dataset, codelist):
+    """Create the specified number of Codelist ValidationErrors.
+
+    Args:
+        count (int): The number of errors to create.
+        dataset (iati.Dataset): The Dataset that the errors are located within.
+        codelist (iati.Codelist): The Codelist that the errors relate to.
+
+    """
+    attr_name = 'code'  # used via `locals()` # pylint: disable=unused-variable
+    code = 'not-a-code'  # used via `locals()` # pylint: disable=unused-variable
+    line_number = 1  # used via `locals()` # pylint: disable=unused-variable
+    for _ in range(count):
+        iati.validator.ValidationError('err-code-not-on-codelist', locals())
+
+
+def main():
+    """Run the benchmark and print the results."""
+    dataset = iati.tests.resources.load_as_dataset('valid_iati', '2.02')
+    codelist = iati.Codelist('BenchmarkCodelist')
+
+    # load the error codes before timing so that only construction is measured
+    iati.validator.ValidationError('err-code-not-on-codelist')
+
+    print('{0:>10} {1:>12} {2:>14}'.format('errors', 'total (s)', 'per error (us)'))
+    for count in ERROR_COUNTS:
+        duration = min(timeit.repeat(lambda: create_errors(count, dataset, codelist), number=1, repeat=3))  # pylint: disable=cell-var-from-loop
+        print('{0:>10} {1:>12.4f} {2:>14.2f}'.format(count, duration, duration / count * 1000000))
+
+
+if __name__ == '__main__':
+    main()
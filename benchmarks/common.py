@@ -0,0 +1,39 @@
+"""Helpers that are shared between the benchmarks."""
+import iati
+
+
+ACTIVITY_XML = '''
+  <iati-activity>
+    <iati-identifier>AA-AAA-123456789-ABC123</iati-identifier>
+    <reporting-org ref="AA-AAA-123456789" type="40"/>
+    <title>
+      <narrative>An activity</narrative>
+    </title>
+    <participating-org ref="AA-AAA-123456789" role="1"/>
+    <activity-status code="2"/>
+    <activity-date type="1" iso-date="2010-01-01"/>
+    <activity-date type="2" iso-date="2010-02-01"/>
+    <recipient-country code="AF" percentage="60"/>
+    <recipient-region code="289" percentage="40"/>
+    <sector code="11110"/>
+    <transaction>
+      <transaction-type code="1"/>
+      <transaction-date iso-date="2010-01-01"/>
+      <value value-date="2010-01-01">100</value>
+      <provider-org ref="AA-AAA-123456789"/>
+    </transaction>
+  </iati-activity>'''
+"""An activity containing two errors against the 2.02 Activity Schema, to repeat within the files and Datasets that are validated."""
+
+
+def create_dataset(activity_count):
+    """Create a Dataset containing the specified number of copies of `ACTIVITY_XML`.
+
+    Args:
+        activity_count (int): The number of activities to include.
+
+    Returns:
+        iati.Dataset: The Dataset.
+
+    """
+    return iati.Dataset('<iati-activities version="2.02">{0}\n</iati-activities>\n'.format(ACTIVITY_XML * activity_count))
@@ -6,4 +6,7 @@ from .rulesets import Rule, Ruleset  # noqa: F401
 from .rulesets import RuleAtLeastOne, RuleDateOrder, RuleDependent, RuleNoMoreThanOne, RuleRegexMatches, RuleRegexNoMatches, RuleStartsWith, RuleSum, RuleUnique  # noqa: F401
 from .schemas import ActivitySchema, OrganisationSchema  # noqa: F401
 
-__import__('pkg_resources').declare_namespace(__name__)
+__version__ = '0.4.1'
+"""The version of pyIATI."""
+
+__path__ = __import__('pkgutil').extend_path(__path__, __name__)
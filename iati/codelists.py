@@ -1,5 +1,9 @@
 """A module containing a core representation of IATI Codelists."""
 import collections
+import collections.abc
+import copy
+import re
+import sys
 from lxml import etree
 import iati.resources
 import iati.utilities
@@ -10,7 +14,7 @@ class Codelist:
 
     Attributes:
         complete (bool): Whether the Codelist is complete or not. If complete, attributes making use of this Codelist must only contain values present on the Codelist. If not complete, this is merely strongly advised.
-        codes (:obj:`set` of :obj:`iati.Code`): The codes demonstrating the range of values that the Codelist may represent.
+        codes (:obj:`set` of :obj:`iati.Code`): The codes demonstrating the range of values that the Codelist may represent. Any iterable of Codes that is assigned is converted to a set-like collection that tracks the values of the Codes it contains.
         name (str): The name of the Codelist.
 
     Warning:
@@ -25,7 +29,16 @@ class Codelist:
 
     """
 
-    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('complete', 'name', '_codes', '_frozen')
+
+    # a number of placeholder attributes that Codelists have, though are not yet implemented
+    _name_prose = None
+    _description = None
+    _language = None
+    _url = None
+    _ref = None
+    _category_codelist = None
+
     def __init__(self, name, xml=None):
         """Initialise a Codelist.
 
@@ -74,25 +87,19 @@ class Codelist:
                     value = ''
                 if name is None:
                     name = ''
-                self.codes.add(iati.Code(value, name))
+                # the same values and names appear on Codelists at each version of the Standard, so are shared between them
+                self.codes.add(iati.Code(sys.intern(value), sys.intern(name)))
 
             try:
                 self.complete = True if tree.attrib['complete'] == '1' else False
             except KeyError:
                 pass
 
+        self._frozen = False
         self.complete = None
-        self.codes = set()
+        self.codes = _CodeSet()
         self.name = name
 
-        # a number of placeholder attributes that Codelists have, though are not yet implemented
-        self._name_prose = None
-        self._description = None
-        self._language = None
-        self._url = None
-        self._ref = None
-        self._category_codelist = None
-
         if xml:
             parse_from_xml(xml)
 
@@ -105,6 +112,13 @@ class Codelist:
             Utilise all attributes as part of the equality process.
 
         """
+        if self is other:
+            return True
+
+        # the hash is cached, so Codelists that differ are usually found without comparing each Code
+        if hash(self) != hash(other):
+            return False
+
         return (self.name == other.name) and (self.complete == other.complete) and (collections.Counter(self.codes) == collections.Counter(other.codes))
 
     def __ne__(self, other):
@@ -116,13 +130,111 @@ class Codelist:
 
         This allows uniqueness to be correctly defined upon insertion into a set.
 
+        Note:
+            The part of the hash relating to Codes is computed once and reused until Codes are added to or removed from the Codelist.
+
         Todo:
             Utilise all attributes as part of the equality process.
 
         """
-        sorted_codes = sorted(self.codes, key=lambda x: x.value)
+        return hash((self.name, self.complete, self._codes.hash_key))
+
+    def __copy__(self):
+        """Copy the Codelist.
+
+        The copy shares its Codes with this Codelist until either is modified. As such, copying is cheap regardless of the number of Codes.
+
+        Returns:
+            iati.Codelist: A copy of the Codelist. The copy is not frozen, so may be used to modify a frozen Codelist without affecting the original.
+
+        Note:
+            Until the Codes on either Codelist are added to or removed from, the Code instances themselves are shared. Codes that are shared with a frozen Codelist are frozen, so cannot be modified.
+
+            The Codes are copied, and so may be modified, once Codes are added to or removed from the copy.
+
+        """
+        codelist = type(self)(self.name)
+        codelist.complete = self.complete
+        codelist._codes = self._codes.share()  # pylint: disable=protected-access
+
+        return codelist
+
+    def __setattr__(self, name, value):
+        """Set an attribute of the Codelist.
+
+        Raises:
+            AttributeError: When the Codelist is frozen.
+
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError('The Codelist {0} is frozen, so its {1} attribute cannot be set.'.format(self.name, name.lstrip('_')))
+
+        super().__setattr__(name, value)
+
+    @property
+    def codes(self):
+        """:obj:`set` of :obj:`iati.Code`: The codes demonstrating the range of values that the Codelist may represent."""
+        return self._codes
+
+    @codes.setter
+    def codes(self, codes):
+        """Set the codes contained within the Codelist.
+
+        Args:
+            codes (iterable of iati.Code): The codes to contain within the Codelist.
+
+        """
+        self._codes = _CodeSet(codes)
+
+    @property
+    def frozen(self):
+        """bool: Whether the Codelist is frozen, such that it cannot be modified."""
+        return self._frozen
+
+    def freeze(self):
+        """Prevent the Codelist from being modified.
+
+        The hash and code values of a frozen Codelist are computed at most once.
+
+        Returns:
+            iati.Codelist: The Codelist that has been frozen.
+
+        Note:
+            Once frozen, a Codelist cannot be unfrozen. A `copy()` of a frozen Codelist is not frozen, though a `deepcopy()` is.
+
+            The Codes within the Codelist are also frozen.
+
+        """
+        self._codes.freeze()
+        self._frozen = True
+
+        return self
+
+    @property
+    def code_values(self):
+        """frozenset(str): The values of the codes within the Codelist.
+
+        The set is computed once and reused until Codes are added to or removed from the Codelist.
+
+        Warning:
+            Modifying the value of a Code while it is within a Codelist is not detected. The Code should be removed before it is modified, then added again.
+
+        """
+        return self._codes.values
+
+    def invalid_values(self, values):
+        """Determine which of a number of values are not on the Codelist.
+
+        Args:
+            values (iterable of str): The values to check.
+
+        Returns:
+            collections.Counter: Keys are values that are not on the Codelist. Values are the number of times that each was found.
+
+        """
+        code_values = self.code_values
 
-        return hash((self.name, self.complete, tuple(sorted_codes)))
+        return collections.Counter(value for value in values if value not in code_values)
 
     @property
     def xsd_restriction(self):
@@ -165,6 +277,198 @@ class Codelist:
         return type_base_el
 
 
+class _CodeSet(collections.abc.MutableSet):
+    """A set of Codes that keeps track of the values of the Codes it contains.
+
+    Note:
+        Membership is determined in the same way as for a `set` of Codes.
+
+    """
+
+    __slots__ = ('_codes', '_values', '_hash_key', '_shared')
+
+    def __init__(self, codes=()):
+        """Initialise a set of Codes.
+
+        Args:
+            codes (iterable of iati.Code): The Codes to initially contain within the set.
+
+        """
+        self._codes = set(codes)
+        self._shared = False
+        self._changed()
+
+    def __contains__(self, code):
+        """Check whether a Code is within the set."""
+        return code in self._codes
+
+    def __iter__(self):
+        """Iterate over the Codes within the set."""
+        return iter(self._codes)
+
+    def __len__(self):
+        """Return the number of Codes within the set."""
+        return len(self._codes)
+
+    def __repr__(self):
+        """Return a representation of the set."""
+        return '{0}({1!r})'.format(type(self).__name__, self._codes)
+
+    @property
+    def values(self):
+        """frozenset(str): The values of the Codes within the set."""
+        if self._values is None:
+            self._values = frozenset(code.value for code in self._codes)
+
+        return self._values
+
+    def __getstate__(self):
+        """Return the state of the set for copying and pickling.
+
+        The hash of the Codes depends upon the hash seed of the interpreter that computed it, so is not included. It is recomputed when next needed.
+
+        """
+        if isinstance(self._codes, frozenset) and not self._shared:
+            return self._codes
+        elif self._shared:
+            # shared Codes may be frozen, so are copied to allow the restored set to modify them
+            return {copy.copy(code) for code in self._codes}
+
+        return set(self._codes)
+
+    def __setstate__(self, state):
+        """Restore the state of the set after copying or unpickling."""
+        self._codes = state
+        self._shared = False
+        self._changed()
+
+    @property
+    def hash_key(self):
+        """int: A hash of the Codes within the set, which does not depend on the order of iteration.
+
+        Note:
+            The hash is only valid within the interpreter that computed it.
+
+        """
+        if self._hash_key is None:
+            self._hash_key = hash(tuple(sorted(self._codes, key=lambda x: x.value)))
+
+        return self._hash_key
+
+    def _changed(self):
+        """Discard information computed from the Codes within the set, since they have changed."""
+        self._values = None
+        self._hash_key = None
+
+    def freeze(self):
+        """Prevent the set, and the Codes within it, from being modified."""
+        if self._shared and not isinstance(self._codes, frozenset):
+            # the Codes are shared with a set that may still be modified, so must be copied before they are frozen
+            self._codes = {copy.copy(code) for code in self._codes}
+
+        for code in self._codes:
+            code.freeze()
+
+        self._codes = frozenset(self._codes)
+        self._shared = False
+
+    def share(self):
+        """Create a set of Codes that shares storage with this set until either set is modified.
+
+        Returns:
+            iati.codelists._CodeSet: A set containing the same Codes. The values and hash of the Codes are computed once and shared.
+
+        """
+        shared = type(self).__new__(type(self))
+        shared._codes = self._codes
+        shared._values = self.values
+        shared._hash_key = self.hash_key
+        shared._shared = True
+
+        # a frozen set cannot be modified, so has no need to copy its Codes
+        if not isinstance(self._codes, frozenset):
+            self._shared = True
+
+        return shared
+
+    def _mutable_codes(self):
+        """Return the underlying set of Codes so that it may be modified.
+
+        Codes that are shared with another set are copied first, so that the other set is not modified.
+
+        Raises:
+            TypeError: When the set is frozen.
+
+        """
+        if self._shared:
+            self._codes = {copy.copy(code) for code in self._codes}
+            self._shared = False
+        elif isinstance(self._codes, frozenset):
+            raise TypeError('The Codes on a frozen Codelist cannot be modified.')
+
+        self._changed()
+
+        return self._codes
+
+    def add(self, code):
+        """Add a Code to the set.
+
+        Args:
+            code (iati.Code): The Code to add.
+
+        Raises:
+            TypeError: When the set is frozen.
+
+        """
+        self._mutable_codes().add(code)
+
+    def discard(self, code):
+        """Remove a Code from the set if it is present.
+
+        Args:
+            code (iati.Code): The Code to remove.
+
+        Raises:
+            TypeError: When the set is frozen.
+
+        """
+        self._mutable_codes().discard(code)
+
+    def pop(self):
+        """Remove and return an arbitrary Code from the set.
+
+        Returns:
+            iati.Code: The Code that was removed.
+
+        Raises:
+            KeyError: When the set is empty.
+            TypeError: When the set is frozen.
+
+        """
+        return self._mutable_codes().pop()
+
+    def clear(self):
+        """Remove all Codes from the set.
+
+        Raises:
+            TypeError: When the set is frozen.
+
+        """
+        self._mutable_codes().clear()
+
+    def update(self, *others):
+        """Add all Codes from a number of iterables to the set.
+
+        Args:
+            *others (iterable of iati.Code): The Codes to add.
+
+        Raises:
+            TypeError: When the set is frozen.
+
+        """
+        self._mutable_codes().update(*others)
+
+
 class Code:
     """Representation of a Code contained within a Codelist.
 
@@ -177,7 +481,17 @@ class Code:
 
     """
 
-    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('name', 'value', '_frozen')
+
+    # a number of placeholder attributes that Codes have, though are not yet implemented
+    _description = None
+    _category = None
+    _url = None
+    _public_database = False
+    _status = None
+    _activation_date = None
+    _withdrawal_date = None
+
     def __init__(self, value, name=''):
         """Initialise a Code.
 
@@ -192,17 +506,60 @@ class Code:
             The format of the constructor is likely to change. It should include mandatory parameters, and allow for other attributes to be defined.
 
         """
+        self._frozen = False
         self.name = name
         self.value = value
 
-        # a number of placeholder attributes that Codelists have, though are not yet implemented
-        self._description = None
-        self._category = None
-        self._url = None
-        self._public_database = False
-        self._status = None
-        self._activation_date = None
-        self._withdrawal_date = None
+    def __setattr__(self, name, value):
+        """Set an attribute of the Code.
+
+        Raises:
+            AttributeError: When the Code is frozen.
+
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError('The Code {0} is frozen, so its {1} attribute cannot be set.'.format(self.value, name.lstrip('_')))
+
+        super().__setattr__(name, value)
+
+    def __copy__(self):
+        """Copy the Code.
+
+        Returns:
+            iati.Code: A copy of the Code. The copy is not frozen, so may be modified.
+
+        """
+        return type(self)(self.value, self.name)
+
+    def __getstate__(self):
+        """Return the state of the Code for deep copying and pickling."""
+        return (self.name, self.value, self._frozen)
+
+    def __setstate__(self, state):
+        """Restore the state of the Code after deep copying or unpickling."""
+        for attr_name, value in zip(('name', 'value', '_frozen'), state):
+            object.__setattr__(self, attr_name, value)
+
+    @property
+    def frozen(self):
+        """bool: Whether the Code is frozen, such that it cannot be modified."""
+        return self._frozen
+
+    def freeze(self):
+        """Prevent the Code from being modified.
+
+        Codes are frozen when the Codelist that contains them is frozen, since the hash of a frozen Codelist is computed from its Codes.
+
+        Returns:
+            iati.Code: The Code that has been frozen.
+
+        Note:
+            Once frozen, a Code cannot be unfrozen. A `copy()` of a frozen Code is not frozen.
+
+        """
+        self._frozen = True
+
+        return self
 
     def __eq__(self, other):
         """Check Code equality.
@@ -255,3 +612,364 @@ class Code:
             value=self.value,
             nsmap=iati.constants.NSMAP
         )
+
+
+class CodelistMapping:
+    """Representation of a Codelist Mapping file, which states where in a Dataset values on each Codelist should be found.
+
+    Each mapping within the file is parsed once, with the XPath expressions it requires compiled ahead of time. As such, a single instance may be reused to check any number of Datasets.
+
+    Note:
+        Instances are not intended to be modified after initialisation.
+
+    """
+
+    def __init__(self, xml):
+        """Initialise a Codelist Mapping.
+
+        Args:
+            xml (str / bytes / etree._ElementTree): An XML representation of a Codelist Mapping file.
+
+        Raises:
+            etree.XPathSyntaxError: When a path or condition within the mapping file is not a valid XPath expression.
+
+        """
+        if isinstance(xml, etree._ElementTree):  # pylint: disable=protected-access
+            tree = xml.getroot()
+        else:
+            tree = iati.utilities.convert_xml_to_tree(xml)
+
+        mappings = collections.defaultdict(list)
+        for mapping_el in tree.xpath('//mapping'):
+            condition_el = mapping_el.find('condition')
+            mapping = CodelistMappingEntry(
+                mapping_el.find('codelist').attrib['ref'],
+                mapping_el.find('path').text,
+                None if condition_el is None else condition_el.text
+            )
+            mappings[mapping.codelist_name].append(mapping)
+
+        self._mappings = {codelist_name: tuple(codelist_mappings) for codelist_name, codelist_mappings in mappings.items()}
+        self._dispatch_table = self._build_dispatch_table(self._mappings.values())
+        self._dispatch_tables_for_names = dict()
+
+    @staticmethod
+    def _build_dispatch_table(mapping_groups):
+        """Index mappings by the element tag and attribute that values are located at.
+
+        Args:
+            mapping_groups (iterable of iterable of iati.codelists.CodelistMappingEntry): The mappings to index.
+
+        Returns:
+            dict: Keys are tuples in the format `(tag, attr_key)`. The tag is `None` for mappings that apply to any element. The attribute key is `None` for mappings that locate element text. Values are tuples of mappings.
+
+        """
+        dispatch_table = collections.defaultdict(list)
+        for mappings in mapping_groups:
+            for mapping in mappings:
+                if mapping.dispatch_key is not None:
+                    dispatch_table[mapping.dispatch_key].append(mapping)
+
+        return {key: tuple(mappings) for key, mappings in dispatch_table.items()}
+
+    def __getitem__(self, codelist_name):
+        """Return the mappings for the Codelist with the specified name.
+
+        Args:
+            codelist_name (str): The name of the Codelist to return mappings for.
+
+        Returns:
+            tuple of iati.codelists.CodelistMappingEntry: The locations at which values on the Codelist should be found. Empty if there are no mappings for the Codelist.
+
+        """
+        return self._mappings.get(codelist_name, ())
+
+    def __iter__(self):
+        """Return an iterator over the names of Codelists that have mappings."""
+        return iter(self._mappings)
+
+    def __len__(self):
+        """Return the number of Codelists that have mappings."""
+        return len(self._mappings)
+
+    def locate_codes(self, tree, codelist_names=None):
+        """Locate the values for each mapping within a tree, walking the tree once.
+
+        Args:
+            tree (etree._ElementTree): The tree to locate values within.
+            codelist_names (iterable of str): The names of the Codelists to locate values for. Default is all Codelists with mappings.
+
+        Returns:
+            dict: Keys are `iati.codelists.CodelistMappingEntry` instances. Values are lists of tuples in the format returned by `CodelistMappingEntry.extract_codes()`, in document order.
+
+        Raises:
+            ValueError: When a mapping path is not looking for an attribute value or element text.
+
+        """
+        located_codes = {mapping: [] for mapping in self._mappings_for_names(codelist_names)}
+        for mapping, value, line_number in self.iter_located_codes(tree, codelist_names):
+            located_codes[mapping].append((value, line_number))
+
+        return located_codes
+
+    def iter_located_codes(self, tree, codelist_names=None):
+        """Locate the values for each mapping within a tree, walking the tree once and yielding each value as soon as it is located.
+
+        Args:
+            tree (etree._ElementTree): The tree to locate values within.
+            codelist_names (iterable of str): The names of the Codelists to locate values for. Default is all Codelists with mappings.
+
+        Yields:
+            tuple: A tuple in the format: `(iati.codelists.CodelistMappingEntry, str, int)` - The mapping that located the value; The value; The sourceline of the element that the value is located on.
+
+        Raises:
+            ValueError: When a mapping path is not looking for an attribute value or element text.
+
+        Note:
+            Mappings with paths that are too complex to be matched element-by-element are evaluated separately using their compiled XPath. Their values are yielded first, one mapping at a time. All other values are yielded in document order.
+
+            The tree is walked lazily, so no more of it is walked than is needed to yield the values that are consumed.
+
+        """
+        mappings = self._mappings_for_names(codelist_names)
+        if codelist_names is None:
+            dispatch_table = self._dispatch_table
+        else:
+            codelist_names = frozenset(codelist_names)
+            # the same Codelists are generally located many times, such as once per activity when a file is streamed
+            try:
+                dispatch_table = self._dispatch_tables_for_names[codelist_names]
+            except KeyError:
+                dispatch_table = self._build_dispatch_table([mappings])
+                self._dispatch_tables_for_names[codelist_names] = dispatch_table
+
+        for mapping in mappings:
+            if mapping.dispatch_key is None:
+                for value, line_number in mapping.extract_codes(tree):
+                    yield mapping, value, line_number
+
+        if not dispatch_table:
+            return
+
+        for element in tree.iter(tag=etree.Element):
+            tag = element.tag
+            for attr_key, value in element.attrib.items():
+                for mapping in dispatch_table.get((tag, attr_key), ()) + dispatch_table.get((None, attr_key), ()):
+                    if mapping.matches(element):
+                        yield mapping, value, element.sourceline
+
+            for mapping in dispatch_table.get((tag, None), ()):
+                if mapping.matches(element):
+                    yield mapping, element.text, element.sourceline
+
+    def _mappings_for_names(self, codelist_names=None):
+        """Return the mappings for a number of Codelists.
+
+        Args:
+            codelist_names (iterable of str): The names of the Codelists to return mappings for. Default is all Codelists with mappings.
+
+        Returns:
+            list of iati.codelists.CodelistMappingEntry: The mappings for the Codelists, without duplicates.
+
+        """
+        if codelist_names is None:
+            codelist_names = self._mappings
+        else:
+            codelist_names = frozenset(codelist_names)
+
+        return list(dict.fromkeys(mapping for codelist_name in codelist_names for mapping in self[codelist_name]))
+
+    def as_dict(self):
+        """Return the mappings in the format of a dictionary.
+
+        Returns:
+            dict of list of dict: A dictionary containing mapping information. Keys in the first dictionary are Codelist names. Keys in the second dictionary are `xpath` and `condition`. The condition is `None` if there is no condition.
+
+        Note:
+            A new dictionary is created each time this is called, so may be modified freely. Missing Codelist names map to an empty list.
+
+        """
+        mappings = collections.defaultdict(list)
+        for codelist_name, codelist_mappings in self._mappings.items():
+            mappings[codelist_name] = [{'xpath': mapping.xpath, 'condition': mapping.condition} for mapping in codelist_mappings]
+
+        return mappings
+
+
+class CodelistMappingEntry:
+    """Representation of a single mapping within a Codelist Mapping file.
+
+    Attributes:
+        codelist_name (str): The name of the Codelist that values at the mapped location should be on.
+        xpath (str): An XPath expression stating where values on the Codelist are located.
+        condition (str): An XPath expression limiting which elements the mapping applies to. `None` if there is no condition.
+        parent_el_xpath (str): The section of `xpath` that locates the element(s) containing values.
+        last_xpath_section (str): The last section of `xpath`, detailing how to find the value on each located element.
+        attr_name (str): The name of the attribute containing values, as written in `xpath`. `None` when values are element text.
+        el_name (str): The name of the element containing values. `None` when values are within an attribute.
+        dispatch_key (tuple): The `(tag, attr_key)` that values are located at, for use in a single pass over a tree. `None` when the path is too complex to be matched element-by-element.
+
+    """
+
+    _SIMPLE_EL_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_.-]*$')
+    """A regular expression matching a step in a path that selects child elements by an unprefixed name alone."""
+
+    def __init__(self, codelist_name, xpath, condition=None):
+        """Initialise a Codelist Mapping entry.
+
+        Args:
+            codelist_name (str): The name of the Codelist that the mapping is for.
+            xpath (str): An XPath expression stating where values on the Codelist are located. Must end by selecting either an attribute or `text()`.
+            condition (str): An optional XPath expression to limit the scope of the mapping.
+
+        Raises:
+            etree.XPathSyntaxError: When the path or condition is not a valid XPath expression.
+
+        """
+        self.codelist_name = codelist_name
+        self.xpath = xpath
+        self.condition = condition
+        self.parent_el_xpath, self.last_xpath_section = xpath.rsplit('/', 1)
+        self.attr_name = None
+        self.el_name = None
+        self._attr_key = None
+        self._locator = None
+        self._el_path = None
+        self.dispatch_key = None
+
+        if self.last_xpath_section.startswith('@'):
+            self.attr_name = self.last_xpath_section[1:]
+            self._compile_attrib_locator()
+        elif self.last_xpath_section == 'text()':
+            _, self.el_name = self.parent_el_xpath.rsplit('/', 1)
+            self._compile_element_text_locator()
+
+        self.condition_xpath = None if condition is None else etree.XPath(condition)
+
+        if self._el_path is not None:
+            self.dispatch_key = (self._el_path[-1] if self._el_path else None, self._attr_key)
+
+    def __reduce__(self):
+        """Reduce the mapping to the arguments it was initialised with, for copying and pickling.
+
+        Compiled XPath expressions cannot be pickled, so are compiled again when the mapping is restored.
+
+        """
+        return (type(self), (self.codelist_name, self.xpath, self.condition))
+
+    def _compile_attrib_locator(self):
+        """Compile the XPath expression to locate elements with the attribute of interest."""
+        if self.condition is None:
+            parent_el_xpath = self.parent_el_xpath + '[@' + self.attr_name + ']'
+        else:
+            parent_el_xpath = self.parent_el_xpath + '[' + self.condition + ' and @' + self.attr_name + ']'
+
+        # some nasty string manipulation to make the `//@xml:lang` mapping work
+        while not parent_el_xpath.startswith('//'):
+            parent_el_xpath = '/' + parent_el_xpath
+        if parent_el_xpath.startswith('//['):
+            parent_el_xpath = '//*[' + parent_el_xpath[3:]
+
+        # provide a secondary cludge to deal with the 'xml' namespace
+        if self.attr_name == 'xml:lang':
+            self._attr_key = '{http://www.w3.org/XML/1998/namespace}lang'
+        else:
+            self._attr_key = self.attr_name
+
+        self._locator = etree.XPath(parent_el_xpath)
+        self._el_path = self._split_el_path(self.parent_el_xpath.lstrip('/'))
+
+    def _compile_element_text_locator(self):
+        """Compile the XPath expression to locate elements with the text of interest."""
+        parent_el_xpath = self.parent_el_xpath
+        if self.condition:
+            parent_el_xpath = parent_el_xpath + '[' + self.condition + ']'
+
+        self._locator = etree.XPath(parent_el_xpath)
+
+        # a numeric condition would be positional within a predicate, so conditional text mappings are left to XPath
+        if self.parent_el_xpath.startswith('//') and self.condition is None:
+            self._el_path = self._split_el_path(self.parent_el_xpath[2:])
+
+    def _split_el_path(self, relative_el_xpath):
+        """Split a path relative to `//` into the element names that must be passed through, outermost first.
+
+        Args:
+            relative_el_xpath (str): The path to split. An empty string matches any element.
+
+        Returns:
+            tuple of str: The element names within the path. `None` if the path contains anything other than child steps selecting elements by name.
+
+        """
+        if relative_el_xpath == '':
+            return ()
+
+        el_path = tuple(relative_el_xpath.split('/'))
+        if all(self._SIMPLE_EL_NAME.match(el_name) for el_name in el_path):
+            return el_path
+
+        return None
+
+    def matches(self, element):
+        """Determine whether values at the mapped location may be found on a given element.
+
+        Args:
+            element (etree._Element): An element with the tag and attribute given by `dispatch_key`.
+
+        Returns:
+            bool: Whether the element is within the mapped path and meets any condition.
+
+        Raises:
+            ValueError: When the mapping is not able to be matched element-by-element.
+
+        """
+        if self._el_path is None:
+            raise ValueError('mapping path is too complex to match element-by-element')
+
+        ancestor = element.getparent()
+        for el_name in reversed(self._el_path[:-1]):
+            if ancestor is None or ancestor.tag != el_name:
+                return False
+            ancestor = ancestor.getparent()
+
+        if self.condition_xpath is None:
+            return True
+
+        return _xpath_boolean(self.condition_xpath(element))
+
+    def extract_codes(self, tree):
+        """Extract the values at the mapped location from a tree.
+
+        Args:
+            tree (etree._ElementTree): The tree to extract values from.
+
+        Returns:
+            list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the tree; The `int` is the sourceline at which the parent element is located.
+
+        Raises:
+            ValueError: When the mapped path is not looking for an attribute value or element text.
+
+        """
+        if self._locator is None:
+            raise ValueError('mapping path does not locate attribute value or element text')
+
+        if self.attr_name is not None:
+            return [(parent.attrib[self._attr_key], parent.sourceline) for parent in self._locator(tree)]
+
+        return [(parent.text, parent.sourceline) for parent in self._locator(tree)]
+
+
+def _xpath_boolean(value):
+    """Convert the result of evaluating an XPath expression to a boolean, as per the XPath `boolean()` function.
+
+    Args:
+        value: The result of evaluating an XPath expression.
+
+    Returns:
+        bool: The boolean value of the result.
+
+    """
+    if isinstance(value, float):
+        return value != 0 and value == value  # NaN is false
+
+    return bool(value)
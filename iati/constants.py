@@ -29,3 +29,5 @@ NAMESPACE = '{http://www.w3.org/2001/XMLSchema}'
 """The namespace that IATI Schema XSD files are specified within."""
 NSMAP = {'xsd': 'http://www.w3.org/2001/XMLSchema'}
 """A dictionary for interpreting namespaces in IATI Schemas."""
+RECORD_TAGS = {'iati-activities': 'iati-activity', 'iati-organisations': 'iati-organisation'}
+"""The elements that each IATI XML file contains a number of, keyed by the tag of the root element that contains them."""
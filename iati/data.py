@@ -1,4 +1,5 @@
 """A module containing a core representation of an IATI Dataset."""
+from array import array
 from lxml import etree
 import iati.exceptions
 import iati.utilities
@@ -55,6 +56,8 @@ class Dataset:
         """
         self._xml_str = None
         self._xml_tree = None
+        self._line_offsets = None
+        self._parse_error_log = None
 
         if isinstance(xml, (etree._Element, etree._ElementTree)):  # pylint: disable=W0212
             self.xml_tree = xml
@@ -87,17 +90,18 @@ class Dataset:
             try:
                 value_stripped = value.strip()
 
-                validation_error_log = iati.validator.validate_is_xml(value_stripped)
-
-                # Convert the input to bytes, as etree.fromstring works most consistently with bytes objects, especially if an XML encoding declaration has been used.
-                if isinstance(value_stripped, str):
-                    value_stripped_bytes = value_stripped.encode()
-                elif isinstance(value_stripped, bytes):
-                    value_stripped_bytes = value_stripped
+                # parse the value once, keeping both the tree and any problems found while parsing
+                tree, validation_error_log = iati.validator._parse_xml(value_stripped)  # pylint: disable=protected-access
 
                 if not validation_error_log.contains_errors():
-                    self.xml_tree = etree.fromstring(value_stripped_bytes)
+                    if tree is None:
+                        raise TypeError
+
+                    # set the underlying values directly, since the `xml_tree` setter would serialise the tree to create a new `xml_str`
+                    self._xml_tree = tree
                     self._xml_str = value_stripped
+                    self._line_offsets = None
+                    self._parse_error_log = validation_error_log
                 else:
                     if validation_error_log.contains_error_of_type(TypeError):
                         raise TypeError
@@ -126,6 +130,9 @@ class Dataset:
 
     @xml_tree.setter
     def xml_tree(self, value):
+        self._line_offsets = None
+        self._parse_error_log = iati.validator.ValidationErrorLog()
+
         if isinstance(value, etree._Element):  # pylint: disable=W0212
             self._xml_tree = value
             self._xml_str = etree.tostring(value, pretty_print=True)
@@ -138,6 +145,18 @@ class Dataset:
             iati.utilities.log_error(msg)
             raise TypeError(msg)
 
+    @property
+    def parse_error_log(self):
+        """iati.validator.ValidationErrorLog: The problems found when the XML of the Dataset was parsed.
+
+        This is populated when content is assigned to the Dataset, so that the XML does not need to be parsed again to determine whether it is well-formed.
+
+        Note:
+            Content that is not well-formed XML cannot be assigned to a Dataset. As such, this will not contain errors, though may contain warnings.
+
+        """
+        return self._parse_error_log
+
     def _raw_source_at_line(self, line_number):
         """Return the raw value of the XML source at the specified line.
 
@@ -158,13 +177,65 @@ class Dataset:
         if line_number < 0:
             raise ValueError
 
-        try:
-            # this is led with an empty string since the `sourceline` attribute is 1-indexed.
-            split_lines = [''] + self.xml_str.split('\n')
-            return split_lines[line_number]
-        except IndexError:
+        # line 0 is an empty string since the `sourceline` attribute is 1-indexed.
+        if line_number == 0:
+            return ''
+
+        if line_number > len(self._source_line_offsets()):
             raise ValueError
 
+        return self._raw_source_between_lines(line_number, line_number)
+
+    def _raw_source_between_lines(self, first_line_number, last_line_number):
+        """Return the raw value of the XML source from the start of one line to the end of another.
+
+        Args:
+            first_line_number (int): A one-indexed line number for the first line to return.
+            last_line_number (int): A one-indexed line number for the last line to return. Must not be before `first_line_number`.
+
+        Returns:
+            str: The source of the XML between the specified lines, inclusive. Lines are separated by newline characters.
+
+        Note:
+            The source is sliced directly from `xml_str`, so the cost does not depend on the size of the Dataset.
+
+        """
+        line_offsets = self._source_line_offsets()
+        start = line_offsets[first_line_number - 1]
+        if last_line_number < len(line_offsets):
+            end = line_offsets[last_line_number] - 1
+        else:
+            end = len(self.xml_str)
+
+        source = self.xml_str[start:end]
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+
+        return source
+
+    def _source_line_offsets(self):
+        """Return the offsets within the XML source at which each line starts.
+
+        The offsets are calculated the first time that they are required. They are then cached until new content is assigned to either `xml_str` or `xml_tree`.
+
+        Returns:
+            array.array: The offset at which each line starts. The first line is at index 0.
+
+        """
+        if self._line_offsets is None:
+            xml_str = self.xml_str
+            newline = '\n' if isinstance(xml_str, str) else b'\n'
+
+            line_offsets = array('Q', [0])
+            newline_position = xml_str.find(newline)
+            while newline_position != -1:
+                line_offsets.append(newline_position + 1)
+                newline_position = xml_str.find(newline, newline_position + 1)
+
+            self._line_offsets = line_offsets
+
+        return self._line_offsets
+
     @property
     def version(self):
         """Return the version of the Standard that this Dataset is specified against.
@@ -240,17 +311,19 @@ class Dataset:
             Test with minified XML.
 
         """
+        if not isinstance(line_number, int):
+            raise TypeError
+
         if not isinstance(surrounding_lines, int) or isinstance(surrounding_lines, bool):
             raise TypeError
 
         if surrounding_lines < 0:
             raise ValueError
 
-        lines_arr = []
         lower_line_number = max(line_number - surrounding_lines, 1)
-        upper_line_number = min(line_number + surrounding_lines + 1, len(self.xml_str.split('\n')) + 1)
+        upper_line_number = min(line_number + surrounding_lines, len(self._source_line_offsets()))
 
-        for line_num in range(lower_line_number, upper_line_number):
-            lines_arr.append(self._raw_source_at_line(line_num))
+        if lower_line_number > upper_line_number:
+            return ''
 
-        return '\n'.join(lines_arr)
+        return self._raw_source_between_lines(lower_line_number, upper_line_number)
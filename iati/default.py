@@ -8,11 +8,46 @@ Todo:
 """
 import json
 import os
+import threading
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 import iati.codelists
 import iati.constants
 import iati.resources
+import iati.snapshot
+
+
+_SNAPSHOT = None
+"""A cache of the contents of the snapshot of the Standard.
+
+This is a dictionary in the format returned by `iati.snapshot.load()`. It is empty when there is no snapshot present, and `None` before the snapshot has been looked for.
+
+"""
+
+_SNAPSHOT_LOCK = threading.Lock()
+"""A lock to prevent the snapshot being loaded multiple times by concurrent threads."""
+
+
+def _snapshot_version(version):
+    """Return the contents of the snapshot of the Standard for the specified version.
+
+    The snapshot is looked for and loaded the first time that this is called.
+
+    Args:
+        version (iati.Version): The Decimal version of the Standard to return snapshot content for.
+
+    Returns:
+        dict or None: The snapshot content for the specified version, in the format produced by `iati.snapshot.build()`. `None` if there is no snapshot present, or it does not contain the version.
+
+    """
+    global _SNAPSHOT  # pylint: disable=global-statement
+
+    if _SNAPSHOT is None:
+        with _SNAPSHOT_LOCK:
+            if _SNAPSHOT is None:
+                _SNAPSHOT = iati.snapshot.load() or dict()
+
+    return _SNAPSHOT.get(str(version))
 
 
 _CODELISTS = defaultdict(dict)
@@ -34,8 +69,8 @@ The dictionary is structured as:
     [...]
 }
 
-Warning:
-    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, it is highly recommended to perform a `deepcopy()` on any accessed Codelist before it is modified in any way.
+Note:
+    The cached Codelists are frozen. A `copy()` of an accessed Codelist shares its Codes until modified, so should be taken before it is modified in any way.
 
 """
 
@@ -54,6 +89,9 @@ def codelist(name, version):
     Returns:
         iati.Codelist: A Codelist with the specified name from the specified version of the Standard. It is populated with all the Codes on the Codelist.
 
+    Note:
+        The Codes are shared with the cached Codelist until the returned Codelist is modified, at which point it takes a private copy of them. Until then, the Codes are frozen, so cannot be modified.
+
     Warning:
         A name may not be sufficient to act as a UID.
 
@@ -67,7 +105,7 @@ def codelist(name, version):
     """
     try:
         codelist_found = _codelists(version, True)[name]
-        return deepcopy(codelist_found)
+        return copy(codelist_found)
     except (KeyError, TypeError):
         msg = "There is no default Codelist in version {0} of the Standard with the name {1}.".format(version, name)
         iati.utilities.log_warning(msg)
@@ -82,35 +120,68 @@ def _codelists(version, use_cache=False):
 
     Args:
         version (str / Decimal / iati.Version): The Integer or Decimal version of the Standard to return the Codelists for. If an Integer Version is specified, uses the most recent Decimal Version within the Integer Version.
-        use_cache (bool): Whether the cache should be used rather than loading the Codelists from disk again. If used, a `deepcopy()` should be performed on any returned Codelist before it is modified.
+        use_cache (bool): Whether the cache should be used rather than loading the Codelists from disk again.
 
     Raises:
         ValueError: When a specified version is not a valid version of the IATI Standard.
 
     Returns:
-        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.Codelist() instances.
+        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are frozen iati.Codelist() instances.
 
     Warning:
-        Setting `use_cache` to `True` is dangerous since it does not return a deep copy of the Codelists. This means that modification of a returned Codelist will modify the Codelist everywhere.
-        A `deepcopy()` should be performed on any returned value before it is modified.
+        The returned dictionary is the cache itself. It should not be modified. A `copy()` should be performed on any returned Codelist that is to be modified.
 
     Note:
-        This is a private function so as to prevent the (dangerous) `use_cache` parameter being part of the public API.
+        This is a private function so as to prevent the `use_cache` parameter and the shared cache being part of the public API.
+
+        When the cache is used and a snapshot of the Standard is present, Codelists are taken from the snapshot rather than loaded from disk.
 
     """
+    if use_cache and not _CODELISTS[version]:
+        snapshot_data = _snapshot_version(version)
+        if snapshot_data is not None:
+            _CODELISTS[version].update(snapshot_data['codelists'])
+
     paths = iati.resources.get_codelist_paths(version)
 
     for path in paths:
-        _, filename = os.path.split(path)
-        name = filename[:-len(iati.resources.FILE_CODELIST_EXTENSION)]  # Get the name of the codelist, without the '.xml' file extension
+        name = _codelist_name(path)
         if (name not in _CODELISTS[version].keys()) or not use_cache:
-            xml_str = iati.utilities.load_as_string(path)
-            codelist_found = iati.Codelist(name, xml=xml_str)
-            _CODELISTS[version][name] = codelist_found
+            _CODELISTS[version][name] = _load_codelist(path)
 
     return _CODELISTS[version]
 
 
+def _codelist_name(path):
+    """Return the name of the Codelist at the specified path.
+
+    Args:
+        path (str): The path to a Codelist file.
+
+    Returns:
+        str: The name of the Codelist, without the file extension.
+
+    """
+    _, filename = os.path.split(path)
+
+    return filename[:-len(iati.resources.FILE_CODELIST_EXTENSION)]
+
+
+def _load_codelist(path):
+    """Load the Codelist at the specified path from disk.
+
+    Args:
+        path (str): The path to a Codelist file.
+
+    Returns:
+        iati.Codelist: The Codelist at the specified path. It is frozen.
+
+    """
+    xml_str = iati.utilities.load_as_string(path)
+
+    return iati.Codelist(_codelist_name(path), xml=xml_str).freeze()
+
+
 def codelists(version):
     """Return the default Codelists for the specified version of the Standard.
 
@@ -123,8 +194,27 @@ def codelists(version):
     Returns:
         dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.Codelist() instances, populated with the relevant Codes.
 
+    Note:
+        The Codelists are loaded from disk the first time that they are requested for a version. Each call returns copies of the cached Codelists, which share their Codes with the cache until they are modified.
+
     """
-    return _codelists(version)
+    return {name: copy(codelist_found) for name, codelist_found in _codelists(version, True).items()}
+
+
+_CODELIST_MAPPINGS = dict()
+"""A cache of loaded Codelist Mappings.
+
+This removes the need to repeatedly load and parse a Codelist Mapping file from disk each time it is accessed.
+
+The dictionary is structured as:
+
+{
+    "version_number_a": iati.codelists.CodelistMapping(mapping_file_a),
+    "version_number_b": iati.codelists.CodelistMapping(mapping_file_b),
+    [...]
+}
+
+"""
 
 
 @iati.version.decimalise_integer
@@ -142,29 +232,115 @@ def codelist_mapping(version):
     Returns:
         dict of dict: A dictionary containing mapping information. Keys in the first dictionary are Codelist names. Keys in the second dictionary are `xpath` and `condition`. The condition is `None` if there is no condition.
 
-    Todo:
-        Make use of the `version` parameter.
+    """
+    return _codelist_mapping(version).as_dict()
+
+
+@iati.version.decimalise_integer
+@iati.version.normalise_decimals
+@iati.version.allow_fully_supported_version
+def _codelist_mapping(version):
+    """Return the cached Codelist Mapping for the specified version of the Standard.
+
+    The mapping file is loaded from disk and parsed the first time that it is requested for a version. The same instance is returned by subsequent calls.
+
+    Args:
+        version (str / Decimal / iati.Version): The Integer or Decimal version of the Standard to return the Codelist Mapping for. If an Integer Version is specified, uses the most recent Decimal Version within the Integer Version.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+
+    Returns:
+        iati.codelists.CodelistMapping: The Codelist Mapping for the specified version of the Standard, with XPath expressions compiled.
+
+    Warning:
+        The returned value is shared. It should not be modified.
+
+    """
+    if version not in _CODELIST_MAPPINGS:
+        snapshot_data = _snapshot_version(version)
+        if snapshot_data is not None:
+            _CODELIST_MAPPINGS[version] = snapshot_data['codelist_mapping']
+        else:
+            _CODELIST_MAPPINGS[version] = _load_codelist_mapping(version)
+
+    return _CODELIST_MAPPINGS[version]
+
+
+def _load_codelist_mapping(version):
+    """Load the Codelist Mapping for the specified version of the Standard from disk.
+
+    Args:
+        version (iati.Version): The Decimal version of the Standard to load the Codelist Mapping for.
+
+    Returns:
+        iati.codelists.CodelistMapping: The Codelist Mapping for the specified version of the Standard.
 
     """
     path = iati.resources.create_codelist_mapping_path(version)
-    mapping_tree = iati.utilities.load_as_tree(path)
-    mappings = defaultdict(list)
 
-    for mapping in mapping_tree.getroot().xpath('//mapping'):
-        codelist_name = mapping.find('codelist').attrib['ref']
-        codelist_location = mapping.find('path').text
+    return iati.codelists.CodelistMapping(iati.utilities.load_as_tree(path))
+
 
-        try:
-            condition = mapping.find('condition').text
-        except AttributeError:  # there is no condition
-            condition = None
+_RULESETS = dict()
+"""A cache of loaded Standard Rulesets.
 
-        mappings[codelist_name].append({
-            'xpath': codelist_location,
-            'condition': condition
-        })
+This removes the need to repeatedly load and parse a Ruleset file from disk each time it is accessed.
 
-    return mappings
+The dictionary is structured as:
+
+{
+    "version_number_a": iati.Ruleset(ruleset_file_a),
+    "version_number_b": iati.Ruleset(ruleset_file_b),
+    [...]
+}
+
+Warning:
+    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, a `copy()` should be performed on any accessed Ruleset before it is modified in any way.
+
+"""
+
+_RULESETS_LOCK = threading.Lock()
+"""A lock held while a Ruleset is loaded for the cache, so that concurrent first requests for a Ruleset do not each load it."""
+
+
+@iati.version.decimalise_integer
+@iati.version.normalise_decimals
+@iati.version.allow_fully_supported_version
+def _ruleset(version):
+    """Return the cached Standard Ruleset for the specified version of the Standard.
+
+    The Ruleset is loaded the first time that it is requested for a version. The same instance is returned by subsequent calls.
+
+    Args:
+        version (str / Decimal / iati.Version): The Integer or Decimal version of the Standard to return the Standard Ruleset for. If an Integer Version is specified, uses the most recent Decimal Version within the Integer Version.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+
+    Returns:
+        iati.Ruleset: The default Ruleset for the specified version of the Standard.
+
+    Warning:
+        The returned value is shared. It should not be modified.
+
+    Note:
+        When a snapshot of the Standard is present, the Ruleset is restored from the snapshot rather than loaded from disk.
+
+    """
+    cached_ruleset = _RULESETS.get(version)
+    if cached_ruleset is None:
+        with _RULESETS_LOCK:
+            cached_ruleset = _RULESETS.get(version)
+            if cached_ruleset is None:
+                snapshot_data = _snapshot_version(version)
+                if snapshot_data is not None:
+                    cached_ruleset = iati.snapshot.restore(snapshot_data['ruleset'])
+                else:
+                    cached_ruleset = _load_ruleset(version)
+                _RULESETS[version] = cached_ruleset
+
+    return cached_ruleset
 
 
 @iati.version.decimalise_integer
@@ -180,7 +356,23 @@ def ruleset(version):
         ValueError: When a specified version is not a valid version of the IATI Standard.
 
     Returns:
-        iati.Ruleset: The default Ruleset for the specified version of the Standard.
+        iati.Ruleset: The default Ruleset for the specified version of the Standard. This is a copy of the cached Ruleset, so Rules may be added to or removed from it without affecting the cache.
+
+    Note:
+        The Ruleset is loaded the first time that it is requested for a version. When a snapshot of the Standard is present, it is restored from the snapshot rather than loaded from disk.
+
+    """
+    return copy(_ruleset(version))
+
+
+def _load_ruleset(version):
+    """Load the Standard Ruleset for the specified version of the Standard from disk.
+
+    Args:
+        version (iati.Version): The Decimal version of the Standard to load the Standard Ruleset for.
+
+    Returns:
+        iati.Ruleset: The Standard Ruleset for the specified version of the Standard.
 
     """
     path = iati.resources.get_ruleset_paths(version)[0]
@@ -189,6 +381,14 @@ def ruleset(version):
     return iati.Ruleset(ruleset_str)
 
 
+_RULESET_SCHEMA = None
+"""A cache of the loaded Ruleset schema.
+
+This removes the need to repeatedly load the Ruleset schema from disk each time that a Ruleset or Rule is created.
+
+"""
+
+
 def ruleset_schema():
     """Return the Ruleset schema for the specified version of the Standard.
 
@@ -202,10 +402,27 @@ def ruleset_schema():
         Determine whether a version should be provided. This is worth considering if the content of the IATI Ruleset Schema varies between versions.
 
     """
-    path = iati.resources.create_ruleset_path(iati.resources.FILE_RULESET_SCHEMA_NAME, iati.version.STANDARD_VERSION_ANY)
-    schema_str = iati.utilities.load_as_string(path)
+    return deepcopy(_ruleset_schema())
+
+
+def _ruleset_schema():
+    """Return the cached Ruleset schema, loading it from disk the first time that it is required.
 
-    return json.loads(schema_str)
+    Returns:
+        dict: A dictionary representing the Ruleset schema.
+
+    Warning:
+        The returned dictionary is shared by all callers, so must not be modified. Use `ruleset_schema()` to obtain a copy that may be modified.
+
+    """
+    global _RULESET_SCHEMA  # pylint: disable=global-statement
+
+    if _RULESET_SCHEMA is None:
+        path = iati.resources.create_ruleset_path(iati.resources.FILE_RULESET_SCHEMA_NAME, iati.version.STANDARD_VERSION_ANY)
+        schema_str = iati.utilities.load_as_string(path)
+        _RULESET_SCHEMA = json.loads(schema_str)
+
+    return _RULESET_SCHEMA
 
 
 _SCHEMAS = defaultdict(lambda: defaultdict(dict))
@@ -231,10 +448,13 @@ This removes the need to repeatedly load a Schema from disk each time it is acce
 }
 
 Warning:
-    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, it is highly recommended to perform a `deepcopy()` on any accessed Schema before it is modified in any way.
+    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, a `copy()` should be performed on any accessed Schema before it is modified in any way.
 
 """
 
+_SCHEMAS_LOCK = threading.Lock()
+"""A lock held while a Schema is built for the cache, so that concurrent first requests for a Schema do not each build it."""
+
 
 def _populate_schema(schema, version):
     """Populate a Schema with all its extras.
@@ -252,11 +472,13 @@ def _populate_schema(schema, version):
         Does not create a copy of the provided Schema, instead adding to it directly.
 
     """
-    codelists_to_add = codelists(version)
+    # the cached Codelists are frozen, so are safe to share between Schemas
+    codelists_to_add = _codelists(version, True)
     for codelist_to_add in codelists_to_add.values():
         schema.codelists.add(codelist_to_add)
 
-    schema.rulesets.add(ruleset(version))
+    # the cached Ruleset is shared, so that each Schema refers to the same instance
+    schema.rulesets.add(_ruleset(version))
 
     return schema
 
@@ -269,26 +491,32 @@ def _schema(path_func, schema_class, version, populate=True, use_cache=False):
         schema_class (type): A class definition for the Schema of interest.
         version (iati.Version): The Decimal version of the Standard to return the Schema for.
         populate (bool): Whether the Schema should be populated with auxilliary information such as Codelists and Rulesets.
-        use_cache (bool): Whether the cache should be used rather than loading the Schema from disk again. If used, a `deepcopy()` should be performed on any returned Schema before it is modified.
+        use_cache (bool): Whether the cache should be used rather than loading the Schema from disk again.
 
     Raises:
         ValueError: When a specified version is not a valid version of the IATI Standard.
 
     Returns:
-        iati.Schema: An instantiated IATI Schema for the specified version.
+        iati.Schema: An instantiated IATI Schema for the specified version. This is a copy of the cached Schema, so Codelists and Rulesets may be added to or removed from it without affecting the cache.
+
+    Note:
+        The Schema is built under a lock, so that it is built once when first requested by a number of threads at the same time.
 
     """
     population_key = 'populated' if populate else 'unpopulated'
+    cached_schemas = _SCHEMAS[version][population_key]
 
-    schema_paths = path_func(version)
-
-    if (schema_class.ROOT_ELEMENT_NAME not in _SCHEMAS[version][population_key].keys()) or not use_cache:
-        schema = schema_class(schema_paths[0])
-        if populate:
-            schema = _populate_schema(schema, version)
-        _SCHEMAS[version][population_key][schema_class.ROOT_ELEMENT_NAME] = schema
+    schema = cached_schemas.get(schema_class.ROOT_ELEMENT_NAME) if use_cache else None
+    if schema is None:
+        with _SCHEMAS_LOCK:
+            schema = cached_schemas.get(schema_class.ROOT_ELEMENT_NAME) if use_cache else None
+            if schema is None:
+                schema = schema_class(path_func(version)[0])
+                if populate:
+                    schema = _populate_schema(schema, version)
+                cached_schemas[schema_class.ROOT_ELEMENT_NAME] = schema
 
-    return _SCHEMAS[version][population_key][schema_class.ROOT_ELEMENT_NAME]
+    return copy(schema)
 
 
 @iati.version.decimalise_integer
@@ -307,8 +535,11 @@ def activity_schema(version, populate=True):
     Returns:
         iati.ActivitySchema: An instantiated IATI Schema for the specified version of the Standard.
 
+    Note:
+        The Schema is loaded and populated the first time that it is requested for a version. Each call returns a copy of the cached Schema, which shares its base tree, compiled validator and Codelists with the cache.
+
     """
-    return _schema(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version, populate)
+    return _schema(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version, populate, use_cache=True)
 
 
 @iati.version.decimalise_integer
@@ -327,5 +558,52 @@ def organisation_schema(version, populate=True):
     Returns:
         iati.OrganisationSchema: An instantiated IATI Schema for the specified version of the Standard.
 
+    Note:
+        The Schema is loaded and populated the first time that it is requested for a version. Each call returns a copy of the cached Schema, which shares its base tree, compiled validator and Codelists with the cache.
+
+    """
+    return _schema(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version, populate, use_cache=True)
+
+
+def warmup(versions=None):
+    """Load the default data for the specified versions of the Standard into memory.
+
+    This includes the Codelists, Codelist Mappings, Schemas and Rulesets at each version. Later requests for this data are served from the caches rather than loaded from disk.
+
+    Args:
+        versions (iterable of str / Decimal / iati.Version): The versions of the Standard to load default data for. If an Integer Version is specified, uses the most recent Decimal Version within it. Default is all fully supported versions.
+
+    Raises:
+        ValueError: When a specified version is not a fully supported version of the IATI Standard.
+
+    Note:
+        When called before worker processes are forked, the loaded data is shared between the workers rather than loaded by each of them.
+
     """
-    return _schema(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version, populate)
+    if versions is None:
+        versions = iati.version.STANDARD_VERSIONS_SUPPORTED
+
+    for version in versions:
+        _warmup_version(version)
+
+
+@iati.version.decimalise_integer
+@iati.version.normalise_decimals
+@iati.version.allow_fully_supported_version
+def _warmup_version(version):
+    """Load the default data for the specified version of the Standard into memory.
+
+    Args:
+        version (str / Decimal / iati.Version): The Integer or Decimal version of the Standard to load default data for. If an Integer Version is specified, uses the most recent Decimal Version within the Integer Version.
+
+    Raises:
+        ValueError: When a specified version is not a fully supported version of the IATI Standard.
+
+    """
+    _codelists(version, True)
+    _codelist_mapping(version)
+    _ruleset(version)
+
+    for path_func, schema_class in [(iati.resources.get_activity_schema_paths, iati.ActivitySchema), (iati.resources.get_organisation_schema_paths, iati.OrganisationSchema)]:
+        for populate in [True, False]:
+            _schema(path_func, schema_class, version, populate, use_cache=True)
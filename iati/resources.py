@@ -11,17 +11,20 @@ Todo:
     Determine how to distribute SSOT content - with package, or separately (being downloaded at runtime).
 
 """
-import inspect
 import os
 import re
-import pkg_resources
+import threading
+import types
 import iati.version
 
 
 PACKAGE = __name__
-"""The name of the resources package.
+"""The name of the resources package."""
 
-Used to locate resources when the package is distributed in certain ways that do not provide a standard filesystem.
+PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
+"""The filesystem location of the folder containing the resources package.
+
+Resource paths are resolved relative to this location. `pkg_resources` is not used to locate resources since it is slow to import.
 
 """
 
@@ -59,6 +62,23 @@ FILE_SCHEMA_ACTIVITY_NAME = 'iati-activities-schema'
 """The name of a file containing an Activity Schema."""
 FILE_SCHEMA_ORGANISATION_NAME = 'iati-organisations-schema'
 """The name of a file containing an Organisation Schema."""
+FILE_SNAPSHOT_NAME = 'standard_snapshot.pickle'
+"""The name of a file containing a snapshot of the parsed content of the IATI Standard."""
+
+_PERMITTED_PATH_COMPONENT_REGEX = re.compile('^[_.A-Za-z0-9][-_.A-Za-z0-9]*$')
+"""A compiled regex that matches a single component of a portable filepath."""
+
+_RESOURCE_INDEX = None
+"""A cache of the resource files that make up the IATI Standard.
+
+This is a read-only mapping from `(version folder name, resource folder)` tuples to read-only mappings from file names to absolute paths.
+
+The resource folder is an empty string for files directly within the version folder, such as the Codelist Mapping file. It is populated the first time that a resource path is checked and is shared between all threads.
+
+"""
+
+_RESOURCE_INDEX_LOCK = threading.Lock()
+"""A lock to prevent the resource index being built multiple times by concurrent threads."""
 
 
 @iati.version.decimalise_integer
@@ -88,19 +108,12 @@ def get_codelist_paths(version):
         Look to provide an argument that allows the returned list to be restricted to only Embedded or only Non-Embedded Codelists (or both!).
 
     """
-    paths = []
-
     try:
-        folder_path = path_for_version(PATH_CODELISTS, version)
+        files = _resource_index().get((folder_name_for_version(version), PATH_CODELISTS), dict())
     except ValueError:
-        folder_path = ''
+        files = dict()
 
-    if os.path.isdir(folder_path):
-        files = pkg_resources.resource_listdir(PACKAGE, folder_path[len(resource_filesystem_path('')):])
-        files_codelists_only = [file_name for file_name in files if file_name[-4:] == FILE_CODELIST_EXTENSION]
-        paths = [create_codelist_path(file_name, version) for file_name in files_codelists_only]
-
-    return paths
+    return [path for file_name, path in files.items() if file_name[-4:] == FILE_CODELIST_EXTENSION]
 
 
 def get_codelist_mapping_paths(version):
@@ -117,7 +130,7 @@ def get_codelist_mapping_paths(version):
         list(str): A list of paths to all of the Codelist Mapping files at the specified version of the Standard.
 
     """
-    return _get_paths(version, '', create_codelist_mapping_path, iati.version.STANDARD_VERSIONS_SUPPORTED)
+    return _get_paths(version, '', FILE_CODELIST_MAPPING + FILE_CODELIST_EXTENSION, iati.version.STANDARD_VERSIONS_SUPPORTED)
 
 
 def get_ruleset_paths(version):
@@ -137,7 +150,7 @@ def get_ruleset_paths(version):
         Consider adding is_minor() and is_major() functions in the version module.
 
     """
-    return _get_paths(version, FILE_RULESET_STANDARD_NAME, create_ruleset_path, iati.version.STANDARD_VERSIONS_SUPPORTED)
+    return _get_paths(version, PATH_RULESETS, FILE_RULESET_STANDARD_NAME + FILE_RULESET_EXTENSION, iati.version.STANDARD_VERSIONS_SUPPORTED)
 
 
 def get_all_schema_paths(version):
@@ -176,7 +189,7 @@ def get_activity_schema_paths(version):
         list(str): A list of paths to all of the Activity Schemas at the specified version of the Standard.
 
     """
-    return _get_paths(version, FILE_SCHEMA_ACTIVITY_NAME, create_schema_path, iati.version.STANDARD_VERSIONS)
+    return _get_paths(version, PATH_SCHEMAS, FILE_SCHEMA_ACTIVITY_NAME + FILE_SCHEMA_EXTENSION, iati.version.STANDARD_VERSIONS)
 
 
 def get_organisation_schema_paths(version):  # pylint: disable=invalid-name
@@ -193,17 +206,17 @@ def get_organisation_schema_paths(version):  # pylint: disable=invalid-name
         list(str): A list of paths to all of the Organisation Schemas at the specified version of the Standard.
 
     """
-    return _get_paths(version, FILE_SCHEMA_ORGANISATION_NAME, create_schema_path, iati.version.STANDARD_VERSIONS)
+    return _get_paths(version, PATH_SCHEMAS, FILE_SCHEMA_ORGANISATION_NAME + FILE_SCHEMA_EXTENSION, iati.version.STANDARD_VERSIONS)
 
 
 @iati.version.allow_possible_version
-def _get_paths(version, file_name, path_creation_func, supported_versions):
+def _get_paths(version, resource_folder, file_name, supported_versions):
     """Find the paths for a component within the IATI Standard at a specified version of the Standard.
 
     Args:
         version (str / int / Decimal / iati.Version): The version of the Standard to return the paths for.
-        file_name (str): The name of the file containing the thing of interest.
-        path_creation_func (func): A function that takes a file_name and version, then returns a path.
+        resource_folder (str): The folder within each version folder that contains the thing of interest. An empty string for files directly within the version folder.
+        file_name (str): The name of the file containing the thing of interest, including its extension.
         supported_versions (list of iati.Version): A list of minor versions that paths pointing at the thing of interest may exist for.
 
     Raises:
@@ -213,6 +226,9 @@ def _get_paths(version, file_name, path_creation_func, supported_versions):
     Returns:
         list(str): A list of paths to build with the given components at the specified version of the Standard.
 
+    Note:
+        Paths are taken directly from the resource index, so only paths to files that exist are returned.
+
     """
     paths = []
 
@@ -230,23 +246,51 @@ def _get_paths(version, file_name, path_creation_func, supported_versions):
         # major version
         versions = [minor_ver for minor_ver in iati.version.versions_for_integer(int(version)) if minor_ver in supported_versions]
 
-    num_path_creation_func_args = len(inspect.getfullargspec(path_creation_func).args)
-
     for minor_ver in versions:
         try:
-            if num_path_creation_func_args == 2:
-                created_path = path_creation_func(file_name, minor_ver)
-            else:
-                created_path = path_creation_func(minor_ver)
-
-            if os.path.isfile(created_path):
-                paths.append(created_path)
+            path = _resource_index().get((folder_name_for_version(minor_ver), resource_folder), dict()).get(file_name)
         except ValueError:
-            pass  # there is no path to check
+            continue  # there is no path to check
+
+        if path is not None:
+            paths.append(path)
 
     return paths
 
 
+def _resource_index():
+    """Return an index of the resource files that make up the IATI Standard.
+
+    The index is built from the filesystem the first time that it is required.
+
+    Returns:
+        types.MappingProxyType: A read-only mapping in the format described by `_RESOURCE_INDEX`.
+
+    Note:
+        Resource files that are added or removed after the index is built are not detected.
+
+    """
+    global _RESOURCE_INDEX  # pylint: disable=global-statement
+
+    if _RESOURCE_INDEX is None:
+        with _RESOURCE_INDEX_LOCK:
+            if _RESOURCE_INDEX is None:
+                base_path = resource_filesystem_path(BASE_PATH_STANDARD)
+                index = dict()
+
+                for dir_path, _, file_names in os.walk(base_path):
+                    relative_dir_path = os.path.relpath(dir_path, base_path)
+                    if relative_dir_path == os.curdir:
+                        continue
+                    version_folder, _, resource_folder = relative_dir_path.partition(os.path.sep)
+                    files = {file_name: os.path.join(dir_path, file_name) for file_name in file_names}
+                    index[(version_folder, resource_folder)] = types.MappingProxyType(files)
+
+                _RESOURCE_INDEX = types.MappingProxyType(index)
+
+    return _RESOURCE_INDEX
+
+
 def create_codelist_path(codelist_name, version):
     """Determine the path of a Codelist with the given name at the specified version of the Standard.
 
@@ -475,7 +519,7 @@ def resource_filesystem_path(path):
         path (str): The path of the file that is to be located.
 
     Returns:
-        str: A reference to the specified file that works however the package is distributed.
+        str: The filesystem path of the specified file.
 
     Raises:
         TypeError: If the given path is of a type that cannot be a filepath.
@@ -491,7 +535,10 @@ def resource_filesystem_path(path):
         if path != '':
             raise
 
-    return pkg_resources.resource_filename(PACKAGE, path)
+    if path == '':
+        return PACKAGE_PATH
+
+    return os.path.join(PACKAGE_PATH, path)
 
 
 def _ensure_portable_filepath(maybe_filepath):
@@ -525,7 +572,6 @@ def _ensure_portable_filepath(maybe_filepath):
     if len(path_components) > 1 and path_components[-1] == '':
         path_components.pop()
 
-    permitted_component_regex = re.compile('^[_.A-Za-z0-9][-_.A-Za-z0-9]*$')
     for component in path_components:
-        if re.match(permitted_component_regex, component) is None:
+        if _PERMITTED_PATH_COMPONENT_REGEX.match(component) is None:
             raise ValueError('Each component in a permitted filepath must only include the following characters: A-Z a-z 0-9 . _ - (Problem component: {0} Actual path: {1})'.format(component, maybe_filepath))
@@ -0,0 +1,576 @@
+"""A module to compile Rulesets into XSLT stylesheets that are executed by libxslt.
+
+Checking a Dataset against a `CompiledRuleset` gives the same results as `iati.Ruleset.results_for()`, but the XPath expressions and checks for most Rules are evaluated in C over the whole tree, rather than in Python one element at a time.
+
+The line numbers of the elements that cause Rules to fail are also available.
+
+Rules that cannot be expressed exactly in XSLT 1.0 are checked in Python:
+
+* `sum` Rules, since values are summed as decimals rather than floating point numbers.
+* Rules where the context or a path does not evaluate to a node-set, or cannot be evaluated without a Dataset.
+
+Where the stylesheet cannot exactly reproduce the result for a context element, such as a date in a format that is accepted by `datetime.strptime()` but is not a zero-padded YYYY-MM-DD string, that Rule is checked in Python for that Dataset.
+
+Example:
+    To check a Dataset using a compiled version of the Standard Ruleset::
+
+        compiled_ruleset = iati.ruleset_xslt.CompiledRuleset(iati.default.ruleset('2.02'))
+        results = compiled_ruleset.results_for(dataset)
+
+"""
+import collections
+import threading
+from datetime import datetime
+from lxml import etree
+import iati.rulesets
+
+
+XSL_NAMESPACE = 'http://www.w3.org/1999/XSL/Transform'
+"""The namespace of XSLT elements."""
+
+_REGEXP_NAMESPACE = 'http://exslt.org/regular-expressions'
+"""The namespace of the EXSLT regular expression functions. lxml implements these using the Python `re` module."""
+
+_SAXON_NAMESPACE = 'http://icl.com/saxon'
+"""The namespace of the Saxon extension functions, of which libxslt implements `line-number()`."""
+
+_TEXT_VALUE = 'string(self::*/node()[1][self::text()] | self::node()[not(self::*)])'
+"""An XPath expression for the text of the context node, determined in the same way as by `Rule._extract_text_from_element_or_attribute()`."""
+
+_STATUS_FAIL = 'F'
+"""The status of a context element that does not pass a Rule."""
+_STATUS_SKIP = 'N'
+"""The status of a context element that causes a Rule to be skipped."""
+_STATUS_ERROR = 'E'
+"""The status of a context element that causes a Rule to raise a ValueError."""
+_STATUS_DEFER = 'D'
+"""The status of a context element that means the Rule must be checked in Python."""
+_STATUS_EMPTY = 'X'
+"""The status of a Rule where the context locates no elements."""
+
+_COMPILED_RULESETS = collections.OrderedDict()
+"""A cache of compiled Rulesets, ordered from least to most recently used.
+
+Keys are frozensets of the Rules that were compiled. Values are `iati.ruleset_xslt.CompiledRuleset` instances.
+
+The Rulesets themselves are not referenced, so Rulesets containing the same Rules share a compiled version, and a Ruleset is not kept alive by having been compiled.
+
+"""
+
+_COMPILED_RULESETS_MAX_SIZE = 16
+"""The maximum number of compiled Rulesets to cache. The least recently used compiled Ruleset is discarded when another is added."""
+
+_COMPILED_RULESETS_LOCK = threading.Lock()
+"""A lock to prevent concurrent threads modifying the cache of compiled Rulesets."""
+
+
+class CompiledRuleset:
+    """A Ruleset that has been compiled into an XSLT stylesheet.
+
+    Attributes:
+        rules (frozenset of iati.Rule): The Rules that were compiled.
+        stylesheet (etree._ElementTree): The XSLT stylesheet that the Ruleset was compiled into.
+        native_rules (set of iati.Rule): The Rules that are checked by the stylesheet.
+        python_rules (set of iati.Rule): The Rules that are checked in Python.
+
+    Warning:
+        Rules that are added to or removed from the Ruleset after compilation are not reflected in the compiled version.
+
+    """
+
+    def __init__(self, ruleset):
+        """Compile a Ruleset.
+
+        Args:
+            ruleset (iati.Ruleset): The Ruleset to compile.
+
+        """
+        self.rules = frozenset(ruleset.rules)
+        self.native_rules = set()
+        self.python_rules = set()
+        self._native_rules = list()
+
+        stylesheet = etree.Element(_xsl('stylesheet'), version='1.0', nsmap={'xsl': XSL_NAMESPACE, 'regexp': _REGEXP_NAMESPACE, 'saxon': _SAXON_NAMESPACE})
+        stylesheet.set('exclude-result-prefixes', 'regexp saxon')
+        etree.SubElement(stylesheet, _xsl('param'), name='today')
+        root_template = etree.SubElement(stylesheet, _xsl('template'), match='/')
+        # Rules evaluate their context against an ElementTree, which lxml treats as the root element
+        rule_calls = etree.SubElement(etree.SubElement(root_template, 'results'), _xsl('for-each'), select='*')
+        context_variables = dict()
+
+        for rule in self.rules:
+            compiler = _RULE_COMPILERS.get(rule.name)
+            if compiler is None or not _is_compilable(rule):
+                self.python_rules.add(rule)
+                continue
+
+            # each context is evaluated once, and shared between the Rules that have it
+            if rule.context not in context_variables:
+                context_variables[rule.context] = 'context-{0}'.format(len(context_variables))
+                etree.SubElement(rule_calls, _xsl('variable'), name=context_variables[rule.context], select=rule.context)
+
+            template_name = 'rule-{0}'.format(len(self._native_rules))
+            call = etree.SubElement(rule_calls, _xsl('call-template'), name=template_name)
+            etree.SubElement(call, _xsl('with-param'), name='context', select='$' + context_variables[rule.context])
+            _add_rule_template(stylesheet, template_name, len(self._native_rules), rule, compiler)
+            self._native_rules.append(rule)
+            self.native_rules.add(rule)
+
+        self.stylesheet = etree.ElementTree(stylesheet)
+        self._transform = etree.XSLT(self.stylesheet)
+
+    def evaluate(self, dataset):
+        """Check a Dataset against each Rule in the Ruleset, locating the elements that determine the results.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to be checked against the Ruleset.
+
+        Returns:
+            dict: A dictionary mapping each Rule in the Ruleset to a `(result, line_number)` tuple. `result` is in the format returned by `iati.Ruleset.results_for()`.
+
+        Note:
+            `line_number` is the line of the context element that determined the result, or `None` when no single element determined it, or the Rule was checked in Python.
+
+        """
+        try:
+            tree = dataset.xml_tree
+        except AttributeError:
+            return {rule: (TypeError(), None) for rule in self.rules}
+
+        results = dict()
+
+        rules_by_context = collections.defaultdict(list)
+        for rule in self.python_rules:
+            rules_by_context[rule.context].append(rule)
+        for context, rules in rules_by_context.items():
+            for rule, result in iati.rulesets._results_for_context(dataset, context, rules).items():  # pylint: disable=protected-access
+                results[rule] = (result, None)
+
+        if not self._native_rules:
+            return results
+
+        today = datetime.today().strftime('%Y%m%d')
+        records_by_rule = collections.defaultdict(list)
+        for record in self._transform(tree, today=today).getroot():
+            records_by_rule[int(record.get('i'))].append(record)
+
+        for index, rule in enumerate(self._native_rules):
+            results[rule] = _result_from_records(dataset, rule, records_by_rule[index])
+
+        return results
+
+    def results_for(self, dataset):
+        """Check a Dataset against each Rule in the Ruleset.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to be checked against the Ruleset.
+
+        Returns:
+            dict: A dictionary in the format returned by `iati.Ruleset.results_for()`.
+
+        """
+        return {rule: result for rule, (result, _) in self.evaluate(dataset).items()}
+
+
+def compiled_ruleset(ruleset):
+    """Return a compiled version of a Ruleset.
+
+    Compiled Rulesets are cached by the Rules that they contain, so a Ruleset is recompiled when its Rules change.
+
+    Args:
+        ruleset (iati.Ruleset): The Ruleset to compile.
+
+    Returns:
+        iati.ruleset_xslt.CompiledRuleset: The compiled Ruleset. It may be shared with other Rulesets that contain the same Rules.
+
+    """
+    rules = frozenset(ruleset.rules)
+
+    with _COMPILED_RULESETS_LOCK:
+        compiled = _COMPILED_RULESETS.get(rules)
+        if compiled is not None:
+            _COMPILED_RULESETS.move_to_end(rules)
+            return compiled
+
+    compiled = CompiledRuleset(ruleset)
+    with _COMPILED_RULESETS_LOCK:
+        _COMPILED_RULESETS[compiled.rules] = compiled
+        _COMPILED_RULESETS.move_to_end(compiled.rules)
+        while len(_COMPILED_RULESETS) > _COMPILED_RULESETS_MAX_SIZE:
+            _COMPILED_RULESETS.popitem(last=False)
+
+    return compiled
+
+
+def _result_from_records(dataset, rule, records):
+    """Determine the result of a Rule from the records output by the stylesheet.
+
+    Args:
+        dataset (iati.Dataset): The Dataset that was checked.
+        rule (iati.Rule): The Rule that the records relate to.
+        records (list of etree._Element): The records for the Rule, in document order of the context elements that they relate to. Only the first record determines the result, since it relates to the first context element that does not pass the Rule.
+
+    Returns:
+        tuple: A `(result, line_number)` tuple, in the format returned by `CompiledRuleset.evaluate()`.
+
+    """
+    if not records:
+        return rule._overall_result(True), None  # pylint: disable=protected-access
+
+    status = records[0].get('s')
+    line_number = int(records[0].get('l'))
+
+    if status == _STATUS_EMPTY:
+        return None, None
+    elif status == _STATUS_DEFER:
+        return iati.rulesets._results_for_context(dataset, rule.context, [rule])[rule], None  # pylint: disable=protected-access
+    elif status == _STATUS_ERROR:
+        return ValueError(), line_number
+
+    result = False if status == _STATUS_FAIL else None
+
+    return rule._overall_result(result), line_number  # pylint: disable=protected-access
+
+
+def _xsl(tag):
+    """Return the qualified name of an XSLT element.
+
+    Args:
+        tag (str): The local name of the element.
+
+    Returns:
+        str: The name of the element within the XSLT namespace.
+
+    """
+    return '{' + XSL_NAMESPACE + '}' + tag
+
+
+def _xpath_string_literal(value):
+    """Convert a string into an XPath expression that evaluates to the string.
+
+    Args:
+        value (str): The string to convert.
+
+    Returns:
+        str: An XPath string literal, or a call to `concat()` when the string contains both types of quote.
+
+    """
+    if "'" not in value:
+        return "'" + value + "'"
+    if '"' not in value:
+        return '"' + value + '"'
+
+    return 'concat(' + ', "\'", '.join("'" + part + "'" for part in value.split("'")) + ')'
+
+
+def _xpath_result_type(expression):
+    """Determine the type of value that an XPath expression evaluates to.
+
+    XPath 1.0 expressions are statically typed, so evaluating an expression against an empty element determines the type for all elements.
+
+    Args:
+        expression (str): An XPath expression.
+
+    Returns:
+        type or None: `list` for a node-set, otherwise `bool`, `float` or `str`. `None` when the expression cannot be evaluated, such as when it contains an undefined namespace prefix.
+
+    """
+    try:
+        result = etree.XPath(expression)(etree.Element('element'))
+    except etree.XPathError:
+        return None
+
+    for result_type in (list, bool, float, str):
+        if isinstance(result, result_type):
+            return result_type
+
+    return None
+
+
+def _rule_paths(rule):
+    """Return the XPath expressions that a Rule evaluates relative to each context element, other than its condition.
+
+    Args:
+        rule (iati.Rule): The Rule to return paths for.
+
+    Returns:
+        list of str: The paths.
+
+    """
+    paths = list(getattr(rule, 'paths', list()))
+    if rule.name == 'startswith':
+        paths.append(rule.start)
+    elif rule.name == 'date_order':
+        paths.extend(path for path in [rule.less, rule.more] if path != rule.special_case)
+
+    return paths
+
+
+def _is_compilable(rule):
+    """Determine whether a Rule can be checked by a stylesheet with exactly the same results as in Python.
+
+    Args:
+        rule (iati.Rule): The Rule to check.
+
+    Returns:
+        bool: Whether the Rule can be compiled.
+
+    """
+    if any(_xpath_result_type(path) is not list for path in [rule.context] + _rule_paths(rule)):
+        return False
+
+    try:
+        return _xpath_result_type(rule.condition) is not None
+    except AttributeError:
+        return True
+
+
+def _condition_test(condition):
+    """Create an XPath test that determines whether a condition is met in the same way as `Rule._condition_met_for()`.
+
+    Args:
+        condition (str): The condition of a Rule.
+
+    Returns:
+        str: An XPath expression that evaluates to a boolean.
+
+    """
+    if _xpath_result_type(condition) is float:
+        # a NaN is truthy in Python, and is not equal to 0 in XPath
+        return '({0}) != 0'.format(condition)
+
+    return 'boolean({0})'.format(condition)
+
+
+def _add_rule_template(stylesheet, template_name, index, rule, compiler):
+    """Add a named template to a stylesheet that outputs a record for the first context element that does not pass a Rule.
+
+    The template has a `context` parameter, which must be given the result of evaluating the context of the Rule.
+
+    Where all the checks for a Rule are XPath tests, the first context element that meets any of them is selected directly, so no other context elements are processed by XSLT instructions.
+
+    Otherwise each context element is checked in turn, and a record is output for each that does not pass.
+
+    Args:
+        stylesheet (etree._Element): The root of the stylesheet.
+        template_name (str): The name of the template.
+        index (int): The index of the Rule, which is output with each record.
+        rule (iati.Rule): The Rule to compile.
+        compiler (func): A function that adds the checks specific to the type of Rule to an `xsl:choose` element.
+
+    """
+    template = etree.SubElement(stylesheet, _xsl('template'), name=template_name)
+    etree.SubElement(template, _xsl('param'), name='context')
+
+    empty_check = etree.SubElement(template, _xsl('if'), test='not($context)')
+    etree.SubElement(empty_check, 'r', i=str(index), l='0', s=_STATUS_EMPTY)
+
+    choose = etree.Element(_xsl('choose'))
+    _add_check(choose, 'not(self::*)', index, _STATUS_DEFER)
+    try:
+        _add_check(choose, _condition_test(rule.condition), index, _STATUS_SKIP)
+    except AttributeError:
+        pass
+    compiler(rule, choose, index)
+
+    if choose.find(_xsl('otherwise')) is None:
+        any_check = ' or '.join('({0})'.format(when.get('test')) for when in choose)
+        context_elements = '$context[{0}][1]'.format(any_check)
+    else:
+        context_elements = '$context'
+    etree.SubElement(template, _xsl('for-each'), select=context_elements).append(choose)
+
+
+def _add_check(parent, test, index, status):
+    """Add a check that outputs a record for the current context element when a test is met.
+
+    Args:
+        parent (etree._Element): The element to add the check to. When this is an `xsl:choose` element, an `xsl:when` element is added. Otherwise an `xsl:if` element is added.
+        test (str): The XPath test for the check.
+        index (int): The index of the Rule that is being checked.
+        status (str or None): The status to output when the test is met. No record is output when this is `None`.
+
+    """
+    tag = 'when' if parent.tag == _xsl('choose') else 'if'
+    check = etree.SubElement(parent, _xsl(tag), test=test)
+    if status is not None:
+        etree.SubElement(check, 'r', i=str(index), l='{saxon:line-number()}', s=status)
+
+
+def _compile_atleast_one(rule, choose, index):
+    """Add the checks for a RuleAtLeastOne to an `xsl:choose` element.
+
+    `RuleAtLeastOne._check_against_Rule()` returns `False` when a path is found. The result is inverted by `RuleAtLeastOne._overall_result()`.
+
+    """
+    _add_check(choose, ' or '.join('boolean({0})'.format(path) for path in rule.paths), index, _STATUS_FAIL)
+
+
+def _compile_dependent(rule, choose, index):
+    """Add the checks for a RuleDependent to an `xsl:choose` element."""
+    unique_paths = sorted(set(rule.paths))
+    found_paths = '({0})'.format(' + '.join('boolean({0})'.format(path) for path in unique_paths))
+    _add_check(choose, 'not({0} = 0 or {0} = {1})'.format(found_paths, len(unique_paths)), index, _STATUS_FAIL)
+
+
+def _compile_no_more_than_one(rule, choose, index):
+    """Add the checks for a RuleNoMoreThanOne to an `xsl:choose` element."""
+    _add_check(choose, '{0} > 1'.format(' + '.join('count({0})'.format(path) for path in sorted(set(rule.paths)))), index, _STATUS_FAIL)
+
+
+def _compile_regex_matches(rule, choose, index):
+    """Add the checks for a RuleRegexMatches to an `xsl:choose` element."""
+    test = 'not(regexp:test({0}, {1}))'.format(_TEXT_VALUE, _xpath_string_literal(rule.regex))
+    _add_check(choose, ' or '.join('({0})[{1}]'.format(path, test) for path in rule.paths), index, _STATUS_FAIL)
+
+
+def _compile_regex_no_matches(rule, choose, index):
+    """Add the checks for a RuleRegexNoMatches to an `xsl:choose` element."""
+    test = 'regexp:test({0}, {1})'.format(_TEXT_VALUE, _xpath_string_literal(rule.regex))
+    _add_check(choose, ' or '.join('({0})[{1}]'.format(path, test) for path in rule.paths), index, _STATUS_FAIL)
+
+
+def _compile_startswith(rule, choose, index):
+    """Add the checks for a RuleStartsWith to an `xsl:choose` element."""
+    _add_check(choose, 'count({0}) != 1'.format(rule.start), index, _STATUS_ERROR)
+
+    otherwise = etree.SubElement(choose, _xsl('otherwise'))
+    etree.SubElement(otherwise, _xsl('variable'), name='prefix', select='string(({0})[self::*]/node()[1][self::text()] | ({0})[not(self::*)])'.format(rule.start))
+    _add_check(otherwise, ' or '.join('({0})[not(starts-with({1}, $prefix))]'.format(path, _TEXT_VALUE) for path in rule.paths), index, _STATUS_FAIL)
+
+
+def _compile_unique(rule, choose, index):
+    """Add the checks for a RuleUnique to an `xsl:choose` element.
+
+    Each path is evaluated separately, since a node that is located by more than one path is counted once for each.
+
+    """
+    unique_paths = sorted(set(rule.paths))
+    otherwise = etree.SubElement(choose, _xsl('otherwise'))
+    for path_index, path in enumerate(unique_paths):
+        etree.SubElement(otherwise, _xsl('variable'), name='path-{0}'.format(path_index), select=path)
+
+    matching_count = ' + '.join('count($path-{0}[{1} = $value])'.format(path_index, _TEXT_VALUE) for path_index in range(len(unique_paths)))
+    duplicates = etree.SubElement(otherwise, _xsl('variable'), name='duplicates')
+    for path_index in range(len(unique_paths)):
+        for_each = etree.SubElement(duplicates, _xsl('for-each'), select='$path-{0}'.format(path_index))
+        etree.SubElement(for_each, _xsl('variable'), name='value', select=_TEXT_VALUE)
+        etree.SubElement(for_each, _xsl('if'), test='{0} > 1'.format(matching_count)).text = _STATUS_FAIL
+
+    _add_check(otherwise, 'string($duplicates)', index, _STATUS_FAIL)
+
+
+def _compile_date_order(rule, choose, index):
+    """Add the checks for a RuleDateOrder to an `xsl:choose` element.
+
+    Dates are compared as YYYYMMDD numbers. The current date is provided as the `today` parameter. When `less` is the special case, it is the current time, so is later than the start of the current date.
+
+    Most dates are zero-padded YYYY-MM-DD strings without a timezone, so context elements where both dates are in this form and are in order are passed by a quick first check. The remaining checks reproduce `RuleDateOrder._get_date()` exactly.
+
+    """
+    if rule.less == rule.special_case and rule.more == rule.special_case:
+        return
+
+    date_names = [name for name in ['less', 'more'] if getattr(rule, name) != rule.special_case]
+    otherwise = etree.SubElement(choose, _xsl('otherwise'))
+    for name in date_names:
+        etree.SubElement(otherwise, _xsl('variable'), name='{0}-nodes'.format(name), select=getattr(rule, name))
+        etree.SubElement(otherwise, _xsl('variable'), name=name, select='string(${0}-nodes[1]/self::*/node()[1][self::text()] | ${0}-nodes[1][not(self::*)])'.format(name))
+
+    if rule.less == rule.special_case:
+        in_order = 'number($today) < {0}'.format(_date_value('more'))
+    elif rule.more == rule.special_case:
+        in_order = '{0} <= number($today)'.format(_date_value('less'))
+    else:
+        in_order = '{0} <= {1}'.format(_date_value('less'), _date_value('more'))
+
+    date_choose = etree.SubElement(otherwise, _xsl('choose'))
+    _add_check(date_choose, ' and '.join([_date_is_plain(name) for name in date_names] + [in_order]), index, None)
+    for name in date_names:
+        _, error_test, defer_test = _date_tests(name)
+        _add_check(date_choose, error_test, index, _STATUS_ERROR)
+        _add_check(date_choose, defer_test, index, _STATUS_DEFER)
+    _add_check(date_choose, ' or '.join(_date_tests(name)[0] for name in date_names), index, _STATUS_SKIP)
+    _add_check(date_choose, 'not({0})'.format(in_order), index, _STATUS_FAIL)
+
+
+def _date_is_plain(name):
+    """Create an XPath test for whether a date is a single zero-padded YYYY-MM-DD string without a timezone, which is not the 29th of February.
+
+    Such dates are valid, so this may be checked before the full set of tests. Dates that do not meet the test may still be valid.
+
+    Args:
+        name (str): The name of the variable containing the date. A variable with the suffix `-nodes` must contain the nodes that the date was taken from.
+
+    Returns:
+        str: The XPath test.
+
+    """
+    return (
+        "not(${0}-nodes[2]) and string-length(${0}) = 10 and translate(${0}, '0123456789', '0000000000') = '0000-00-00' and not(starts-with(${0}, '0000'))"
+        " and substring(${0}, 6, 2) >= 1 and substring(${0}, 6, 2) <= 12 and substring(${0}, 9, 2) >= 1"
+        " and (substring(${0}, 9, 2) <= 28 or (substring(${0}, 6, 2) != 2 and (substring(${0}, 9, 2) <= 30"
+        " or (substring(${0}, 9, 2) = 31 and contains('|01|03|05|07|08|10|12|', concat('|', substring(${0}, 6, 2), '|'))))))"
+    ).format(name)
+
+
+def _date_tests(name):
+    """Create the XPath tests that determine how a date is handled by `RuleDateOrder._get_date()`.
+
+    The conditions are checked in the same order as in Python: a missing date, differing dates, an invalid timezone, a date that is too short, a date that is not a zero-padded YYYY-MM-DD string, and a date that is not in the calendar.
+
+    Args:
+        name (str): The name of the variable containing the date. A variable with the suffix `-nodes` must contain the nodes that the date was taken from.
+
+    Returns:
+        tuple of str: Tests for whether the date is missing, so the Rule is skipped; whether a ValueError is raised; and whether the date must be checked in Python.
+
+    """
+    date = '${0}'.format(name)
+    suffix = 'substring({0}, 11)'.format(date)
+    year, month, day = ('number(substring({0}, {1}, {2}))'.format(date, start, length) for start, length in [(1, 4), (6, 2), (9, 2)])
+
+    missing = "{0} = ''".format(date)
+    differing = '${0}-nodes[not({1} = {2})]'.format(name, _TEXT_VALUE, date)
+    # timezones that do not match exactly are checked in Python since `$` in a Python regex also matches before a trailing newline
+    valid_timezone = (
+        "({0} = '' or {0} = 'Z' or (string-length({0}) = 6 and (starts-with({0}, '+') or starts-with({0}, '-'))"
+        " and translate(substring({0}, 2), '0123456789', '0000000000') = '00:00' and substring({0}, 2, 2) <= 23 and substring({0}, 5, 2) <= 59))"
+    ).format(suffix)
+    too_short = 'string-length({0}) < 10'.format(date)
+    # dates that are not zero-padded YYYY-MM-DD strings may still be accepted by `datetime.strptime()`
+    unpadded = "translate(substring({0}, 1, 10), '0123456789', '0000000000') != '0000-00-00'".format(date)
+    is_leap_year = '(({0} mod 4 = 0 and {0} mod 100 != 0) or {0} mod 400 = 0)'.format(year)
+    days_in_month = '(31 - ({0} = 4 or {0} = 6 or {0} = 9 or {0} = 11) - ({0} = 2) * (3 - {1}))'.format(month, is_leap_year)
+    not_in_calendar = '({0} < 1 or {1} < 1 or {1} > 12 or {2} < 1 or {2} > {3})'.format(year, month, day, days_in_month)
+
+    error_test = 'not({0}) and ({1} or ({2} and ({3} or (not({4}) and {5}))))'.format(missing, differing, valid_timezone, too_short, unpadded, not_in_calendar)
+    defer_test = 'not({0}) and not({1}) and (not({2}) or (not({3}) and {4}))'.format(missing, differing, valid_timezone, too_short, unpadded)
+
+    return missing, error_test, defer_test
+
+
+def _date_value(name):
+    """Create an XPath expression for a valid date as a YYYYMMDD number.
+
+    Args:
+        name (str): The name of the variable containing the date.
+
+    Returns:
+        str: The XPath expression.
+
+    """
+    return "number(translate(substring(${0}, 1, 10), '-', ''))".format(name)
+
+
+_RULE_COMPILERS = {
+    'atleast_one': _compile_atleast_one,
+    'date_order': _compile_date_order,
+    'dependent': _compile_dependent,
+    'no_more_than_one': _compile_no_more_than_one,
+    'regex_matches': _compile_regex_matches,
+    'regex_no_matches': _compile_regex_no_matches,
+    'startswith': _compile_startswith,
+    'unique': _compile_unique
+}
+"""Functions to compile each type of Rule that may be checked by a stylesheet. Keys are Rule names."""
@@ -9,15 +9,93 @@ Todo:
 # no-member errors are due to using `setattr()` # pylint: disable=no-member
 import collections
 import decimal
+import functools
 import json
 import re
 import sre_constants
 from datetime import datetime
-import jsonschema
+from lxml import etree
 import iati.default
 import iati.utilities
 
 
+_RULESET_VALIDATOR = None
+"""A cache of the compiled JSON schema validator for the Ruleset schema."""
+
+_CASE_SCHEMAS = dict()
+"""A cache of the sections of the Ruleset schema relevant to each type of Rule.
+
+This is a dictionary mapping Rule names to `(partial_schema, validator)` tuples, where `validator` is a compiled JSON schema validator for `partial_schema`. Entries are added the first time that a Rule of each type is created.
+
+"""
+
+
+def _compiled_json_schema_validator(schema):
+    """Compile a JSON schema into a validator that may be used repeatedly.
+
+    Args:
+        schema (dict): The JSON schema to compile.
+
+    Returns:
+        jsonschema.IValidator: A validator for the schema.
+
+    """
+    import jsonschema  # imported here since it is slow to import and only required when Rulesets are created
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+
+    return validator_class(schema)
+
+
+def _ruleset_validator():
+    """Return a compiled validator for the Ruleset schema.
+
+    Returns:
+        jsonschema.IValidator: A validator for the Ruleset schema.
+
+    """
+    global _RULESET_VALIDATOR  # pylint: disable=global-statement
+
+    if _RULESET_VALIDATOR is None:
+        _RULESET_VALIDATOR = _compiled_json_schema_validator(iati.default._ruleset_schema())  # pylint: disable=protected-access
+
+    return _RULESET_VALIDATOR
+
+
+_TIMEZONE_REGEX = re.compile(r'^([+-]([01][0-9]|2[0-3]):([0-5][0-9])|Z)?$')
+"""A compiled regex that matches a permitted timezone following the YYYY-MM-DD section of a date."""
+
+_ISO_DATE_REGEX = re.compile(r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$')
+"""A compiled regex that matches a date in the YYYY-MM-DD format, with zero-padded values."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str):
+    """Convert a date string in the YYYY-MM-DD format into a datetime.
+
+    Dates are commonly repeated within a Dataset, so recently seen date strings are memoized.
+
+    Args:
+        date_str (str): The date to convert.
+
+    Returns:
+        datetime.datetime: A datetime object for the start of the specified date.
+
+    Raises:
+        ValueError: When the string is not a valid date in the YYYY-MM-DD format.
+
+    Note:
+        Strings that are not in the zero-padded YYYY-MM-DD format are passed to `datetime.strptime()`, so that the same strings are accepted.
+
+    """
+    match = _ISO_DATE_REGEX.match(date_str)
+    if match is None:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+
+    return datetime(*(int(component) for component in match.groups()))
+
+
 _VALID_RULE_TYPES = ["atleast_one", "dependent", "sum", "date_order", "no_more_than_one", "regex_matches", "regex_no_matches", "startswith", "unique"]
 
 
@@ -49,6 +127,198 @@ def constructor_for_rule_type(rule_type):
     return possible_rule_types[rule_type]
 
 
+def _results_for_context(dataset, context, rules):
+    """Check a Dataset against a group of Rules that share a context.
+
+    Args:
+        dataset (iati.Dataset): The Dataset to be checked against the Rules.
+        context (str): The XPath expression shared by each of the Rules.
+        rules (list of iati.Rule): The Rules to check.
+
+    Returns:
+        dict: A dictionary mapping each Rule to the value that `Rule.is_valid_for()` would return for the Dataset, or the exception that it would raise.
+
+    """
+    return dict(_iter_results_for_context(dataset, context, rules))
+
+
+def _iter_results_for_context(dataset, context, rules):
+    """Check a Dataset against a group of Rules that share a context, yielding the result for each Rule as soon as it is known.
+
+    Args:
+        dataset (iati.Dataset): The Dataset to be checked against the Rules.
+        context (str): The XPath expression shared by each of the Rules.
+        rules (list of iati.Rule): The Rules to check.
+
+    Yields:
+        tuple: A `(rule, result)` tuple for each Rule. The result is the value that `Rule.is_valid_for()` would return for the Dataset, or the exception that it would raise.
+
+    Note:
+        Rules that a context element does not pass are yielded as soon as this is found, before the remaining Rules are checked. As such, checking stops once the caller stops consuming results.
+
+    """
+    try:
+        context_elements = rules[0]._find_context_elements(dataset)  # pylint: disable=protected-access
+    except AttributeError:
+        context_elements, error = None, TypeError()
+    except Exception as err:  # pylint: disable=broad-except
+        context_elements, error = None, err
+
+    if context_elements is None:
+        for rule in rules:
+            yield rule, error
+        return
+
+    if context_elements == list():
+        for rule in rules:
+            yield rule, None
+        return
+
+    failed_rules = set()
+    for rule, result in _check_context_elements(context_elements, rules):
+        failed_rules.add(rule)
+        yield rule, result
+
+    for rule in rules:
+        if rule not in failed_rules:
+            yield rule, rule._overall_result(True)  # pylint: disable=protected-access
+
+
+def _check_context_elements(context_elements, rules):
+    """Check a group of Rules that share a context against each of a number of context elements, in order.
+
+    Checking stops for each Rule at the first context element that does not pass it. Rules that every context element passes are not yielded.
+
+    Args:
+        context_elements (list of etree._Element): The context elements to check, in document order.
+        rules (list of iati.Rule): The Rules to check.
+
+    Yields:
+        tuple: A `(rule, result)` tuple for each Rule that a context element does not pass, as soon as this is found. The result is the value that `Rule.is_valid_for()` would return, or the exception that it would raise.
+
+    """
+    pending_rules = list(rules)
+    for context_element in context_elements:
+        still_pending = list()
+        for rule in pending_rules:
+            try:
+                result = rule._result_for_context_element(context_element)  # pylint: disable=protected-access
+            except Exception as err:  # pylint: disable=broad-except
+                yield rule, err
+                continue
+            if result is True:
+                still_pending.append(rule)
+            else:
+                yield rule, rule._overall_result(result)  # pylint: disable=protected-access
+        pending_rules = still_pending
+        if not pending_rules:
+            break
+
+
+def _is_within(element, ancestor):
+    """Determine whether an element is, or is a descendant of, another element.
+
+    Args:
+        element (etree._Element): The element to check.
+        ancestor (etree._Element): The element that may contain `element`.
+
+    Returns:
+        bool: Whether `element` is `ancestor` or is within it.
+
+    """
+    return element is ancestor or any(parent is ancestor for parent in element.iterancestors())
+
+
+class _IncrementalResults:
+    """The results of checking a Ruleset against a Dataset that is held in memory one part at a time.
+
+    Each part is checked when it is added, in document order.
+
+    Once every part has been checked, the results are the same as those from `Ruleset.results_for()` for the whole Dataset, provided that each context element and the paths checked for it are within a single part.
+
+    """
+
+    def __init__(self, ruleset):
+        """Initialise the results.
+
+        Args:
+            ruleset (iati.Ruleset): The Ruleset to check.
+
+        """
+        self._pending_rules = collections.defaultdict(list)
+        for rule in ruleset.rules:
+            self._pending_rules[rule.context].append(rule)
+
+        self._results = dict()
+        self._contexts_found = set()
+
+    def check(self, dataset, element=None):
+        """Check the part of a Dataset that is currently held in memory.
+
+        Rules that a previous part did not pass are not checked again.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check.
+            element (etree._Element): The element containing the part of the Dataset to check. Only context elements that are, or are within, this element are checked. Default is every context element within the Dataset.
+
+        """
+        for context, pending_rules in self._pending_rules.items():
+            if not pending_rules:
+                continue
+
+            try:
+                context_elements = pending_rules[0]._find_context_elements(dataset)  # pylint: disable=protected-access
+            except AttributeError:
+                self._results.update({rule: TypeError() for rule in pending_rules})
+                self._pending_rules[context] = list()
+                continue
+            except Exception as err:  # pylint: disable=broad-except
+                self._results.update({rule: err for rule in pending_rules})
+                self._pending_rules[context] = list()
+                continue
+
+            if element is not None:
+                context_elements = [context_element for context_element in context_elements if _is_within(context_element, element)]
+
+            if context_elements:
+                self._contexts_found.add(context)
+                failed_results = dict(_check_context_elements(context_elements, pending_rules))
+                self._results.update(failed_results)
+                self._pending_rules[context] = [rule for rule in pending_rules if rule not in failed_results]
+
+    def results(self):
+        """Return the results of checking each part that has been added.
+
+        Returns:
+            dict: A dictionary mapping each Rule in the Ruleset to its result, in the format returned by `Ruleset.results_for()`.
+
+        """
+        results = dict(self._results)
+        for context, pending_rules in self._pending_rules.items():
+            for rule in pending_rules:
+                results[rule] = rule._overall_result(True) if context in self._contexts_found else None  # pylint: disable=protected-access
+
+        return results
+
+
+def _canonical_key(value):
+    """Convert a value parsed from JSON into a hashable form, where equal values have equal keys.
+
+    Args:
+        value (dict or list or str or int or float or bool or None): A value parsed from JSON, such as the case of a Rule.
+
+    Returns:
+        tuple or str or int or float or bool or None: The value, with dictionaries converted to sorted tuples of `(key, value)` pairs and lists converted to tuples.
+
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canonical_key(item)) for key, item in value.items()))
+    elif isinstance(value, list):
+        return tuple(_canonical_key(item) for item in value)
+
+    return value
+
+
 class Ruleset:
     """Representation of a Ruleset as defined within the IATI SSOT.
 
@@ -94,7 +364,7 @@ class Ruleset:
 
         This allows uniqueness to be correctly defined upon insertion into a set.
         """
-        return collections.Counter(self.rules) == collections.Counter(other.rules)
+        return self.rules == other.rules
 
     def __ne__(self, other):
         """Check Ruleset inequality."""
@@ -103,9 +373,28 @@ class Ruleset:
     def __hash__(self):
         """Hash the Ruleset.
 
-        This allows uniqueness to be correctly defined upon insertion into a set.
+        This allows uniqueness to be correctly defined upon insertion into a set. Rulesets containing the same Rules have the same hash.
+
+        Warning:
+            The hash changes when Rules are added to or removed from the Ruleset. A Ruleset should not be modified while it is within a set, such as `iati.Schema.rulesets`.
+
         """
-        return hash(id(self))
+        return hash(frozenset(self.rules))
+
+    def __copy__(self):
+        """Copy the Ruleset.
+
+        The copy has its own set of Rules, so Rules may be added to or removed from it without affecting this Ruleset. The Rules themselves are shared.
+
+        Returns:
+            iati.Ruleset: A copy of the Ruleset.
+
+        """
+        ruleset = type(self).__new__(type(self))
+        ruleset.__dict__.update(self.__dict__)
+        ruleset.rules = set(self.rules)
+
+        return ruleset
 
     def is_valid_for(self, dataset):
         """Validate a Dataset against the Ruleset.
@@ -119,19 +408,58 @@ class Ruleset:
 
                 `False` when part or all of the Dataset is not valid against the Ruleset.
 
+        Note:
+            Rules are checked in groups that share a context, in the same way as by `results_for()`. Checking stops at the first Rule that the Dataset does not pass.
+
         Todo:
             Better design how Skips and ValueErrors are treated. The current True/False/Skip/Error thing is a bit clunky.
 
         """
-        for rule in self.rules:
-            try:
-                if rule.is_valid_for(dataset) is False:
+        for context, rules in self._rules_by_context().items():
+            for _, result in _iter_results_for_context(dataset, context, rules):
+                if isinstance(result, ValueError):
+                    return False
+                elif isinstance(result, Exception):
+                    raise result
+                elif result is False:
                     return False
-            except ValueError:
-                return False
 
         return True
 
+    def results_for(self, dataset):
+        """Check a Dataset against each Rule in the Ruleset.
+
+        Rules are grouped by their `context`. The context XPath for each group is evaluated once, then every Rule in the group is checked against each context element in a single pass.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to be checked against the Ruleset.
+
+        Returns:
+            dict: A dictionary mapping each Rule in the Ruleset to the value that `Rule.is_valid_for()` would return for the Dataset. Where `Rule.is_valid_for()` would raise an exception, the exception is the value.
+
+        Note:
+            Exceptions are returned rather than raised so that callers may act upon them in the same order as when checking each Rule in turn.
+
+        """
+        results = dict()
+        for context, rules in self._rules_by_context().items():
+            results.update(_results_for_context(dataset, context, rules))
+
+        return results
+
+    def _rules_by_context(self):
+        """Group the Rules in the Ruleset by their context.
+
+        Returns:
+            dict: A dictionary mapping each context to a list of the Rules with that context.
+
+        """
+        rules_by_context = collections.defaultdict(list)
+        for rule in self.rules:
+            rules_by_context[rule.context].append(rule)
+
+        return rules_by_context
+
     def _validate_ruleset(self, ruleset_dict):
         """Validate a Ruleset against the Ruleset Schema.
 
@@ -142,8 +470,9 @@ class Ruleset:
             ValueError: When `ruleset_dict` does not validate against the Ruleset Schema.
 
         """
+        import jsonschema  # imported here since it is slow to import and only required when Rulesets are created
         try:
-            jsonschema.validate(ruleset_dict, iati.default.ruleset_schema())
+            _ruleset_validator().validate(ruleset_dict)
         except jsonschema.ValidationError:
             raise ValueError('Provided Ruleset does not validate against the Ruleset Schema')
 
@@ -184,13 +513,16 @@ class Rule:
         Raises:
             TypeError: When a parameter is of an incorrect type.
             ValueError: When a rule_type is not one of the permitted Rule types.
+            ValueError: When the context or an XPath within the case is not a valid XPath expression.
 
         """
         self._case = case
         self._context = self._validated_context(context)
         self._valid_rule_configuration(case)
+        self._case_key = _canonical_key(case)
         self._set_case_attributes(case)
         self._normalize_xpaths()
+        self._compiled_xpaths = self._compile_xpaths()
 
     def __str__(self):
         """Return string to state what the Rule is checking."""
@@ -201,7 +533,7 @@ class Rule:
 
         This allows uniqueness to be correctly defined upon insertion into a set.
         """
-        return (self.name == other.name) and (str(self) == str(other))
+        return self._key == other._key  # pylint: disable=protected-access
 
     def __ne__(self, other):
         """Check Rule inequality."""
@@ -212,13 +544,38 @@ class Rule:
 
         This allows uniqueness to be correctly defined upon insertion into a set.
         """
-        return hash((self.name, str(self)))
+        return hash(self._key)
+
+    def __getstate__(self):
+        """Return the state of the Rule for copying and pickling.
+
+        Compiled XPath expressions cannot be copied, so are not included. They are recompiled when the state is restored.
+
+        """
+        state = self.__dict__.copy()
+        del state['_compiled_xpaths']
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the Rule after copying or unpickling."""
+        self.__dict__.update(state)
+        self._compiled_xpaths = self._compile_xpaths()
 
     @property
     def context(self):
         """str: An XPath expression to locate the elements that the Rule is to be checked against."""
         return self._context
 
+    @property
+    def _key(self):
+        """tuple: A canonical representation of the type, context and case of the Rule, which determines equality.
+
+        The case is converted when the Rule is created, so the key may be built without formatting the string representation of the Rule.
+
+        """
+        return (self.name, self.context, self._case_key)
+
     @property
     def name(self):
         """str: The type of Rule, as specified in a JSON Ruleset."""
@@ -280,6 +637,54 @@ class Rule:
         self.normalized_paths = [self._normalize_xpath(path) for path in self.paths]
         self._normalize_condition()
 
+    def _xpath_expressions(self):
+        """Return the XPath expressions that the Rule evaluates.
+
+        Returns:
+            list of str: The `context`, along with any `paths` and `condition`.
+
+        Note:
+            May be overridden in child class that uses other XPath expressions.
+
+        """
+        expressions = [self.context] + list(getattr(self, 'paths', list()))
+        try:
+            expressions.append(self.condition)
+        except AttributeError:
+            pass
+
+        return expressions
+
+    def _compile_xpaths(self):
+        """Compile each of the XPath expressions that the Rule evaluates.
+
+        Returns:
+            dict: A dictionary mapping each XPath expression string to an `etree.XPath`.
+
+        Raises:
+            ValueError: When an expression is not a valid XPath expression.
+
+        """
+        try:
+            return {expression: etree.XPath(expression) for expression in self._xpath_expressions()}
+        except etree.XPathSyntaxError:
+            raise ValueError('The Rule contains an invalid XPath expression.')
+
+    def _xpath(self, expression):
+        """Return a compiled XPath for an expression.
+
+        Args:
+            expression (str): An XPath expression.
+
+        Returns:
+            etree.XPath: The compiled expression. Expressions that were not compiled when the Rule was created are compiled as required.
+
+        """
+        try:
+            return self._compiled_xpaths[expression]
+        except KeyError:
+            return etree.XPath(expression)
+
     def _valid_rule_configuration(self, case):
         """Check that a configuration being passed into a Rule is valid for the given type of Rule.
 
@@ -294,8 +699,9 @@ class Rule:
             The `name` attribute on the class must be set to a valid rule_type before this function is called.
 
         """
+        import jsonschema  # imported here since it is slow to import and only required when Rules are created
         try:
-            jsonschema.validate(case, self._ruleset_schema_section())
+            self._case_schema()[1].validate(case)
         except jsonschema.ValidationError:
             raise ValueError
 
@@ -309,11 +715,12 @@ class Rule:
             Set non-required properties such as a `condition`.
 
         """
-        required_attributes = self._case_attributes(self._ruleset_schema_section())
+        partial_schema = self._ruleset_schema_section()
+        required_attributes = self._case_attributes(partial_schema)
         for attrib in required_attributes:
             setattr(self, attrib, case[attrib])
 
-        optional_attributes = self._case_attributes(self._ruleset_schema_section(), False)
+        optional_attributes = self._case_attributes(partial_schema, False)
         for attrib in optional_attributes:
             try:
                 setattr(self, attrib, case[attrib])
@@ -346,7 +753,29 @@ class Rule:
         Raises:
             AttributeError: When the Rule name is unset or does not have the required attributes.
 
+        Warning:
+            The returned dictionary is shared between all Rules of the same type, so must not be modified.
+
         """
+        return self._case_schema()[0]
+
+    def _case_schema(self):
+        """Return the section of the Ruleset Schema relevant for the Rule, along with a compiled validator for it.
+
+        The section and validator are created the first time that a Rule of each type is created, then cached.
+
+        Returns:
+            tuple: A `(partial_schema, validator)` tuple, where `partial_schema` is a dictionary and `validator` is a `jsonschema.IValidator`.
+
+        Raises:
+            AttributeError: When the Rule name is unset or does not have the required attributes.
+
+        """
+        try:
+            return _CASE_SCHEMAS[self.name]
+        except KeyError:
+            pass
+
         ruleset_schema = iati.default.ruleset_schema()
         partial_schema = ruleset_schema['patternProperties']['.+']['properties'][self.name]['properties']['cases']['items']  # pylint: disable=E1101
         # make all attributes other than 'condition' in the partial schema required
@@ -355,7 +784,10 @@ class Rule:
         if 'paths' in partial_schema['properties'].keys():
             partial_schema['properties']['paths']['minItems'] = 1
 
-        return partial_schema
+        case_schema = (partial_schema, _compiled_json_schema_validator(partial_schema))
+        _CASE_SCHEMAS[self.name] = case_schema
+
+        return case_schema
 
     def _find_context_elements(self, dataset):
         """Find the specific elements in context for the Rule.
@@ -370,7 +802,7 @@ class Rule:
             AttributeError: When an argument is given that does not have the required attributes.
 
         """
-        return dataset.xml_tree.xpath(self.context)
+        return self._xpath(self.context)(dataset.xml_tree)
 
     def _extract_text_from_element_or_attribute(self, context, path):
         """Return a list of strings regardless of whether XPath result is an attribute or an element.
@@ -387,7 +819,7 @@ class Rule:
             `path` should be validated outside of this function to avoid unexpected errors.
 
         """
-        xpath_results = context.xpath(path)
+        xpath_results = self._xpath(path)(context)
         results = [result if isinstance(result, str) else result.text for result in xpath_results]
         return ['' if result is None else result for result in results]
 
@@ -412,11 +844,13 @@ class Rule:
 
         """
         try:
-            if context_element.xpath(self.condition):
-                return True
+            condition = self.condition
         except AttributeError:
             return False
 
+        if self._xpath(condition)(context_element):
+            return True
+
         return False
 
     def is_valid_for(self, dataset):
@@ -453,17 +887,56 @@ class Rule:
             return None
 
         for context_element in context_elements:
-            if self._condition_met_for(context_element):
-                return None
+            result = self._result_for_context_element(context_element)
+            if result is not True:
+                return self._overall_result(result)
 
-            rule_check_result = self._check_against_Rule(context_element)
-            if rule_check_result is False:
-                return False
-            elif rule_check_result is None:
-                return None
+        return self._overall_result(True)
+
+    def _result_for_context_element(self, context_element):
+        """Check a single context element against the Rule.
+
+        Args:
+            context_element (etree._Element): An XML Element located by the Rule's `context`.
+
+        Returns:
+            bool or None:
+                `True` when the element passes the Rule, so checking should continue with the next context element.
+
+                `False` when the element does not pass the Rule.
+
+                `None` when a condition is met to skip validation.
+
+        Raises:
+            ValueError: When a check encounters a completely incorrect value that it is unable to recover from within the definition of the Rule.
+
+        """
+        if self._condition_met_for(context_element):
+            return None
+
+        rule_check_result = self._check_against_Rule(context_element)
+        if rule_check_result is False:
+            return False
+        elif rule_check_result is None:
+            return None
 
         return True
 
+    def _overall_result(self, result):
+        """Convert the result of checking context elements into the result of checking a Dataset.
+
+        Args:
+            result (bool or None): `True` when every context element passed, otherwise the first result from `_result_for_context_element()` that was not `True`.
+
+        Returns:
+            bool or None: The value to return from `is_valid_for()`.
+
+        Note:
+            May be overridden in child class that does not have the same return structure for boolean results.
+
+        """
+        return result
+
 
 class RuleAtLeastOne(Rule):
     """Representation of a Rule that checks that there is at least one Element matching a given XPath.
@@ -497,15 +970,17 @@ class RuleAtLeastOne(Rule):
 
         """
         for path in self.paths:
-            if context_element.xpath(path):
+            if self._xpath(path)(context_element):
                 return False
         return True
 
-    def is_valid_for(self, dataset):
-        """Check whether a Dataset is valid against the Rule.
+    def _overall_result(self, result):
+        """Convert the result of checking context elements into the result of checking a Dataset.
+
+        `_check_against_Rule()` returns `False` when a path is found, so the result is inverted.
 
         Args:
-            dataset (iati.Dataset): The Dataset to be checked for validity against the Rule.
+            result (bool or None): `True` when every context element passed, otherwise the first result from `_result_for_context_element()` that was not `True`.
 
         Returns:
             bool or None:
@@ -515,15 +990,10 @@ class RuleAtLeastOne(Rule):
 
                 `None` when a condition is met to skip validation.
 
-        Raises:
-            TypeError: When a Dataset is not given as an argument.
-
         """
-        parent = super(RuleAtLeastOne, self).is_valid_for(dataset)
-
-        if parent is True:
+        if result is True:
             return False
-        elif parent is None:
+        elif result is None:
             return None
         return True
 
@@ -569,6 +1039,17 @@ class RuleDateOrder(Rule):
 
         self._normalize_condition()
 
+    def _xpath_expressions(self):
+        """Return the XPath expressions that the Rule evaluates.
+
+        Returns:
+            list of str: The `context`, `less`, `more` and any `condition`, excluding the special case value.
+
+        """
+        expressions = super(RuleDateOrder, self)._xpath_expressions()
+
+        return expressions + [path for path in [self.less, self.more] if path != self.special_case]
+
     def _get_date(self, context_element, path):
         """Retrieve datetime object from an XPath string.
 
@@ -599,12 +1080,11 @@ class RuleDateOrder(Rule):
         if dates == list() or not dates[0]:
             return None
         # Checks that anything after the YYYY-MM-DD string is a permitted timezone character
-        pattern = re.compile(r'^([+-]([01][0-9]|2[0-3]):([0-5][0-9])|Z)?$')
-        if (len(set(dates)) == 1) and pattern.match(dates[0][10:]):
+        if (len(set(dates)) == 1) and _TIMEZONE_REGEX.match(dates[0][10:]):
             if len(dates[0]) < 10:
                 # '%d' and '%m' are documented as requiring zero-padded dates.as input. This is actually for output. As such, a separate length check is required to ensure zero-padded values.
                 raise ValueError
-            return datetime.strptime(dates[0][:10], '%Y-%m-%d')
+            return _parse_date(dates[0][:10])
         raise ValueError
 
     def _check_against_Rule(self, context_element):
@@ -670,7 +1150,7 @@ class RuleDependent(Rule):
         unique_paths = set(self.paths)
         found_paths = 0
         for path in unique_paths:
-            results = context_element.xpath(path)
+            results = self._xpath(path)(context_element)
             if results != list():
                 found_paths += 1
 
@@ -715,7 +1195,7 @@ class RuleNoMoreThanOne(Rule):
         found_elements = 0
 
         for path in unique_paths:
-            results = context_element.xpath(path)
+            results = self._xpath(path)(context_element)
             found_elements += len(results)
 
         if found_elements > 1:
@@ -746,7 +1226,7 @@ class RuleRegexMatches(Rule):
         if self.regex == '':
             raise ValueError
         try:
-            re.compile(self.regex)
+            self._pattern = re.compile(self.regex)
         except sre_constants.error:
             raise ValueError
 
@@ -767,12 +1247,10 @@ class RuleRegexMatches(Rule):
                   Return `False` when the given `path` text does not match the given regex.
 
         """
-        pattern = re.compile(self.regex)
-
         for path in self.paths:
             strings_to_check = self._extract_text_from_element_or_attribute(context_element, path)
             for string_to_check in strings_to_check:
-                if not pattern.search(string_to_check):
+                if not self._pattern.search(string_to_check):
                     return False
         return True
 
@@ -800,7 +1278,7 @@ class RuleRegexNoMatches(Rule):
         if self.regex == '':
             raise ValueError
         try:
-            re.compile(self.regex)
+            self._pattern = re.compile(self.regex)
         except sre_constants.error:
             raise ValueError
 
@@ -821,12 +1299,10 @@ class RuleRegexNoMatches(Rule):
                   Return `False` when the given `path` text matches the given regex.
 
         """
-        pattern = re.compile(self.regex)
-
         for path in self.paths:
             strings_to_check = self._extract_text_from_element_or_attribute(context_element, path)
             for string_to_check in strings_to_check:
-                if pattern.search(string_to_check):
+                if self._pattern.search(string_to_check):
                     return False
         return True
 
@@ -858,6 +1334,15 @@ class RuleStartsWith(Rule):
 
         self.normalized_paths.append(self._normalize_xpath(self.start))
 
+    def _xpath_expressions(self):
+        """Return the XPath expressions that the Rule evaluates.
+
+        Returns:
+            list of str: The `context`, `paths`, `start` and any `condition`.
+
+        """
+        return super(RuleStartsWith, self)._xpath_expressions() + [self.start]
+
     def _check_against_Rule(self, context_element):
         """Assert that the prefixing text of all given `paths` starts with the text of `start`.
 
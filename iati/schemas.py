@@ -1,5 +1,8 @@
 """A module containing a core representation of IATI Schemas."""
 import collections
+import contextlib
+import copy
+import threading
 from lxml import etree
 import iati.codelists
 import iati.constants
@@ -52,6 +55,10 @@ class Schema:
         """
         self._schema_base_tree = None
         self._source_path = path
+        self._validator_cache = None
+        self._flattened_tree_cache = None
+        self._thread_local_validators = threading.local()
+        self._validator_pool = _ValidatorPool()
         self.codelists = set()
         self.rulesets = set()
 
@@ -72,24 +79,55 @@ class Schema:
         Todo:
             Utilise all attributes as part of the equality process.
 
-            Determine a better method of checking whether the contained Rulesets are equal.
-
         """
         # perform cheap checks first
         if (len(self.codelists) != len(other.codelists)) or (len(self.rulesets) != len(other.rulesets)):
             return False
 
-        # turn the tree into something that can be easily compared
-        self_tree_str = etree.tostring(self.flatten_includes(self._schema_base_tree), pretty_print=True)
-        other_tree_str = etree.tostring(other.flatten_includes(other._schema_base_tree), pretty_print=True)  # pylint: disable=protected-access
+        # copies share their base tree, so need not be flattened to be compared
+        trees_equal = (self._schema_base_tree is other._schema_base_tree) or (self._flattened_tree_str() == other._flattened_tree_str())  # pylint: disable=protected-access
+
+        return trees_equal and (collections.Counter(self.codelists) == collections.Counter(other.codelists)) and (collections.Counter(self.rulesets) == collections.Counter(other.rulesets))
+
+    def __copy__(self):
+        """Copy the Schema.
+
+        The copy has its own sets of Codelists and Rulesets, so these may be added to or removed from without affecting this Schema. The base tree, compiled validators, Codelists and Rulesets themselves are shared. As such, copying is cheap.
+
+        Returns:
+            iati.Schema: A copy of the Schema.
+
+        Warning:
+            The shared base tree, Codelists and Rulesets should not be modified in place. They should be replaced with copies instead.
+
+        """
+        schema = type(self).__new__(type(self))
+        schema.__dict__.update(self.__dict__)
+        schema.codelists = set(self.codelists)
+        schema.rulesets = set(self.rulesets)
+        schema._thread_local_validators = threading.local()  # pylint: disable=protected-access
+
+        return schema
+
+    def __getstate__(self):
+        """Return the state of the Schema for copying and pickling.
 
-        # compare Rulesets - cannot use `collections.Counter` since it works on hash values, which differ between equal Rulesets
-        self_rulesets = list(self.rulesets)
-        other_rulesets = list(other.rulesets)
-        for self_rs in self_rulesets:
-            other_rulesets = [other_rs for other_rs in other_rulesets if other_rs != self_rs]
+        Compiled validators cannot be copied, so are not included. They are recompiled when next required. The flattened base tree is likewise recomputed.
 
-        return (self_tree_str == other_tree_str) and (collections.Counter(self.codelists) == collections.Counter(other.codelists)) and (len(other_rulesets) == 0)
+        """
+        state = self.__dict__.copy()
+        state['_validator_cache'] = None
+        state['_flattened_tree_cache'] = None
+        del state['_thread_local_validators']
+        del state['_validator_pool']
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the Schema after copying or unpickling."""
+        self.__dict__.update(state)
+        self._thread_local_validators = threading.local()
+        self._validator_pool = _ValidatorPool()
 
     def _change_include_to_xinclude(self, tree):
         """Change the method in which common elements are included.
@@ -211,10 +249,26 @@ class Schema:
 
         return tree
 
-    def validator(self):
-        """Return a schema that can be used for validation.
+    def _flattened_tree_str(self):
+        """Serialise the base tree with its includes flattened, so that it may be compared with that of another Schema.
+
+        Returns:
+            bytes: The serialised flattened tree.
+
+        Note:
+            The result is cached until the base tree is replaced. Base trees may be shared between copies, so are not flattened in place.
+
+        """
+        cache = self._flattened_tree_cache
+        if cache is None or cache[0] is not self._schema_base_tree:
+            tree_str = etree.tostring(self.flatten_includes(copy.deepcopy(self._schema_base_tree)), pretty_print=True)
+            cache = (self._schema_base_tree, tree_str)
+            self._flattened_tree_cache = cache
+
+        return cache[1]
 
-        Takes the base schema and converts it into an object that lxml can deal with.
+    def _compile_validator(self):
+        """Compile the base schema into an object that lxml can deal with.
 
         Returns:
             etree.XMLSchema: A schema that can be used for validation.
@@ -229,6 +283,143 @@ class Schema:
             iati.utilities.log_error(err)
             raise iati.exceptions.SchemaError('Problem parsing Schema')
 
+    def _validator_dependencies(self):
+        """Return the components of the Schema that a compiled validator depends upon.
+
+        Returns:
+            tuple: The base tree, Codelists and Rulesets that are currently part of the Schema.
+
+        """
+        return (self._schema_base_tree, tuple(self.codelists), tuple(self.rulesets))
+
+    def _validator_is_current(self, cache):
+        """Determine whether a cached validator was compiled from the current state of the Schema.
+
+        Args:
+            cache (tuple or None): A tuple in the format `(dependencies, validator)`, where `dependencies` were obtained from `_validator_dependencies()` at the time of compilation.
+
+        Returns:
+            bool: Whether the cached validator may be reused.
+
+        Note:
+            Components are compared by identity, since the cache holds references to them. Modification of the base tree in place is not detected.
+
+        """
+        if cache is None:
+            return False
+
+        (base_tree, codelists, rulesets), _ = cache
+
+        return (
+            base_tree is self._schema_base_tree
+            and len(codelists) == len(self.codelists)
+            and len(rulesets) == len(self.rulesets)
+            and {id(codelist) for codelist in codelists} == {id(codelist) for codelist in self.codelists}
+            and {id(ruleset) for ruleset in rulesets} == {id(ruleset) for ruleset in self.rulesets}
+        )
+
+    def validator(self):
+        """Return a schema that can be used for validation.
+
+        Takes the base schema and converts it into an object that lxml can deal with. The result is cached on the Schema, and recompiled when the base tree, Codelists or Rulesets change.
+
+        Returns:
+            etree.XMLSchema: A schema that can be used for validation.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+        Warning:
+            The returned validator is shared by all callers. Use `thread_local_validator()` when validating in multiple threads at the same time.
+
+        """
+        cache = self._validator_cache
+        if not self._validator_is_current(cache):
+            cache = (self._validator_dependencies(), self._compile_validator())
+            self._validator_cache = cache
+
+        return cache[1]
+
+    def thread_local_validator(self):
+        """Return a schema that can be used for validation within the current thread.
+
+        Each thread is given its own compiled validator, which is cached and recompiled under the same conditions as `validator()`.
+
+        Returns:
+            etree.XMLSchema: A schema that can be used for validation.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+        """
+        cache = getattr(self._thread_local_validators, 'cache', None)
+        if not self._validator_is_current(cache):
+            cache = (self._validator_dependencies(), self._compile_validator())
+            self._thread_local_validators.cache = cache
+
+        return cache[1]
+
+    @contextlib.contextmanager
+    def borrowed_validator(self):
+        """Borrow a schema that can be used for validation, which no other thread uses until it is returned.
+
+        Validators are returned to a pool that is shared with copies of the Schema. A validator is only compiled when every validator in the pool that was compiled from the current state of the Schema is in use.
+
+        Validators in the pool that were compiled from any other state are discarded.
+
+        Yields:
+            etree.XMLSchema: A schema that can be used for validation. It should not be used once it has been returned at the end of the `with` block.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+        """
+        cache = self._validator_pool.take(self)
+        try:
+            yield cache[1]
+        finally:
+            self._validator_pool.give_back(cache)
+
+
+class _ValidatorPool:
+    """A pool of compiled validators that are lent to one thread at a time."""
+
+    def __init__(self):
+        """Initialise an empty pool."""
+        self._lock = threading.Lock()
+        self._idle = list()
+
+    def take(self, schema):
+        """Take a validator for the current state of a Schema out of the pool, compiling one when none is available.
+
+        Args:
+            schema (iati.Schema): The Schema to take a validator for.
+
+        Returns:
+            tuple: A tuple in the format `(dependencies, validator)`, as cached by `Schema.validator()`.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+        """
+        with self._lock:
+            # validators that were compiled from another state are unlikely to be taken again, so are not kept
+            self._idle = [cache for cache in self._idle if schema._validator_is_current(cache)]  # pylint: disable=protected-access
+            if self._idle:
+                return self._idle.pop()
+
+        return (schema._validator_dependencies(), schema._compile_validator())  # pylint: disable=protected-access
+
+    def give_back(self, cache):
+        """Return a validator to the pool, so that it may be taken again.
+
+        Args:
+            cache (tuple): A tuple in the format returned by `take()`.
+
+        """
+        with self._lock:
+            self._idle.append(cache)
+
 
 class ActivitySchema(Schema):
     """Representation of an IATI Activity Schema as defined within the IATI SSOT."""
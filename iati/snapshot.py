@@ -0,0 +1,175 @@
+"""A module to build and load snapshots of the parsed content of the IATI Standard.
+
+Loading the default Codelists, Codelist Mappings and Rulesets requires a large number of resource files to be parsed.
+
+A snapshot holds the parsed content for every fully supported version of the Standard in a single file, which may be loaded far more quickly.
+
+A snapshot may be built with::
+
+    python -m iati.snapshot
+
+When a snapshot is present, `iati.default` takes content from it rather than loading resource files.
+
+The snapshot records the version of pyIATI that built it, along with the names, sizes and modification times of the resource files that it was built from. It is not used when any of these change, and must be built again.
+
+Warning:
+    A snapshot is a pickle. It should only be stored somewhere that cannot be written to by untrusted users.
+
+"""
+import os
+import pickle
+import tempfile
+import iati.default
+import iati.resources
+import iati.utilities
+import iati.version
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+"""The version of the snapshot format.
+
+This must be incremented whenever the structure of a snapshot, or of the classes pickled within it, changes without the version of pyIATI changing. Snapshots in other formats are not loaded.
+
+"""
+
+_UNPICKLING_ERRORS = (AttributeError, EOFError, ImportError, IndexError, OSError, TypeError, ValueError, pickle.UnpicklingError)
+"""The types of error that may be raised when unpickling a snapshot that is corrupt, or was created by an incompatible version of the library."""
+
+
+def default_path():
+    """Return the path at which the snapshot is stored by default.
+
+    Returns:
+        str: The path to the snapshot.
+
+    """
+    return iati.resources.create_lib_data_path(iati.resources.FILE_SNAPSHOT_NAME)
+
+
+def resources_fingerprint():
+    """Describe the resource files that make up the IATI Standard, so that changes to them may be detected.
+
+    Returns:
+        tuple of tuple: A sorted tuple of `(relative path, size, modification time)` tuples for all files within the Standard resources folder. Modification times are in nanoseconds.
+
+    Note:
+        The content of the files is not read, so checking the fingerprint is cheap.
+
+    """
+    base_path = iati.resources.resource_filesystem_path(iati.resources.BASE_PATH_STANDARD)
+    fingerprint = []
+
+    for dir_path, _, file_names in os.walk(base_path):
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            file_stat = os.stat(file_path)
+            fingerprint.append((os.path.relpath(file_path, base_path), file_stat.st_size, file_stat.st_mtime_ns))
+
+    return tuple(sorted(fingerprint))
+
+
+def _header():
+    """Return the header identifying a snapshot of the current resource files.
+
+    Returns:
+        dict: The snapshot format version, the version of pyIATI, and a fingerprint of the resource files.
+
+    """
+    return {'format_version': SNAPSHOT_FORMAT_VERSION, 'library_version': iati.__version__, 'resources_fingerprint': resources_fingerprint()}
+
+
+def build(path=None):
+    """Build a snapshot of the parsed content of the IATI Standard and write it to disk.
+
+    Args:
+        path (str): The path to write the snapshot to. Default is the path returned by `default_path()`.
+
+    Returns:
+        dict: The content of the snapshot. Keys are Decimal versions of the Standard as strings. Values are dictionaries in the format described below.
+
+    Raises:
+        OSError: When the snapshot cannot be written.
+
+    Note:
+        The content for each version has the keys `codelists`, `codelist_mapping` and `ruleset`.
+
+        These are a dictionary of frozen `iati.Codelist` instances keyed by name, an `iati.codelists.CodelistMapping`, and the pickled Standard `iati.Ruleset`, which is to be unpickled with `restore()`.
+
+        The snapshot is written to a temporary file that then replaces any existing snapshot, so a partially written snapshot is never loaded.
+
+    """
+    if path is None:
+        path = default_path()
+
+    content = dict()
+    for version in iati.version.STANDARD_VERSIONS_SUPPORTED:
+        codelist_paths = iati.resources.get_codelist_paths(version)
+        content[str(version)] = {
+            'codelists': {iati.default._codelist_name(codelist_path): iati.default._load_codelist(codelist_path) for codelist_path in codelist_paths},  # pylint: disable=protected-access
+            'codelist_mapping': iati.default._load_codelist_mapping(version),  # pylint: disable=protected-access
+            'ruleset': pickle.dumps(iati.default._load_ruleset(version), pickle.HIGHEST_PROTOCOL)  # pylint: disable=protected-access
+        }
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as snapshot_file:
+            pickle.dump(_header(), snapshot_file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(content, snapshot_file, pickle.HIGHEST_PROTOCOL)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return content
+
+
+def load(path=None):
+    """Load a snapshot of the parsed content of the IATI Standard.
+
+    A snapshot that was built from different resource files, by a different version of pyIATI, or in a different format, is not loaded.
+
+    Args:
+        path (str): The path to load the snapshot from. Default is the path returned by `default_path()`.
+
+    Returns:
+        dict or None: The content of the snapshot, in the format returned by `build()`. `None` when there is no snapshot, or it is out of date.
+
+    Note:
+        An out-of-date snapshot is left in place rather than rebuilt, since it may be stored somewhere that should not be written to while the library is in use. It may be rebuilt with `build()`.
+
+    """
+    if path is None:
+        path = default_path()
+
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, 'rb') as snapshot_file:
+            if pickle.load(snapshot_file) == _header():
+                return pickle.load(snapshot_file)
+    except _UNPICKLING_ERRORS:
+        pass
+
+    iati.utilities.log_warning('The snapshot of the IATI Standard at {0} is out of date, so is not used. It may be rebuilt with `python -m iati.snapshot`.'.format(path))
+    return None
+
+
+def restore(pickled_value):
+    """Restore a value that is stored pickled within a snapshot.
+
+    Values that are liable to be modified by callers are stored pickled so that each caller may be given a new instance.
+
+    Args:
+        pickled_value (bytes): The pickled value.
+
+    Returns:
+        object: A new instance of the value.
+
+    """
+    return pickle.loads(pickled_value)
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,321 @@
+"""A module to validate IATI XML files that are too large to be held in memory as a Dataset.
+
+A file is parsed incrementally. Each `iati-activity` or `iati-organisation` element is validated as soon as it has been parsed, then discarded.
+
+The memory required therefore depends on the size of the largest activity or organisation, rather than the size of the file.
+
+Usage::
+
+    schema = iati.default.activity_schema('2.02')
+    for error in iati.streaming.validate('/path/to/large-file.xml', schema):
+        print(error.name, error.line_number)
+
+"""
+import collections
+import copy
+from lxml import etree
+import iati.constants
+import iati.data
+import iati.rulesets
+import iati.validator
+
+
+MAX_LINE_LENGTH = 2 ** 16
+"""The maximum number of bytes of each line of source that is kept to provide context for errors. Longer lines, such as those within minified XML, are truncated."""
+
+
+class _SourceReader:
+    """A wrapper around a binary file that keeps the lines that have been read, so that errors may be given the source surrounding them.
+
+    Lines are kept until they are discarded. Only the source of the part of the file that is being validated therefore needs to be held in memory.
+
+    """
+
+    def __init__(self, source_file):
+        """Initialise the reader.
+
+        Args:
+            source_file (file): A file object, opened in binary mode.
+
+        """
+        self.encoding = 'utf-8'
+        self._file = source_file
+        self._lines = collections.deque()
+        self._first_line_number = 1
+        self._partial_line = bytearray()
+        self._pinned_lines = dict()
+
+    def read(self, size=-1):
+        """Read from the file, keeping the lines that are read.
+
+        Args:
+            size (int): The maximum number of bytes to read. Default is to read until the end of the file.
+
+        Returns:
+            bytes: The bytes that were read.
+
+        """
+        data = self._file.read(size)
+
+        line_start = 0
+        newline_position = data.find(b'\n')
+        while newline_position != -1:
+            self._extend_partial_line(data[line_start:newline_position])
+            self._lines.append(bytes(self._partial_line))
+            self._partial_line = bytearray()
+            line_start = newline_position + 1
+            newline_position = data.find(b'\n', line_start)
+        self._extend_partial_line(data[line_start:])
+
+        return data
+
+    def _extend_partial_line(self, data):
+        """Add data to the line that is being read, up to `MAX_LINE_LENGTH` bytes.
+
+        Args:
+            data (bytes): The data to add.
+
+        """
+        remaining_length = MAX_LINE_LENGTH - len(self._partial_line)
+        if remaining_length > 0:
+            self._partial_line.extend(data[:remaining_length])
+
+    def discard_lines_before(self, line_number):
+        """Discard the lines before the specified line, other than those that have been pinned.
+
+        Args:
+            line_number (int): A one-indexed line number. Lines before this are no longer kept.
+
+        """
+        while self._first_line_number < line_number and self._lines:
+            self._lines.popleft()
+            self._first_line_number += 1
+
+    def pin_lines(self, first_line_number, last_line_number):
+        """Keep the specified lines, even once they would otherwise be discarded.
+
+        Args:
+            first_line_number (int): A one-indexed line number for the first line to keep.
+            last_line_number (int): A one-indexed line number for the last line to keep.
+
+        """
+        for line_number in range(first_line_number, last_line_number + 1):
+            line = self._line(line_number)
+            if line is not None:
+                self._pinned_lines[line_number] = line
+
+    def _line(self, line_number):
+        """Return a line that has been read and is still kept.
+
+        Args:
+            line_number (int): A one-indexed line number.
+
+        Returns:
+            bytes or None: The line, without its newline. Part of the line when it has not been fully read. `None` when the line is not kept or has not been read.
+
+        """
+        if line_number in self._pinned_lines:
+            return self._pinned_lines[line_number]
+
+        index = line_number - self._first_line_number
+        if 0 <= index < len(self._lines):
+            return self._lines[index]
+        elif index == len(self._lines):
+            return bytes(self._partial_line)
+
+        return None
+
+    def source_around_line(self, line_number, surrounding_lines=1):
+        """Return the source at the specified line, plus the specified amount of surrounding context.
+
+        Args:
+            line_number (int): A one-indexed line number.
+            surrounding_lines (int): The number of lines of context to provide either side of the specified line number. Default 1.
+
+        Returns:
+            str: The source at the specified line, plus any of the surrounding lines that are kept. Lines are separated by newline characters.
+
+        """
+        lines = [self._line(context_line_number) for context_line_number in range(max(line_number - surrounding_lines, 1), line_number + surrounding_lines + 1)]
+
+        return b'\n'.join(line for line in lines if line is not None).decode(self.encoding, 'replace')
+
+
+class _StreamedDataset(iati.data.Dataset):
+    """A Dataset representing the part of a file that is held in memory while it is validated.
+
+    The tree contains the root element, along with the elements that have been parsed and not yet discarded.
+
+    Warning:
+        The XML source is not serialised from the tree. `xml_str` is `None` and source is instead provided from the file as it is read.
+
+    """
+
+    def __init__(self, root, source_reader):  # pylint: disable=super-init-not-called
+        """Initialise the Dataset.
+
+        Args:
+            root (etree._Element): The root element of the part of the file that is held in memory.
+            source_reader (iati.streaming._SourceReader): The reader that the file is being parsed from.
+
+        """
+        self._xml_str = None
+        self._xml_tree = root
+        self._line_offsets = None
+        self._parse_error_log = iati.validator.ValidationErrorLog()
+        self._source_reader = source_reader
+
+    def source_around_line(self, line_number, surrounding_lines=1):
+        """Return the value of the XML source at the specified line, plus the specified amount of surrounding context.
+
+        Args:
+            line_number (int): A one-indexed line number.
+            surrounding_lines (int): The number of lines of context to provide either side of the specified line number. Default 1.
+
+        Returns:
+            str: The source of the XML at the specified line, plus any of the surrounding lines that are still held in memory.
+
+        """
+        return self._source_reader.source_around_line(line_number, surrounding_lines)
+
+
+def validate(source, schema):
+    """Validate a file containing IATI XML against a Schema, one activity or organisation at a time.
+
+    Each `iati-activity` or `iati-organisation` element is checked against the Schema, its Codelists and its Rulesets as soon as it has been parsed. It is then discarded, so that memory use remains bounded regardless of the size of the file.
+
+    Args:
+        source (str or file): The path to a file, or a file object opened in binary mode.
+        schema (iati.Schema): The Schema to validate the file against.
+
+    Yields:
+        iati.validator.ValidationError: Each error that occurs.
+
+    Raises:
+        OSError: When the file cannot be read.
+
+    Note:
+        The errors have the same names and line numbers as those returned by `iati.validator.full_validation()` for a Dataset containing the same XML.
+
+        They are yielded in a different order. Errors within each activity or organisation are yielded once it has been parsed.
+
+        Errors for Rules are yielded once the whole file has been parsed, since a Rule must be checked against every activity or organisation before it is known to pass.
+
+        When the file is not well-formed XML, the errors for the problem are yielded and validation stops.
+
+    Warning:
+        Rules and Codelist mappings are checked against the root element and a single activity or organisation at a time. Paths that refer to other activities or organisations will not find them.
+
+        Elements other than activities or organisations that follow the first activity or organisation are not checked against the content model of the root element.
+
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as source_file:
+            yield from _validate_file(source_file, schema)
+    else:
+        yield from _validate_file(source, schema)
+
+
+def _validate_file(source_file, schema):
+    """Validate an open file containing IATI XML against a Schema, one activity or organisation at a time.
+
+    Args:
+        source_file (file): A file object, opened in binary mode.
+        schema (iati.Schema): The Schema to validate the file against.
+
+    Yields:
+        iati.validator.ValidationError: Each error that occurs.
+
+    """
+    source_reader = _SourceReader(source_file)
+    records = etree.iterparse(source_reader, events=('end',), tag=list(iati.constants.RECORD_TAGS.values()))
+    ruleset_results = [(ruleset, iati.rulesets._IncrementalResults(ruleset)) for ruleset in schema.rulesets]  # pylint: disable=protected-access
+    codelists_to_check = dict()
+    dataset = None
+
+    try:
+        for _, record in records:
+            root = record.getroottree().getroot()
+            if record.getparent() is not root or iati.constants.RECORD_TAGS.get(root.tag) != record.tag:
+                continue
+
+            if dataset is None:
+                error_log = _check_first_record(root, record, schema)
+                # the content of a root element that the Schema does not declare is not validated
+                validate_records = not error_log.contains_error_called('err-not-iati-xml-root-element-undeclared')
+
+                encoding = root.getroottree().docinfo.encoding
+                if encoding:
+                    source_reader.encoding = encoding
+                source_reader.pin_lines(root.sourceline - 1, root.sourceline + 1)
+
+                # the parser reads ahead, so each record is moved under a copy of the root element to be checked alone
+                dataset = _StreamedDataset(etree.Element(root.tag, root.attrib, root.nsmap), source_reader)
+            else:
+                source_reader.discard_lines_before(record.sourceline - 1)
+                error_log = iati.validator._check_is_iati_xml(dataset, schema, record) if validate_records else iati.validator.ValidationErrorLog()  # pylint: disable=protected-access
+
+            record_root = dataset.xml_tree.getroot()
+            record_root.append(record)
+
+            if schema.codelists:
+                # the version of the Dataset depends only on the version attributes of the root element and the record
+                version_key = (root.get('version'), record.get('version'))
+                if version_key not in codelists_to_check:
+                    codelists_to_check[version_key] = iati.validator._codelists_to_check(dataset, list(schema.codelists))  # pylint: disable=protected-access
+                error_log.extend(iati.validator._check_codelist_values(dataset, schema, record, codelists_to_check[version_key]))  # pylint: disable=protected-access
+            for _, results in ruleset_results:
+                results.check(dataset, record)
+
+            record_root.remove(record)
+
+            yield from error_log
+    except etree.XMLSyntaxError:
+        for log_entry in records.error_log:
+            yield iati.validator._create_error_for_lxml_log_entry(log_entry)  # pylint: disable=protected-access
+
+        # the parser does not log any errors when given an empty file, so this needs handling separately
+        if len(records.error_log) == 0:
+            err = 'A file or string containing no data is not XML.'  # used via `locals()` # pylint: disable=unused-variable
+            yield iati.validator.ValidationError('err-not-xml-empty-document', locals())
+        return
+
+    # check the root element, plus anything that is not an activity or organisation
+    records_found = dataset is not None
+    dataset = _StreamedDataset(records.root, source_reader)
+    if records_found:
+        error_log = iati.validator.ValidationErrorLog()
+    else:
+        # nothing has been discarded, so the whole file is validated at once
+        error_log = iati.validator._check_is_iati_xml(dataset, schema)  # pylint: disable=protected-access
+
+    error_log.extend(iati.validator._check_codelist_values(dataset, schema))  # pylint: disable=protected-access
+    for ruleset, results in ruleset_results:
+        results.check(dataset)
+        error_log.extend(iati.validator._check_rule_results(dataset, ruleset, {rule: (result, None) for rule, result in results.results().items()}))  # pylint: disable=protected-access
+
+    yield from error_log
+
+
+def _check_first_record(root, record, schema):
+    """Validate the root element of a file against a Schema, along with the content up to and including the first activity or organisation.
+
+    The root element may not be validated alone, since the Schema requires it to contain at least one activity or organisation.
+
+    Args:
+        root (etree._Element): The root element of the file.
+        record (etree._Element): The first activity or organisation within the root element.
+        schema (iati.Schema): The Schema to validate against.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+    Note:
+        The parser reads ahead, so the root element may already contain later activities or organisations. A copy is validated, with these removed. Copies keep the line numbers of the original elements.
+
+    """
+    root_copy = copy.deepcopy(root)
+    for later_element in root_copy[root.index(record) + 1:]:
+        root_copy.remove(later_element)
+
+    return iati.validator._check_is_iati_xml(None, schema, root_copy)  # pylint: disable=protected-access
@@ -1,8 +1,12 @@
 """A module containing tests for the library representation of Codelists."""
 import copy
+import pickle
 import pytest
 from lxml import etree
 import iati.codelists
+import iati.default
+import iati.tests.resources
+import iati.utilities
 
 
 class TestCodelistsNonClass:
@@ -15,6 +19,146 @@ class TestCodelistsNonClass:
     pass
 
 
+class TestCodelistMapping:
+    """A container for tests relating to Codelist Mappings."""
+
+    @pytest.fixture
+    def mapping_xml(self):
+        """Return the XML for a Codelist Mapping file."""
+        return """<mappings>
+            <mapping>
+                <path>//iati-activity/sector/@code</path>
+                <codelist ref="Sector" />
+                <condition>@vocabulary = '1' or not(@vocabulary)</condition>
+            </mapping>
+            <mapping>
+                <path>//iati-activity/sector/@vocabulary</path>
+                <codelist ref="SectorVocabulary" />
+            </mapping>
+            <mapping>
+                <path>//@xml:lang</path>
+                <codelist ref="Language" />
+            </mapping>
+            <mapping>
+                <path>//iati-activity/transaction/provider-org/@crs-channel-code</path>
+                <codelist ref="CRSChannelCode" />
+            </mapping>
+            <mapping>
+                <path>//iati-activity/crs-add/channel-code/text()</path>
+                <codelist ref="CRSChannelCode" />
+            </mapping>
+        </mappings>"""
+
+    @pytest.fixture
+    def mapping(self, mapping_xml):
+        """Return a Codelist Mapping."""
+        return iati.codelists.CodelistMapping(mapping_xml)
+
+    def test_codelist_mapping_index(self, mapping):
+        """Check that mappings are indexed by the name of the Codelist they are for."""
+        assert len(mapping) == 4
+        assert set(mapping) == set(['Sector', 'SectorVocabulary', 'Language', 'CRSChannelCode'])
+        assert [entry.xpath for entry in mapping['CRSChannelCode']] == ['//iati-activity/transaction/provider-org/@crs-channel-code', '//iati-activity/crs-add/channel-code/text()']
+        assert mapping['NotACodelist'] == ()
+
+    def test_codelist_mapping_entry_attributes(self, mapping):
+        """Check that the parts of each mapping are identified."""
+        sector_mapping = mapping['Sector'][0]
+        text_mapping = mapping['CRSChannelCode'][1]
+
+        assert sector_mapping.condition == "@vocabulary = '1' or not(@vocabulary)"
+        assert isinstance(sector_mapping.condition_xpath, etree.XPath)
+        assert sector_mapping.attr_name == 'code'
+        assert sector_mapping.el_name is None
+        assert mapping['SectorVocabulary'][0].condition is None
+        assert mapping['SectorVocabulary'][0].condition_xpath is None
+        assert text_mapping.attr_name is None
+        assert text_mapping.el_name == 'channel-code'
+
+    def test_codelist_mapping_as_dict(self, mapping):
+        """Check that a Codelist Mapping can be output in dictionary format."""
+        mapping_dict = mapping.as_dict()
+
+        assert mapping_dict['Sector'] == [{'xpath': '//iati-activity/sector/@code', 'condition': "@vocabulary = '1' or not(@vocabulary)"}]
+        assert mapping_dict['NotACodelist'] == []
+
+    def test_codelist_mapping_extract_codes(self, mapping):
+        """Check that codes are extracted from the locations specified by the mapping, taking account of conditions."""
+        tree = etree.fromstring("""<iati-activities xml:lang="en">
+            <iati-activity>
+                <sector code="111" />
+                <sector code="222" vocabulary="2" />
+                <crs-add><channel-code>333</channel-code></crs-add>
+            </iati-activity>
+        </iati-activities>""").getroottree()
+
+        assert mapping['Sector'][0].extract_codes(tree) == [('111', 3)]
+        assert mapping['Language'][0].extract_codes(tree) == [('en', 1)]
+        assert mapping['CRSChannelCode'][1].extract_codes(tree) == [('333', 5)]
+
+    def test_codelist_mapping_locate_codes_matches_extract_codes(self, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that locating codes for all mappings in a single pass finds the same values as extracting them with each mapping's XPath."""
+        mapping = iati.default._codelist_mapping(std_ver_minor_mixedinst_valid_fullsupport)  # pylint: disable=protected-access
+        paths = iati.tests.resources.get_test_data_paths_in_folder('ssot-activity-xml-pass', std_ver_minor_mixedinst_valid_fullsupport) + iati.tests.resources.get_test_data_paths_in_folder('ssot-org-xml-pass', std_ver_minor_mixedinst_valid_fullsupport)
+
+        for path in paths:
+            tree = iati.utilities.load_as_tree(path)
+            located_codes = mapping.locate_codes(tree)
+
+            for codelist_name in mapping:
+                for entry in mapping[codelist_name]:
+                    assert located_codes[entry] == entry.extract_codes(tree)
+
+    def test_codelist_mapping_locate_codes_for_named_codelists(self, mapping):
+        """Check that codes may be located for a subset of Codelists."""
+        tree = etree.fromstring('<iati-activity xml:lang="en"><sector code="111" vocabulary="1" /></iati-activity>').getroottree()
+
+        located_codes = mapping.locate_codes(tree, ['Sector', 'Sector'])
+
+        assert list(located_codes.keys()) == list(mapping['Sector'])
+        assert located_codes[mapping['Sector'][0]] == [('111', 1)]
+
+    def test_codelist_mapping_iter_located_codes(self, mapping):
+        """Check that located values are yielded in document order, along with the mapping that located each."""
+        tree = etree.fromstring('<iati-activity xml:lang="en"><sector code="111" vocabulary="1" /><sector code="112" vocabulary="1" /></iati-activity>').getroottree()
+
+        located_codes = list(mapping.iter_located_codes(tree, ['Sector']))
+
+        assert located_codes == [(mapping['Sector'][0], '111', 1), (mapping['Sector'][0], '112', 1)]
+
+    def test_codelist_mapping_dispatch_keys(self, mapping):
+        """Check that mappings are keyed by the element tag and attribute that values are located at."""
+        assert mapping['Sector'][0].dispatch_key == ('sector', 'code')
+        assert mapping['Language'][0].dispatch_key == (None, '{http://www.w3.org/XML/1998/namespace}lang')
+        assert mapping['CRSChannelCode'][1].dispatch_key == ('channel-code', None)
+
+    @pytest.mark.parametrize('xpath', [
+        '//iati-activity/*/@code',
+        '//iati-activity/sector[1]/@code',
+        '/iati-activities/iati-activity/title/text()'
+    ])
+    def test_codelist_mapping_complex_path_uses_xpath(self, xpath):
+        """Check that mappings with paths that cannot be matched element-by-element are located using XPath."""
+        mapping_xml = '<mappings><mapping><path>{0}</path><codelist ref="Test" /></mapping></mappings>'.format(xpath)
+        mapping = iati.codelists.CodelistMapping(mapping_xml)
+        tree = etree.fromstring('<iati-activities><iati-activity><title>A</title><sector code="1" /><sector code="2" /></iati-activity></iati-activities>').getroottree()
+
+        assert mapping['Test'][0].dispatch_key is None
+        assert mapping.locate_codes(tree)[mapping['Test'][0]] == mapping['Test'][0].extract_codes(tree)
+
+    def test_codelist_mapping_invalid_xpath(self):
+        """Check that an invalid XPath within a mapping causes an error when the mapping is created."""
+        with pytest.raises(etree.XPathSyntaxError):
+            iati.codelists.CodelistMappingEntry('Sector', '//iati-activity/sector[/@code')
+
+    def test_codelist_mapping_unsupported_path(self):
+        """Check that a mapping that does not locate an attribute or element text cannot be used to extract codes."""
+        mapping = iati.codelists.CodelistMappingEntry('Sector', '//iati-activity/sector')
+
+        with pytest.raises(ValueError):
+            mapping.extract_codes(etree.fromstring('<iati-activity />').getroottree())
+
+
 class TestCodelists:
     """A container for tests relating to Codelists."""
 
@@ -51,6 +195,159 @@ class TestCodelists:
 
         assert num_codes == 1
 
+    def test_codelist_code_values(self, name_to_set):
+        """Check that the values of Codes on a Codelist stay in sync as Codes are added and removed."""
+        codelist = iati.Codelist(name_to_set)
+        code = iati.Code('1')
+
+        assert codelist.code_values == frozenset()
+
+        codelist.codes.add(code)
+        codelist.codes.add(iati.Code('2'))
+        assert codelist.code_values == frozenset(['1', '2'])
+
+        codelist.codes.remove(code)
+        assert codelist.code_values == frozenset(['2'])
+
+        codelist.codes = [iati.Code('3')]
+        assert codelist.code_values == frozenset(['3'])
+
+    def test_codelist_invalid_values(self, name_to_set):
+        """Check that values not on a Codelist are returned with the number of times they occur."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.update([iati.Code('1'), iati.Code('2')])
+
+        invalid_values = codelist.invalid_values(['1', '3', '2', '4', '3', None])
+
+        assert invalid_values == {'3': 2, '4': 1, None: 1}
+
+    def test_codelist_hash_changes_after_modification(self, name_to_set):
+        """Check that the hash of a Codelist is recomputed after Codes are added."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        original_hash = hash(codelist)
+
+        codelist.codes.add(iati.Code('2'))
+
+        equivalent_codelist = iati.Codelist(name_to_set)
+        equivalent_codelist.codes = [iati.Code('2'), iati.Code('1')]
+
+        assert hash(codelist) != original_hash
+        assert hash(codelist) == hash(equivalent_codelist)
+
+    @pytest.mark.parametrize('modify', [
+        lambda codelist: codelist.codes.add(iati.Code('2')),
+        lambda codelist: codelist.codes.pop(),
+        lambda codelist: codelist.codes.clear(),
+        lambda codelist: codelist.codes.update([iati.Code('2')])
+    ])
+    def test_codelist_frozen_codes_cannot_be_modified(self, name_to_set, modify):
+        """Check that the Codes on a frozen Codelist cannot be modified."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        codelist.freeze()
+
+        with pytest.raises(TypeError):
+            modify(codelist)
+
+        assert codelist.code_values == frozenset(['1'])
+
+    @pytest.mark.parametrize('attr_name, value', [
+        ('name', 'a different name'),
+        ('complete', True),
+        ('codes', set())
+    ])
+    def test_codelist_frozen_attributes_cannot_be_set(self, name_to_set, attr_name, value):
+        """Check that the attributes of a frozen Codelist cannot be set."""
+        codelist = iati.Codelist(name_to_set).freeze()
+
+        with pytest.raises(AttributeError):
+            setattr(codelist, attr_name, value)
+
+        assert codelist.frozen
+
+    def test_codelist_frozen_equal_to_mutable(self, name_to_set):
+        """Check that freezing a Codelist does not change its equality or hash, and that copies remain frozen."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        frozen_codelist = copy.deepcopy(codelist).freeze()
+        frozen_copy = copy.deepcopy(frozen_codelist)
+
+        assert frozen_codelist == codelist
+        assert hash(frozen_codelist) == hash(codelist)
+        assert frozen_copy.frozen
+        assert frozen_copy == frozen_codelist
+
+    def test_codelist_pickle_recomputes_hash(self, name_to_set):
+        """Check that the hash of a Codelist is recomputed after unpickling, since a hash computed with another hash seed would differ."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        codelist.freeze()
+        codelist._codes._hash_key = 12345  # pylint: disable=protected-access
+
+        unpickled_codelist = pickle.loads(pickle.dumps(codelist))
+        equal_codelist = iati.Codelist(name_to_set)
+        equal_codelist.codes.add(iati.Code('1'))
+
+        assert unpickled_codelist.frozen
+        assert unpickled_codelist == equal_codelist
+        assert hash(unpickled_codelist) == hash(equal_codelist)
+
+    def test_codelist_copy_shares_codes_until_modified(self, name_to_set):
+        """Check that a copy of a Codelist shares Codes with the original until either is modified."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.update([iati.Code('1'), iati.Code('2')])
+        codelist_copy = copy.copy(codelist)
+
+        assert codelist_copy == codelist
+        assert codelist_copy.code_values is codelist.code_values
+
+        codelist.codes.add(iati.Code('3'))
+        codelist_copy.codes.pop().name = 'a modified name'
+
+        assert codelist.code_values == frozenset(['1', '2', '3'])
+        assert len(codelist_copy.codes) == 1
+        assert all(code.name == '' for code in codelist.codes)
+
+    def test_codelist_frozen_code_attributes_cannot_be_set(self, name_to_set):
+        """Check that the attributes of Codes within a frozen Codelist, and within copies that share them, cannot be set."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        codelist.freeze()
+        codelist_copy = copy.copy(codelist)
+
+        for code in list(codelist.codes) + list(codelist_copy.codes):
+            assert code.frozen
+            with pytest.raises(AttributeError):
+                code.value = '2'
+
+        assert all(code.frozen for code in copy.deepcopy(codelist).codes)
+        assert all(code.frozen for code in pickle.loads(pickle.dumps(codelist)).codes)
+        assert codelist.code_values == frozenset(['1'])
+
+    def test_codelist_freezing_copy_does_not_freeze_original_codes(self, name_to_set):
+        """Check that freezing a copy of a Codelist does not freeze the Codes of the original."""
+        codelist = iati.Codelist(name_to_set)
+        codelist.codes.add(iati.Code('1'))
+        copy.copy(codelist).freeze()
+
+        code = next(iter(codelist.codes))
+        code.name = 'a modified name'
+
+        assert not code.frozen
+
+    def test_codelist_copy_of_frozen_codelist_is_not_frozen(self, name_to_set):
+        """Check that a copy of a frozen Codelist may be modified without affecting the frozen Codelist."""
+        codelist = iati.Codelist(name_to_set).freeze()
+        codelist_copy = copy.copy(codelist)
+
+        codelist_copy.codes.add(iati.Code('1'))
+        codelist_copy.name = 'a different name'
+
+        assert not codelist_copy.frozen
+        assert codelist.name == name_to_set
+        assert len(codelist.codes) == 0
+
     @pytest.mark.xfail
     def test_codelist_add_code_decline_non_code(self, name_to_set):
         """Check something that is not a Code cannot be added to a Codelist."""
@@ -148,6 +445,24 @@ class TestCodes:
         assert code.name == name_to_set
         assert code.value == value_to_set
 
+    def test_code_compact(self):
+        """Check that a Code stores its attributes without a per-instance dictionary."""
+        code = iati.Code('test Code value')
+
+        assert not hasattr(code, '__dict__')
+        assert code._description is None  # pylint: disable=protected-access
+
+    def test_code_copy_of_frozen_code_is_not_frozen(self):
+        """Check that a copy of a frozen Code may be modified without affecting the frozen Code."""
+        code = iati.Code('test Code value', 'test Code name').freeze()
+        code_copy = copy.copy(code)
+
+        code_copy.name = 'a different name'
+
+        assert code.frozen
+        assert not code_copy.frozen
+        assert code.name == 'test Code name'
+
     def test_code_enumeration_element(self):
         """Check that a Code correctly outputs an enumeration element.
 
@@ -98,6 +98,19 @@ class TestDatasets:
 
         assert data.xml_str == xml_str.strip()
 
+    def test_dataset_parse_error_log_from_string(self):
+        """Test that a Dataset created from a string records that no errors were found when parsing it."""
+        data = iati.Dataset(iati.tests.resources.load_as_string('valid_not_iati'))
+
+        assert isinstance(data.parse_error_log, iati.validator.ValidationErrorLog)
+        assert not data.parse_error_log.contains_errors()
+
+    def test_dataset_parse_error_log_from_tree(self):
+        """Test that a Dataset created from a tree records that no errors were found when parsing it."""
+        data = iati.Dataset(iati.tests.utilities.XML_TREE_VALID)
+
+        assert data.parse_error_log == iati.validator.ValidationErrorLog()
+
     def test_dataset_xml_str_assignment_invalid_str(self, dataset_initialised):
         """Test assignment to the xml_str property with an invalid XML string."""
         xml_str = iati.tests.resources.load_as_string('invalid')
@@ -487,6 +500,36 @@ class TestDatasetSourceFinding:
             with pytest.raises(TypeError):
                 data.source_around_line(line_num, invalid_value)
 
+    def test_dataset_source_line_offsets_are_cached(self, data):
+        """Test that the line offsets for a Dataset are only calculated once."""
+        line_offsets = data._source_line_offsets()  # pylint: disable=protected-access
+
+        assert data._source_line_offsets() is line_offsets  # pylint: disable=protected-access
+
+    def test_dataset_source_updated_after_xml_str_assignment(self):
+        """Test that source finding reflects new content after assignment to the xml_str property."""
+        data = iati.tests.resources.load_as_dataset('valid_not_iati')
+        data.source_at_line(1)
+        new_xml_str = '<first-line>\n<second-line />\n</first-line>'
+
+        data.xml_str = new_xml_str
+
+        assert data.source_at_line(2) == '<second-line />'
+        assert data.source_around_line(2, 5) == new_xml_str
+        with pytest.raises(ValueError):
+            data.source_at_line(4)
+
+    def test_dataset_source_updated_after_xml_tree_assignment(self):
+        """Test that source finding reflects new content after assignment to the xml_tree property."""
+        data = iati.tests.resources.load_as_dataset('valid_not_iati')
+        data.source_at_line(1)
+
+        data.xml_tree = etree.fromstring('<first-line><second-line /></first-line>')
+
+        assert data.source_at_line(1) == '<first-line>'
+        assert data.source_at_line(2) == '<second-line/>'
+        assert data.source_around_line(2, 0) == '  <second-line/>'
+
 
 class TestDatasetVersionDetection:
     """A container for tests relating to detecting the version of a Dataset."""
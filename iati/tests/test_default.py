@@ -1,4 +1,5 @@
 """A module containing tests for the library representation of default values."""
+import threading
 import pytest
 import iati.codelists
 import iati.constants
@@ -150,6 +151,19 @@ class TestDefaultCodelists:
             for code in codelist.codes:
                 assert code.name == ''
 
+    def test_default_codelists_cached(self, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that the default Codelists are loaded once, with each call returning copies that share the cached Codes."""
+        codelists = iati.default.codelists(std_ver_minor_mixedinst_valid_fullsupport)
+        codelists_again = iati.default.codelists(std_ver_minor_mixedinst_valid_fullsupport)
+        cached_codelists = iati.default._codelists(std_ver_minor_mixedinst_valid_fullsupport, True)  # pylint: disable=protected-access
+
+        assert codelists == codelists_again
+        for name, codelist in codelists.items():
+            assert codelist is not codelists_again[name]
+            assert codelist.code_values is cached_codelists[name].code_values
+            assert not codelist.frozen
+            assert cached_codelists[name].frozen
+
     def test_codelists_in_mapping_exist(self, std_ver_minor_inst_valid_fullsupport):
         """Check that the Codelists mentioned in a Codelist mapping file at a given version actually exist."""
         codelist_names = iati.default.codelists(std_ver_minor_inst_valid_fullsupport).keys()
@@ -170,6 +184,20 @@ class TestDefaultCodelists:
         assert mapping['Sector'][0]['condition'] == "@vocabulary = '1' or not(@vocabulary)"
         assert mapping['Version'][0]['condition'] is None
 
+    def test_codelist_mapping_cached(self, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that the compiled Codelist mapping for a version is only loaded once."""
+        mapping = iati.default._codelist_mapping(std_ver_minor_mixedinst_valid_fullsupport)  # pylint: disable=protected-access
+
+        assert isinstance(mapping, iati.codelists.CodelistMapping)
+        assert iati.default._codelist_mapping(std_ver_minor_mixedinst_valid_fullsupport) is mapping  # pylint: disable=protected-access
+
+    def test_codelist_mapping_modification_does_not_affect_cache(self):
+        """Check that modifying a returned Codelist mapping does not modify the mapping returned by later calls."""
+        mapping = iati.default.codelist_mapping('2.02')
+        mapping['Version'].append({'xpath': '//iati-activities/@other', 'condition': None})
+
+        assert len(iati.default.codelist_mapping('2.02')['Version']) == len(mapping['Version']) - 1
+
     def test_codelist_mapping_xpath(self, std_ver_minor_mixedinst_valid_fullsupport):
         """Check that the Codelist mapping file is being read for both org and activity mappings.
 
@@ -204,6 +232,29 @@ class TestDefaultCodelists:
         assert len(codelists) == codelist_lengths_by_version.expected_length
 
 
+class TestDefaultWarmup:
+    """A container for tests relating to loading default data ahead of time."""
+
+    def test_warmup(self, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that warming up a version loads its default data into the caches."""
+        iati.default.warmup([std_ver_minor_mixedinst_valid_fullsupport])
+        version = iati.version._decimalise_integer(iati.version._normalise_decimal_version(std_ver_minor_mixedinst_valid_fullsupport))  # pylint: disable=protected-access
+
+        assert version in iati.default._CODELIST_MAPPINGS  # pylint: disable=protected-access
+        assert len(iati.default._CODELISTS[version]) > 0  # pylint: disable=protected-access
+        assert version in iati.default._RULESETS  # pylint: disable=protected-access
+        for population_key in ['populated', 'unpopulated']:
+            schemas = iati.default._SCHEMAS[version][population_key]  # pylint: disable=protected-access
+            assert set(schemas.keys()) == set([iati.ActivitySchema.ROOT_ELEMENT_NAME, iati.OrganisationSchema.ROOT_ELEMENT_NAME])
+
+        assert iati.default._SCHEMAS[version]['populated'][iati.ActivitySchema.ROOT_ELEMENT_NAME].rulesets == set([iati.default._RULESETS[version]])  # pylint: disable=protected-access
+
+    def test_warmup_invalid_version(self, std_ver_minor_uninst_valueerr_str_decimal):
+        """Check that warming up an invalid version raises an error."""
+        with pytest.raises(ValueError):
+            iati.default.warmup([std_ver_minor_uninst_valueerr_str_decimal])
+
+
 class TestDefaultRulesets:
     """A container for tests relating to default Rulesets."""
 
@@ -218,6 +269,36 @@ class TestDefaultRulesets:
 
         assert isinstance(ruleset, iati.Ruleset)
 
+    def test_default_ruleset_cached(self, monkeypatch, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that the default Ruleset is loaded once per version, with each call returning an equal copy of the cached Ruleset."""
+        iati.default.ruleset(std_ver_minor_mixedinst_valid_fullsupport)
+        monkeypatch.setattr(iati.default, '_load_ruleset', pytest.fail)
+        monkeypatch.setattr(iati.default, '_snapshot_version', pytest.fail)
+
+        ruleset = iati.default.ruleset(std_ver_minor_mixedinst_valid_fullsupport)
+        other_ruleset = iati.default.ruleset(std_ver_minor_mixedinst_valid_fullsupport)
+
+        assert ruleset == other_ruleset
+        assert ruleset is not other_ruleset
+        assert iati.default._ruleset(std_ver_minor_mixedinst_valid_fullsupport) is iati.default._ruleset(std_ver_minor_mixedinst_valid_fullsupport)  # pylint: disable=protected-access
+
+    def test_default_ruleset_modification(self, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that removing Rules from a default Ruleset does not affect the cached Ruleset."""
+        ruleset = iati.default.ruleset(std_ver_minor_mixedinst_valid_fullsupport)
+        base_ruleset_length = len(ruleset.rules)
+
+        ruleset.rules.clear()
+
+        assert len(iati.default.ruleset(std_ver_minor_mixedinst_valid_fullsupport).rules) == base_ruleset_length
+
+    def test_default_ruleset_schema_copy(self):
+        """Check that modifying the default Ruleset schema does not affect the schema used to create Rulesets."""
+        schema = iati.default.ruleset_schema()
+        schema['patternProperties'] = dict()
+
+        assert iati.default.ruleset_schema()['patternProperties'] != dict()
+        assert iati.default.ruleset_schema() == iati.default.ruleset_schema()
+
     @pytest.mark.fixed_to_202
     def test_default_ruleset_validation_rules_valid(self, schema_ruleset):
         """Check that a fully valid IATI file does not raise any type of error (including rules/rulesets)."""
@@ -280,6 +361,36 @@ class TestDefaultRulesets:
 class TestDefaultSchemas:
     """A container for tests relating to default Schemas."""
 
+    @pytest.mark.parametrize('schema_func', [
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    @pytest.mark.parametrize('populate', [True, False])
+    def test_default_schemas_cached(self, schema_func, populate, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that default Schemas are built once, with each call returning a copy that shares the cached base tree."""
+        schema = schema_func(std_ver_minor_mixedinst_valid_fullsupport, populate)
+        schema_again = schema_func(std_ver_minor_mixedinst_valid_fullsupport, populate)
+
+        assert schema is not schema_again
+        assert schema.codelists is not schema_again.codelists
+        assert schema._schema_base_tree is schema_again._schema_base_tree  # pylint: disable=protected-access
+
+    @pytest.mark.fixed_to_202
+    def test_default_schema_concurrent_first_access(self):
+        """Check that a default Schema requested by a number of threads at the same time is built once."""
+        version = iati.Version('2.02')
+        iati.default._SCHEMAS[version]['populated'].pop(iati.ActivitySchema.ROOT_ELEMENT_NAME, None)  # pylint: disable=protected-access
+        schemas = []
+        threads = [threading.Thread(target=lambda: schemas.append(iati.default.activity_schema(version))) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(schemas) == 8
+        assert len({id(schema._schema_base_tree) for schema in schemas}) == 1  # pylint: disable=protected-access
+
     def test_default_activity_schemas(self, std_ver_minor_mixedinst_valid_fullsupport):
         """Check that the default ActivitySchemas are correct.
 
@@ -362,6 +473,36 @@ class TestDefaultModifications:
         assert len(default_codelist.codes) == base_default_codelist_length + 1
         assert len(unmodified_codelist.codes) == base_default_codelist_length
 
+    @pytest.mark.parametrize('modify', [
+        lambda codelist: codelist.codes.pop(),
+        lambda codelist: codelist.codes.clear(),
+        lambda codelist: codelist.codes.pop().__setattr__('name', 'a modified name')
+    ])
+    def test_default_codelist_modification_copy_on_write(self, codelist_name, modify, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that default Codelists share Codes until modified, and that modifying them does not affect the Codes of other default Codelists."""
+        default_codelist = iati.default.codelist(codelist_name, std_ver_minor_mixedinst_valid_fullsupport)
+        unmodified_codelist = iati.default.codelist(codelist_name, std_ver_minor_mixedinst_valid_fullsupport)
+        original_codes = {(code.value, code.name) for code in unmodified_codelist.codes}
+
+        assert default_codelist.code_values is unmodified_codelist.code_values
+
+        modify(default_codelist)
+
+        assert default_codelist != unmodified_codelist
+        assert {(code.value, code.name) for code in unmodified_codelist.codes} == original_codes
+        assert iati.default.codelist(codelist_name, std_ver_minor_mixedinst_valid_fullsupport) == unmodified_codelist
+
+    @pytest.mark.parametrize('attr_name', ['name', 'value'])
+    def test_default_codelist_shared_code_modification(self, codelist_name, attr_name, std_ver_minor_mixedinst_valid_fullsupport):
+        """Check that a Code shared between a default Codelist and the cache cannot be modified in place."""
+        default_codelist = iati.default.codelist(codelist_name, std_ver_minor_mixedinst_valid_fullsupport)
+        original_codes = {(code.value, code.name) for code in default_codelist.codes}
+
+        with pytest.raises(AttributeError):
+            setattr(next(iter(default_codelist.codes)), attr_name, 'a modified value')
+
+        assert {(code.value, code.name) for code in iati.default.codelist(codelist_name, std_ver_minor_mixedinst_valid_fullsupport).codes} == original_codes
+
     def test_default_codelists_modification(self, codelist_name, new_code, std_ver_minor_mixedinst_valid_fullsupport):
         """Check that default Codelists cannot be modified by adding Codes to returned lists with default parameters."""
         default_codelists = iati.default.codelists(std_ver_minor_mixedinst_valid_fullsupport)
@@ -3,6 +3,8 @@ import collections
 from decimal import Decimal
 import os
 import re
+import subprocess
+import sys
 import pytest
 import iati.constants
 import iati.resources
@@ -100,6 +102,20 @@ class TestResourceFilesystemPaths:
         assert full_path != ''
         assert os.path.isdir(full_path)
 
+    def test_resource_filesystem_path_package_location(self):
+        """Check that resources are located relative to the installed IATI package."""
+        full_path = iati.resources.resource_filesystem_path(iati.resources.BASE_PATH_STANDARD)
+
+        assert iati.resources.resource_filesystem_path('') == os.path.dirname(os.path.abspath(iati.__file__))
+        assert os.path.isdir(full_path)
+
+    @pytest.mark.parametrize('module_name', ['chardet', 'jsonschema', 'pkg_resources', 'yaml'])
+    def test_import_does_not_load_slow_dependencies(self, module_name):
+        """Check that importing the library does not import dependencies that are slow to import and only required by some functionality."""
+        statement = 'import sys, iati; sys.exit({0!r} in sys.modules)'.format(module_name)
+
+        assert subprocess.call([sys.executable, '-c', statement]) == 0
+
 
 class TestResourceLibData:
     """A container for tests relating to handling paths for pyIATI library-specific data."""
@@ -463,6 +479,30 @@ class TestResourceGetCodelistPaths:
         assert result == []
 
 
+class TestResourceIndex:
+    """A container for tests relating to the index of resource files that make up the IATI Standard."""
+
+    def test_resource_index_paths(self, std_ver_minor_inst_valid_fullsupport):
+        """Check that the resource index contains the paths that the path creation functions return for files that exist."""
+        index = iati.resources._resource_index()  # pylint: disable=protected-access
+        folder_name = iati.resources.folder_name_for_version(std_ver_minor_inst_valid_fullsupport)
+        codelist_files = index[(folder_name, iati.resources.PATH_CODELISTS)]
+
+        assert codelist_files['Country.xml'] == iati.resources.create_codelist_path('Country', std_ver_minor_inst_valid_fullsupport)
+        assert index[(folder_name, '')]['codelist-mapping.xml'] == iati.resources.create_codelist_mapping_path(std_ver_minor_inst_valid_fullsupport)
+        for path in codelist_files.values():
+            assert os.path.isfile(path)
+
+    def test_resource_index_built_once(self, monkeypatch):
+        """Check that the filesystem is only read when the resource index is first required."""
+        index = iati.resources._resource_index()  # pylint: disable=protected-access
+        monkeypatch.setattr(os, 'walk', None)
+
+        assert iati.resources._resource_index() is index  # pylint: disable=protected-access
+        assert iati.resources.get_codelist_paths('2.02')
+        assert iati.resources.get_activity_schema_paths('2.02')
+
+
 class TestResourceGetCodelistMappingPaths:
     """A container for get_codelist_mapping_paths() tests.
 
@@ -578,6 +618,17 @@ class TestResourceGetSchemaPaths:
         assert result[0] == iati.resources.create_schema_path(func_and_name.schema_name, std_ver_minor_mixedinst_valid_known)
         assert os.path.isfile(result[0])
 
+    def test_get_schema_paths_from_resource_index(self, std_ver_minor_mixedinst_valid_known, func_and_name, monkeypatch):
+        """Test that Schema paths are taken from the resource index rather than being created and checked."""
+        expected_path = iati.resources.create_schema_path(func_and_name.schema_name, std_ver_minor_mixedinst_valid_known)
+
+        def create_schema_path(name, version):
+            raise AssertionError('A Schema path was created.')
+
+        monkeypatch.setattr(iati.resources, 'create_schema_path', create_schema_path)
+
+        assert func_and_name.func(std_ver_minor_mixedinst_valid_known) == [expected_path]
+
     def test_get_schema_paths_minor_unknown(self, std_ver_all_mixedinst_valid_unknown, schema_path_func_all):
         """Test getting a list of Org or Activity Schema paths. The requested version is not known by pyIATI."""
         result = schema_path_func_all(std_ver_all_mixedinst_valid_unknown)
@@ -0,0 +1,264 @@
+"""A module containing tests for compiling Rulesets into XSLT stylesheets."""
+import collections
+from copy import copy, deepcopy
+import gc
+import weakref
+import pytest
+import iati.data
+import iati.default
+import iati.ruleset_xslt
+import iati.rulesets
+import iati.tests.resources
+import iati.tests.test_rulesets as rule_tests
+import iati.tests.utilities
+import iati.utilities
+
+
+RULE_TEST_CLASSES = {
+    'atleast_one': rule_tests.TestRuleAtLeastOne,
+    'date_order': rule_tests.TestRuleDateOrder,
+    'dependent': rule_tests.TestRuleDependent,
+    'no_more_than_one': rule_tests.TestRuleNoMoreThanOne,
+    'regex_matches': rule_tests.TestRuleRegexMatches,
+    'regex_no_matches': rule_tests.TestRuleRegexNoMatches,
+    'startswith': rule_tests.TestRuleStartsWith,
+    'sum': rule_tests.TestRuleSum,
+    'unique': rule_tests.TestRuleUnique
+}
+"""The containers of tests for each type of Rule, which provide cases to check conformance with."""
+
+RULE_CASES = [(rule_type, case) for rule_type, test_class in sorted(RULE_TEST_CLASSES.items()) for case in test_class.all_valid_cases + test_class.invalidating_cases]
+"""Each type of Rule, with each case that is used to test Rules of that type."""
+
+CONTEXTS = ['//root_element', '//nest', '//non-existent-context', '//*', '//@*']
+"""Contexts to check each case within."""
+
+CONDITIONS = [None, 'count(condition)>0', 'condition', 'nocondition', 'count(condition)', '"a string"']
+"""Conditions to check each case with, of each XPath type."""
+
+EDGE_CASE_DATASET = iati.data.Dataset('''<root_element>
+  <date>2017-01-01</date>
+  <date-padded>2017-1-01</date-padded>
+  <date-leap>2016-02-29</date-leap>
+  <date-not-leap>2017-02-29</date-not-leap>
+  <date-century>1900-02-29</date-century>
+  <date-invalid-month>2017-13-01</date-invalid-month>
+  <date-year-zero>0000-01-01</date-year-zero>
+  <date-short>2017-01</date-short>
+  <date-timezone>2017-01-01+23:59</date-timezone>
+  <date-invalid-timezone>2017-01-01+24:00</date-invalid-timezone>
+  <date-newline>2017-01-01
+</date-newline>
+  <date-unicode-digit>2017-01-0&#x661;</date-unicode-digit>
+  <date-future>9999-12-31</date-future>
+  <date-mixed><child/>2017-01-01</date-mixed>
+  <quoted>it's "quoted"</quoted>
+  <value attribute="abc">abc</value>
+  <value attribute="abd">abc</value>
+</root_element>''')
+"""A Dataset containing values that are checked differently by XSLT and Python."""
+
+EDGE_CASE_PATHS = [
+    'date', 'date-padded', 'date-leap', 'date-not-leap', 'date-century', 'date-invalid-month', 'date-year-zero', 'date-short',
+    'date-timezone', 'date-invalid-timezone', 'date-newline', 'date-unicode-digit', 'date-future', 'date-mixed', 'NOW'
+]
+"""Paths to the dates in `EDGE_CASE_DATASET`, plus the special case for the current date."""
+
+EDGE_CASE_RULES = [
+    iati.RuleRegexMatches('//root_element', {'paths': ['quoted'], 'regex': '^it\'s "quoted"$'}),
+    iati.RuleRegexMatches('//root_element', {'paths': ['quoted'], 'regex': '^it\'s \'quoted\'$'}),
+    iati.RuleRegexNoMatches('//root_element', {'paths': ['value', 'value/@attribute'], 'regex': 'd$'}),
+    iati.RuleStartsWith('//root_element', {'paths': ['value'], 'start': 'value/@attribute'}),
+    iati.RuleStartsWith('//value', {'paths': ['.'], 'start': '@attribute'}),
+    iati.RuleUnique('//root_element', {'paths': ['value']}),
+    iati.RuleUnique('//root_element', {'paths': ['value/@attribute']}),
+    iati.RuleUnique('//root_element', {'paths': ['value', 'value']}),
+    iati.RuleUnique('//root_element', {'paths': ['value[1]', 'value[1]/@attribute']})
+]
+"""Rules that are checked against `EDGE_CASE_DATASET`."""
+
+
+def result_type(result):
+    """Convert the result of checking a Rule into a form that may be compared.
+
+    Args:
+        result (bool or None or Exception): A result, as returned by `iati.Ruleset.results_for()`.
+
+    Returns:
+        bool or None or type: The result, or the type of exception.
+
+    """
+    return type(result) if isinstance(result, Exception) else result
+
+
+def assert_conformance(ruleset, dataset):
+    """Check that a compiled Ruleset produces the same results as the Ruleset that it was compiled from.
+
+    Args:
+        ruleset (iati.Ruleset): The Ruleset to compile.
+        dataset (iati.Dataset): The Dataset to check against.
+
+    """
+    python_results = ruleset.results_for(dataset)
+    xslt_results = iati.ruleset_xslt.CompiledRuleset(ruleset).results_for(dataset)
+
+    assert {rule: result_type(result) for rule, result in xslt_results.items()} == {rule: result_type(result) for rule, result in python_results.items()}
+
+
+class TestCompiledRulesetConformance:
+    """A container for tests that compare the results of compiled Rulesets with the Rules that they were compiled from."""
+
+    @pytest.fixture
+    def rule_datasets(self, rule_type):
+        """Return the Datasets used to test the specified type of Rule."""
+        file_suffix = '_{0}.xml'.format(rule_type.replace('_', ''))
+
+        return [iati.utilities.load_as_dataset(path) for path in sorted(iati.tests.resources.get_test_data_paths_in_folder('ruleset')) if path.endswith(file_suffix)]
+
+    @pytest.mark.parametrize('version', ['2.01', '2.02', '2.03'])
+    @pytest.mark.parametrize('dataset_name', [
+        'valid_iati',
+        'valid_std_ruleset',
+        'ruleset-std/invalid_std_ruleset_bad_date_order',
+        'ruleset-std/invalid_std_ruleset_bad_identifier',
+        'ruleset-std/invalid_std_ruleset_does_not_sum_100',
+        'ruleset-std/invalid_std_ruleset_missing_sector_element',
+        'ruleset-std/invalid_std_ruleset_multiple_rule_errors'
+    ])
+    def test_standard_ruleset_conformance(self, version, dataset_name):
+        """Check that a compiled Standard Ruleset produces the same results as the Standard Ruleset."""
+        assert_conformance(iati.default.ruleset(version), iati.tests.resources.load_as_dataset(dataset_name, '2.02'))
+
+    @pytest.mark.parametrize('rule_type, case', RULE_CASES)
+    def test_rule_conformance(self, rule_datasets, rule_type, case):
+        """Check that each type of Rule produces the same results when compiled, for each context and type of condition."""
+        for context in CONTEXTS:
+            for condition in CONDITIONS:
+                rule_case = deepcopy(case)
+                if condition is not None:
+                    rule_case['condition'] = condition
+                ruleset = iati.Ruleset()
+                ruleset.rules.add(iati.rulesets.constructor_for_rule_type(rule_type)(context, rule_case))
+
+                for dataset in rule_datasets:
+                    assert_conformance(ruleset, dataset)
+
+    @pytest.mark.parametrize('less', EDGE_CASE_PATHS)
+    @pytest.mark.parametrize('more', EDGE_CASE_PATHS)
+    def test_date_order_conformance(self, less, more):
+        """Check that dates in formats that are treated differently by XSLT and Python produce the same results when compiled."""
+        ruleset = iati.Ruleset()
+        ruleset.rules.add(iati.RuleDateOrder('//root_element', {'less': less, 'more': more}))
+
+        assert_conformance(ruleset, EDGE_CASE_DATASET)
+
+    @pytest.mark.parametrize('rule', EDGE_CASE_RULES)
+    def test_edge_case_conformance(self, rule):
+        """Check that Rules with values that need escaping, or nodes located by multiple paths, produce the same results when compiled."""
+        ruleset = iati.Ruleset()
+        ruleset.rules.add(rule)
+
+        assert_conformance(ruleset, EDGE_CASE_DATASET)
+
+
+class TestCompiledRuleset:
+    """A container for tests relating to compiled Rulesets."""
+
+    @pytest.fixture
+    def ruleset(self):
+        """Return the Standard Ruleset."""
+        return iati.default.ruleset('2.02')
+
+    def test_compiled_ruleset_rules(self, ruleset):
+        """Check that sum Rules are checked in Python, and all others by the stylesheet."""
+        compiled = iati.ruleset_xslt.CompiledRuleset(ruleset)
+
+        assert compiled.native_rules | compiled.python_rules == ruleset.rules
+        assert {rule.name for rule in compiled.python_rules} == {'sum'}
+        assert 'sum' not in {rule.name for rule in compiled.native_rules}
+
+    @pytest.mark.parametrize('case', [
+        {'paths': ['count(element)']},  # path is not a node-set
+        {'paths': ['element'], 'condition': 'undefined:element'}  # condition contains an undefined namespace prefix
+    ])
+    def test_compiled_ruleset_uncompilable_rule(self, case):
+        """Check that Rules with expressions that cannot be evaluated by the stylesheet in the same way as in Python are checked in Python."""
+        ruleset = iati.Ruleset()
+        ruleset.rules.add(iati.RuleAtLeastOne('//root_element', case))
+
+        compiled = iati.ruleset_xslt.CompiledRuleset(ruleset)
+
+        assert compiled.python_rules == ruleset.rules
+        assert compiled.native_rules == set()
+
+    def test_compiled_ruleset_evaluate_line_numbers(self, ruleset):
+        """Check that the line number of the element that caused a Rule to fail is returned."""
+        dataset = iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_bad_date_order', '2.02')
+        activity_line = dataset.xml_tree.xpath('//iati-activity')[0].sourceline
+
+        results = iati.ruleset_xslt.CompiledRuleset(ruleset).evaluate(dataset)
+        failures = [(rule, line_number) for rule, (result, line_number) in results.items() if result is False]
+
+        assert {rule.name for rule, _ in failures} == {'date_order'}
+        assert all(line_number == activity_line for _, line_number in failures)
+
+    @pytest.mark.parametrize('not_a_dataset', iati.tests.utilities.generate_test_types([], True))
+    def test_compiled_ruleset_results_for_not_a_dataset(self, ruleset, not_a_dataset):
+        """Check that each Rule has a TypeError as its result when given something that is not a Dataset."""
+        results = iati.ruleset_xslt.CompiledRuleset(ruleset).results_for(not_a_dataset)
+
+        assert {rule: result_type(result) for rule, result in results.items()} == {rule: TypeError for rule in ruleset.rules}
+
+    def test_compiled_ruleset_cached(self, ruleset):
+        """Check that compiled Rulesets are cached, and recompiled when the Rules within the Ruleset change."""
+        compiled = iati.ruleset_xslt.compiled_ruleset(ruleset)
+
+        assert iati.ruleset_xslt.compiled_ruleset(ruleset) is compiled
+
+        ruleset.rules.add(iati.RuleAtLeastOne('//root_element', {'paths': ['element']}))
+        recompiled = iati.ruleset_xslt.compiled_ruleset(ruleset)
+
+        assert recompiled is not compiled
+        assert recompiled.native_rules | recompiled.python_rules == ruleset.rules
+
+    def test_compiled_ruleset_cached_by_rules(self, ruleset):
+        """Check that Rulesets containing the same Rules share a compiled version."""
+        assert iati.ruleset_xslt.compiled_ruleset(copy(ruleset)) is iati.ruleset_xslt.compiled_ruleset(ruleset)
+
+    def test_compiled_ruleset_not_kept_alive(self):
+        """Check that a Ruleset that is no longer referenced is garbage collected once it has been compiled."""
+        ruleset = iati.Ruleset()
+        ruleset.rules.add(iati.RuleAtLeastOne('//root_element', {'paths': ['element']}))
+        ruleset_ref = weakref.ref(ruleset)
+        iati.ruleset_xslt.compiled_ruleset(ruleset)
+
+        del ruleset
+        gc.collect()
+
+        assert ruleset_ref() is None
+
+    def test_compiled_ruleset_cache_size_limited(self, monkeypatch):
+        """Check that the least recently used compiled Ruleset is discarded once the cache is full."""
+        monkeypatch.setattr(iati.ruleset_xslt, '_COMPILED_RULESETS', collections.OrderedDict())
+        rulesets = list()
+        for idx in range(iati.ruleset_xslt._COMPILED_RULESETS_MAX_SIZE + 1):  # pylint: disable=protected-access
+            ruleset = iati.Ruleset()
+            ruleset.rules.add(iati.RuleAtLeastOne('//root_element', {'paths': ['element{0}'.format(idx)]}))
+            rulesets.append(ruleset)
+        compiled = [iati.ruleset_xslt.compiled_ruleset(ruleset) for ruleset in rulesets]
+
+        assert len(iati.ruleset_xslt._COMPILED_RULESETS) == iati.ruleset_xslt._COMPILED_RULESETS_MAX_SIZE  # pylint: disable=protected-access
+        assert iati.ruleset_xslt.compiled_ruleset(rulesets[-1]) is compiled[-1]
+        assert iati.ruleset_xslt.compiled_ruleset(rulesets[0]) is not compiled[0]
+
+    @pytest.mark.parametrize('value, expected_literal', [
+        ('value', "'value'"),
+        ("it's", '"it\'s"'),
+        ('it\'s "quoted"', 'concat(\'it\', "\'", \'s "quoted"\')')
+    ])
+    def test_xpath_string_literal(self, value, expected_literal):
+        """Check that strings are converted into XPath literals that evaluate to the same string."""
+        literal = iati.ruleset_xslt._xpath_string_literal(value)  # pylint: disable=protected-access
+
+        assert literal == expected_literal
+        assert iati.data.Dataset('<root_element/>').xml_tree.xpath(literal) == value
@@ -7,12 +7,14 @@ Todo:
 
 """
 # pylint: disable=protected-access,too-many-lines
-from copy import deepcopy
+from copy import copy, deepcopy
+from datetime import datetime
 import pytest
 import iati.default
 import iati.rulesets
 import iati.resources
 import iati.tests.utilities
+import iati.utilities
 
 
 class RulesetFixtures:
@@ -160,6 +162,17 @@ class TestRulesetInitialisation(RulesetFixtures):
             assert isinstance(rule, iati.Rule)
             assert isinstance(rule, iati.RuleAtLeastOne)
 
+    def test_ruleset_init_schema_cached(self, monkeypatch):
+        """Check that the Ruleset schema is not loaded from disk and compiled each time that a Ruleset is created."""
+        ruleset_str = iati.utilities.load_as_string(iati.resources.get_ruleset_paths('2.02')[0])
+        iati.Ruleset(ruleset_str)
+        monkeypatch.setattr(iati.default, 'ruleset_schema', None)
+        monkeypatch.setattr(iati.rulesets, '_compiled_json_schema_validator', None)
+
+        ruleset = iati.Ruleset(ruleset_str)
+
+        assert ruleset == iati.default.ruleset('2.02')
+
 
 class TestRulesetValidityChecks(RulesetFixtures):
     """A container for tests relating to checking whether a Dataset is valid for a Ruleset."""
@@ -203,6 +216,79 @@ class TestRulesetValidityChecks(RulesetFixtures):
 
         assert not ruleset.is_valid_for(invalid_dataset)
 
+    def test_ruleset_is_valid_for_stops_at_first_failure(self, monkeypatch):
+        """Check that no further Rules are checked once a Dataset does not pass a Rule in the Ruleset."""
+        dataset = iati.tests.resources.load_as_dataset('ruleset/invalid_sum')
+        ruleset = iati.Ruleset('')
+        for context in ['//root_element', '//nest']:
+            ruleset.rules.update(iati.RuleNoMoreThanOne(context, {'paths': ['*', 'missing_element_{0}'.format(idx)]}) for idx in range(5))
+        checked_rules = list()
+        result_for_context_element = iati.RuleNoMoreThanOne._result_for_context_element
+
+        def record_result_for_context_element(rule, context_element):
+            """Record the Rule before checking it."""
+            checked_rules.append(rule)
+            return result_for_context_element(rule, context_element)
+
+        monkeypatch.setattr(iati.RuleNoMoreThanOne, '_result_for_context_element', record_result_for_context_element)
+
+        assert not ruleset.is_valid_for(dataset)
+        assert len(checked_rules) == 1
+
+    @pytest.mark.parametrize("dataset", [
+        iati.tests.resources.load_as_dataset('valid_std_ruleset', '2.02'),
+        iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_bad_date_order', '2.02'),
+        iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_missing_sector_element', '2.02'),
+        iati.tests.resources.load_as_dataset('valid_iati', '2.02')
+    ])
+    @pytest.mark.fixed_to_202
+    def test_ruleset_results_for_matches_rules(self, dataset):
+        """Check that checking Rules grouped by context gives the same results as checking each Rule in turn."""
+        ruleset = iati.tests.utilities.RULESET_FOR_TESTING
+
+        results = ruleset.results_for(dataset)
+
+        assert set(results.keys()) == ruleset.rules
+        for rule in ruleset.rules:
+            assert results[rule] is rule.is_valid_for(dataset)
+
+    def test_ruleset_results_for_exceptions(self):
+        """Check that exceptions raised by a Rule are returned as its result without affecting other Rules with the same context."""
+        dataset = iati.tests.resources.load_as_dataset('ruleset/invalid_sum')
+        ruleset = iati.Ruleset('')
+        raising_rule = iati.rulesets.RuleSum('//root_element', {'paths': ['element42'], 'sum': 50})
+        other_rule = iati.rulesets.RuleAtLeastOne('//root_element', {'paths': ['element42']})
+        ruleset.rules.update([raising_rule, other_rule])
+
+        results = ruleset.results_for(dataset)
+
+        with pytest.raises(ValueError):
+            raising_rule.is_valid_for(dataset)
+        assert isinstance(results[raising_rule], ValueError)
+        assert results[other_rule] is other_rule.is_valid_for(dataset)
+
+    @pytest.mark.parametrize("dataset", [
+        iati.tests.resources.load_as_dataset('valid_std_ruleset', '2.02'),
+        iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_bad_date_order', '2.02'),
+        iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_multiple_rule_errors', '2.02'),
+        iati.tests.resources.load_as_dataset('valid_iati', '2.02')
+    ])
+    @pytest.mark.fixed_to_202
+    def test_ruleset_incremental_results_match_results_for(self, dataset):
+        """Check that checking a Dataset one activity at a time, discarding each in turn, gives the same results as checking the whole Dataset."""
+        ruleset = iati.tests.utilities.RULESET_FOR_TESTING
+        expected_results = {rule: type(result) if isinstance(result, Exception) else result for rule, result in ruleset.results_for(dataset).items()}
+        incremental_results = iati.rulesets._IncrementalResults(ruleset)
+        root = deepcopy(dataset.xml_tree).getroot()
+        partial_dataset = iati.Dataset(root)
+
+        for activity in root.findall('iati-activity'):
+            incremental_results.check(partial_dataset, activity)
+            root.remove(activity)
+        incremental_results.check(partial_dataset)
+
+        assert {rule: type(result) if isinstance(result, Exception) else result for rule, result in incremental_results.results().items()} == expected_results
+
 
 class TestRulesetEquality(RulesetFixtures):
     """A container for tests relating to checking the equality of Rulesets."""
@@ -216,12 +302,19 @@ class TestRulesetEquality(RulesetFixtures):
         """Check that a Rule is deemed to be equal with itself."""
         assert cmp_func_equal_val_and_hash(ruleset, ruleset)
 
-    def test_ruleset_same_diff_object_equal(self, ruleset, cmp_func_equal_val, cmp_func_different_hash):
+    def test_ruleset_same_diff_object_equal(self, ruleset, cmp_func_equal_val_and_hash):
         """Check that two instances of the same Ruleset are deemed to be equal."""
         ruleset_copy = deepcopy(ruleset)
 
-        assert cmp_func_equal_val(ruleset, ruleset_copy)
-        assert cmp_func_different_hash(ruleset, ruleset_copy)
+        assert cmp_func_equal_val_and_hash(ruleset, ruleset_copy)
+
+    def test_ruleset_same_rules_diff_order_equal(self, ruleset_non_empty, cmp_func_equal_val_and_hash):
+        """Check that two Rulesets containing the same Rules, added in a different order, are deemed to be equal."""
+        ruleset_reordered = iati.Ruleset()
+        for rule in reversed(list(ruleset_non_empty.rules)):
+            ruleset_reordered.rules.add(deepcopy(rule))
+
+        assert cmp_func_equal_val_and_hash(ruleset_non_empty, ruleset_reordered)
 
     def test_ruleset_diff_num_rules_not_equal(self, ruleset, rule, cmp_func_different_val_and_hash):
         """Check that two different Rulesets are not deemed to be equal.
@@ -246,6 +339,16 @@ class TestRulesetEquality(RulesetFixtures):
 
         assert cmp_func_different_val_and_hash(ruleset, ruleset_copy)
 
+    def test_ruleset_copy_rules_independent(self, ruleset_non_empty, rule, cmp_func_equal_val_and_hash):
+        """Check that a copy of a Ruleset is equal to it, and that Rules may be added to the copy without affecting the original."""
+        ruleset_copy = copy(ruleset_non_empty)
+
+        assert cmp_func_equal_val_and_hash(ruleset_non_empty, ruleset_copy)
+
+        ruleset_copy.rules.add(rule)
+
+        assert rule not in ruleset_non_empty.rules
+
 
 class TestRule:
     """A container for tests relating to Rules."""
@@ -475,6 +578,26 @@ class RuleSubclassTestsGeneral(RuleSubclassFixtures):  # pylint: disable=too-man
         with pytest.raises(ValueError):
             rule_constructor(context, uninstantiating_case)
 
+    def test_rule_init_invalid_xpath_context(self, rule_constructor, single_instantiating_case):
+        """Check that a Rule cannot be instantiated when the context is not a valid XPath expression."""
+        with pytest.raises(ValueError):
+            rule_constructor('//[invalid', single_instantiating_case)
+
+    def test_rule_init_invalid_xpath_condition(self, rule_constructor, valid_single_context, single_instantiating_case):
+        """Check that a Rule cannot be instantiated when the condition is not a valid XPath expression."""
+        case = deepcopy(single_instantiating_case)
+        case['condition'] = 'count(condition'
+
+        with pytest.raises(ValueError):
+            rule_constructor(valid_single_context, case)
+
+    def test_rule_copy_is_valid_for(self, valid_dataset, rule_valid):
+        """Check that a copied Rule gives the same result as the original, with compiled XPath expressions being recreated."""
+        rule_copy = deepcopy(rule_valid)
+
+        assert rule_copy == rule_valid
+        assert rule_copy.is_valid_for(valid_dataset) == rule_valid.is_valid_for(valid_dataset)
+
     def test_is_valid_for(self, valid_dataset, rule_valid):
         """Check that a given Rule returns the expected result when given Dataset."""
         assert rule_valid.is_valid_for(valid_dataset)
@@ -583,6 +706,25 @@ class RuleSubclassEquality(RuleSubclassFixtures):
 
         assert cmp_func_different_val_and_hash(rule, rule_copy)
 
+    def test_rule_diff_condition_not_equal(self, rule, cmp_func_different_val_and_hash):
+        """Check that two different Rules are not deemed to be equal.
+
+        The two Rules have different conditions, but are otherwise identical.
+        """
+        case = deepcopy(rule._case)  # pylint: disable=protected-access
+        case['condition'] = 'count(element) > 1'
+        rule_copy = type(rule)(rule.context, case)
+
+        assert cmp_func_different_val_and_hash(rule, rule_copy)
+
+    def test_rule_hash_does_not_format_rule(self, rule, monkeypatch):
+        """Check that hashing a Rule does not require the Rule to be converted to a string."""
+        expected_hash = hash(rule)
+        monkeypatch.setattr(type(rule), '__str__', lambda self: pytest.fail('Rule converted to a string'))
+
+        assert hash(rule) == expected_hash
+        assert rule == deepcopy(rule)
+
 
 class RuleSubclassTestBase(RuleSubclassTestsGeneral, RuleSubclassEquality):
     """A base class for Rule subclass tests.
@@ -697,10 +839,6 @@ class TestRuleDateOrder(RuleSubclassTestBase):
     instatiating_cases = [
         {'less': 'element', 'more': 'element'},  # both `less` and `more` duplicate xpath
         {'less': 'element/@attribute', 'more': 'element/@attribute'},
-        {'less': '2017-07-26T13:19:05.493Z', 'more': 'element'},  # `less` is a string-formatted date
-        {'less': '2017-07-26T13:19:05.493Z', 'more': 'element/@attribute'},
-        {'less': 'element', 'more': '2017-07-26T13:19:05.493Z'},  # `more` is a string-formatted date
-        {'less': 'element/@attribute', 'more': '2017-07-26T13:19:05.493Z'},
         {'less': 'NOW', 'more': 'NOW'}  # both `less` and `more` as NOW
     ]
 
@@ -745,6 +883,10 @@ class TestRuleDateOrder(RuleSubclassTestBase):
         {},  # empty dictionary
         {'less': ['start']},  # less is a list
         {'more': ['end']},  # more is a list
+        {'less': '2017-07-26T13:19:05.493Z', 'more': 'element'},  # `less` is a string-formatted date, so not a valid XPath
+        {'less': '2017-07-26T13:19:05.493Z', 'more': 'element/@attribute'},
+        {'less': 'element', 'more': '2017-07-26T13:19:05.493Z'},  # `more` is a string-formatted date, so not a valid XPath
+        {'less': 'element/@attribute', 'more': '2017-07-26T13:19:05.493Z'},
     ]
 
     invalidating_cases = [
@@ -872,6 +1014,37 @@ class TestRuleDateOrder(RuleSubclassTestBase):
         """Check that the string format of the Rule contains some relevant information."""
         assert any(needle in str(rule_instantiating) for needle in ['must be chronologically', 'in the future', 'in the past'])
 
+    @pytest.mark.parametrize("date_str", [
+        '2017-07-26',
+        '0001-01-01',
+        '2016-02-29',
+        '2017-02-29',  # not a leap year
+        '2017-13-01',
+        '2017-00-10',
+        '0000-01-01',
+        '2017-7-261',  # not zero-padded
+        '2017-10- 1',
+        '2017/07/26',
+        '20170726ab'
+    ])
+    def test_parse_date_matches_strptime(self, date_str):
+        """Check that dates are parsed in the same way as by `datetime.strptime()`."""
+        try:
+            expected = datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            with pytest.raises(ValueError):
+                iati.rulesets._parse_date(date_str)
+        else:
+            assert iati.rulesets._parse_date(date_str) == expected
+
+    def test_parse_date_memoized(self):
+        """Check that repeated date strings are not parsed again."""
+        iati.rulesets._parse_date.cache_clear()
+        iati.rulesets._parse_date('2017-07-26')
+        iati.rulesets._parse_date('2017-07-26')
+
+        assert iati.rulesets._parse_date.cache_info().hits == 1
+
 
 class TestRuleDependent(RuleSubclassTestBase):
     """A container for tests relating to RuleDependent."""
@@ -1152,6 +1325,10 @@ class TestRuleRegexMatches(RuleSubclassTestBase):
         """Check that the string format of the Rule contains some relevant information."""
         assert 'must match the regular expression' in str(rule_instantiating)
 
+    def test_rule_regex_compiled(self, rule_instantiating):
+        """Check that the regex is compiled when the Rule is created."""
+        assert rule_instantiating._pattern.pattern == rule_instantiating.regex
+
 
 class TestRuleRegexNoMatches(RuleSubclassTestBase):
     """A container for tests relating to RuleRegexNoMatches."""
@@ -1250,6 +1427,10 @@ class TestRuleRegexNoMatches(RuleSubclassTestBase):
         """Check that the string format of the Rule contains some relevant information."""
         assert 'must not match the regular expression' in str(rule_instantiating)
 
+    def test_rule_regex_compiled(self, rule_instantiating):
+        """Check that the regex is compiled when the Rule is created."""
+        assert rule_instantiating._pattern.pattern == rule_instantiating.regex
+
 
 class TestRuleStartsWith(RuleSubclassTestBase):
     """A container for tests relating to RuleStartsWith."""
@@ -1,6 +1,7 @@
 """A module containing tests for the library representation of Schemas."""
 # pylint: disable=protected-access
 import copy
+import threading
 from lxml import etree
 import pytest
 import iati.codelists
@@ -235,7 +236,7 @@ class TestSchemas(SchemaTestsBase):
 
     @pytest.mark.fixed_to_202
     def test_schema_rulesets_add_duplicate(self, schema_initialised):
-        """Check that it is possible to add multiple functionally identical Rulesets to a Schema.
+        """Check that functionally identical Rulesets are only added to a Schema once.
 
         Todo:
             Consider if this test should test against a versioned Ruleset.
@@ -246,7 +247,7 @@ class TestSchemas(SchemaTestsBase):
         schema_initialised.rulesets.add(ruleset)
         schema_initialised.rulesets.add(ruleset_copy)
 
-        assert len(schema_initialised.rulesets) == 2
+        assert len(schema_initialised.rulesets) == 1
 
     @pytest.mark.fixed_to_202
     def test_schema_rulesets_add_two_different(self, schema_initialised):
@@ -264,6 +265,106 @@ class TestSchemas(SchemaTestsBase):
 
         assert len(schema_initialised.rulesets) == 2
 
+    def test_schema_validator_is_cached(self, schema_initialised):
+        """Check that the validator for a Schema is only compiled once."""
+        validator = schema_initialised.validator()
+
+        assert isinstance(validator, etree.XMLSchema)
+        assert schema_initialised.validator() is validator
+
+    def test_schema_validator_recompiled_when_base_tree_changes(self, schema_initialised):
+        """Check that a new validator is compiled when the base tree of a Schema is replaced."""
+        validator = schema_initialised.validator()
+
+        schema_initialised._schema_base_tree = copy.deepcopy(schema_initialised._schema_base_tree)
+
+        assert schema_initialised.validator() is not validator
+
+    def test_schema_validator_recompiled_when_codelists_change(self, schema_initialised):
+        """Check that a new validator is compiled when a Codelist is added to a Schema."""
+        validator = schema_initialised.validator()
+
+        schema_initialised.codelists.add(iati.Codelist('a test Codelist name'))
+
+        assert schema_initialised.validator() is not validator
+
+    def test_schema_validator_recompiled_when_rulesets_change(self, schema_initialised):
+        """Check that a new validator is compiled when a Ruleset is added to a Schema."""
+        validator = schema_initialised.validator()
+
+        schema_initialised.rulesets.add(iati.Ruleset())
+
+        assert schema_initialised.validator() is not validator
+
+    def test_schema_thread_local_validator_differs_between_threads(self, schema_initialised):
+        """Check that each thread is given its own validator, which is cached within the thread."""
+        validators = []
+        thread = threading.Thread(target=lambda: validators.extend([schema_initialised.thread_local_validator(), schema_initialised.thread_local_validator()]))
+        thread.start()
+        thread.join()
+
+        assert validators[0] is validators[1]
+        assert schema_initialised.thread_local_validator() is not validators[0]
+        assert schema_initialised.thread_local_validator() is schema_initialised.thread_local_validator()
+
+    def test_schema_borrowed_validator_not_shared_while_borrowed(self, schema_initialised):
+        """Check that a borrowed validator is not lent again until it is returned, after which it is reused."""
+        with schema_initialised.borrowed_validator() as validator:
+            with schema_initialised.borrowed_validator() as other_validator:
+                assert other_validator is not validator
+
+        with schema_initialised.borrowed_validator() as reused_validator:
+            assert reused_validator in [validator, other_validator]
+
+    def test_schema_borrowed_validator_shared_with_copies(self, schema_initialised):
+        """Check that a copy of a Schema borrows validators from the same pool, unless its Codelists have changed."""
+        with schema_initialised.borrowed_validator() as validator:
+            pass
+        schema_copy = copy.copy(schema_initialised)
+
+        with schema_copy.borrowed_validator() as copy_validator:
+            assert copy_validator is validator
+
+        schema_copy.codelists.add(iati.Codelist('a new Codelist'))
+        with schema_copy.borrowed_validator() as copy_validator:
+            assert copy_validator is not validator
+
+    def test_schema_borrowed_validator_out_of_date_discarded(self, schema_initialised):
+        """Check that validators compiled from a previous state of a Schema are discarded from the pool once the Schema changes."""
+        with schema_initialised.borrowed_validator():
+            with schema_initialised.borrowed_validator():
+                pass
+
+        schema_initialised.codelists.add(iati.Codelist('a new Codelist'))
+        with schema_initialised.borrowed_validator() as validator:
+            pass
+
+        assert schema_initialised._validator_pool._idle == [(schema_initialised._validator_dependencies(), validator)]  # pylint: disable=protected-access
+
+    def test_schema_copy_after_validator_compiled(self, schema_initialised):
+        """Check that a Schema may be copied once its validator has been compiled."""
+        validator = schema_initialised.validator()
+        schema_initialised.thread_local_validator()
+
+        schema_copy = copy.deepcopy(schema_initialised)
+
+        assert schema_copy == schema_initialised
+        assert isinstance(schema_copy.validator(), etree.XMLSchema)
+        assert schema_copy.validator() is not validator
+
+    def test_schema_shallow_copy(self, schema_initialised):
+        """Check that a shallow copy of a Schema shares its compiled validator, but may have Codelists added without affecting the original."""
+        validator = schema_initialised.validator()
+
+        schema_copy = copy.copy(schema_initialised)
+        assert schema_copy.validator() is validator
+
+        schema_copy.codelists.add(iati.Codelist('a new Codelist'))
+
+        assert schema_initialised.validator() is validator
+        assert len(schema_copy.codelists) == len(schema_initialised.codelists) + 1
+        assert schema_copy != schema_initialised
+
 
 class TestSchemaEquality(SchemaTestsBase):
     """A container for tests relating to Schema equality."""
@@ -293,6 +394,38 @@ class TestSchemaEquality(SchemaTestsBase):
 
         assert cmp_func_equal_val(schema_initialised, schema_copy)
 
+    def test_schema_copy_equal_without_flattening(self, schema_initialised, monkeypatch):
+        """Check that a Schema is compared with a copy that shares its base tree without the tree being flattened."""
+        schema_copy = copy.copy(schema_initialised)
+
+        def flatten_includes(self, tree):
+            raise AssertionError('The base tree was flattened.')
+
+        monkeypatch.setattr(iati.schemas.Schema, 'flatten_includes', flatten_includes)
+
+        assert schema_initialised == schema_copy
+
+    def test_schema_flattened_tree_cached(self, schema_initialised, monkeypatch):
+        """Check that the flattened base tree of a Schema is reused between comparisons until the base tree is replaced."""
+        schema_copy = copy.deepcopy(schema_initialised)
+        flattened_trees = []
+        original_flatten_includes = iati.schemas.Schema.flatten_includes
+
+        def flatten_includes(self, tree):
+            flattened_trees.append(tree)
+            return original_flatten_includes(self, tree)
+
+        monkeypatch.setattr(iati.schemas.Schema, 'flatten_includes', flatten_includes)
+
+        assert schema_initialised == schema_copy
+        assert schema_initialised == schema_copy
+        assert len(flattened_trees) == 2
+
+        schema_copy._schema_base_tree = copy.deepcopy(schema_copy._schema_base_tree)  # pylint: disable=protected-access
+
+        assert schema_initialised == schema_copy
+        assert len(flattened_trees) == 3
+
     def test_schema_same_num_codelists_equal(self, schema_initialised, codelist_empty, cmp_func_equal_val):
         """Check that two Schemas with the same non-zero number of Codelists are deemed to be equal."""
         schema_initialised.codelists.add(codelist_empty)
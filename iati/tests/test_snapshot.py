@@ -0,0 +1,105 @@
+"""A module containing tests for snapshots of the parsed content of the IATI Standard."""
+import collections
+import pickle
+import pytest
+import iati
+import iati.codelists
+import iati.default
+import iati.snapshot
+import iati.version
+
+
+class TestSnapshots:
+    """A container for tests relating to building and loading snapshots."""
+
+    @pytest.fixture(scope='module')
+    def snapshot_content(self, tmpdir_factory):
+        """Build a snapshot and return its path and the content that was built."""
+        path = str(tmpdir_factory.mktemp('snapshot').join('snapshot.pickle'))
+
+        return path, iati.snapshot.build(path)
+
+    @pytest.fixture
+    def snapshot_path(self, snapshot_content, tmpdir):
+        """Return the path to a copy of a built snapshot, which may be modified."""
+        path, _ = snapshot_content
+        snapshot_copy = tmpdir.join('snapshot.pickle')
+        with open(path, 'rb') as snapshot_file:
+            snapshot_copy.write_binary(snapshot_file.read())
+
+        return str(snapshot_copy)
+
+    def test_snapshot_build_content(self, snapshot_content):
+        """Check that a snapshot contains the default content for each fully supported version of the Standard."""
+        _, content = snapshot_content
+
+        assert set(content.keys()) == {str(version) for version in iati.version.STANDARD_VERSIONS_SUPPORTED}
+        for version in iati.version.STANDARD_VERSIONS_SUPPORTED:
+            version_content = content[str(version)]
+            default_mapping = iati.default._codelist_mapping(version)  # pylint: disable=protected-access
+
+            assert version_content['codelists'] == iati.default.codelists(version)
+            assert all(codelist.frozen for codelist in version_content['codelists'].values())
+            assert version_content['codelist_mapping'].as_dict() == default_mapping.as_dict()
+            assert iati.snapshot.restore(version_content['ruleset']) == iati.default.ruleset(version)
+
+    def test_snapshot_load(self, snapshot_path):
+        """Check that a snapshot that is up to date is loaded without being rebuilt."""
+        content = iati.snapshot.load(snapshot_path)
+        mapping = content['2.02']['codelist_mapping']
+
+        assert content['2.02']['codelists'] == iati.default.codelists('2.02')
+        assert all(mapping[name] for name in mapping)
+
+    def test_snapshot_load_not_present(self, tmpdir):
+        """Check that there is no content when a snapshot is not present."""
+        assert iati.snapshot.load(str(tmpdir.join('not-a-snapshot.pickle'))) is None
+
+    @pytest.mark.parametrize('snapshot_bytes', [
+        pickle.dumps({'format_version': iati.snapshot.SNAPSHOT_FORMAT_VERSION, 'library_version': iati.__version__, 'resources_fingerprint': (('a-different-resource.xml', 0, 0),)}),
+        pickle.dumps({'format_version': -1, 'library_version': iati.__version__, 'resources_fingerprint': ()}),
+        b'not a pickle',
+        b''
+    ])
+    def test_snapshot_load_out_of_date(self, snapshot_path, snapshot_bytes):
+        """Check that a snapshot that is out of date or corrupt is neither loaded nor rebuilt."""
+        with open(snapshot_path, 'wb') as snapshot_file:
+            snapshot_file.write(snapshot_bytes)
+
+        content = iati.snapshot.load(snapshot_path)
+
+        assert content is None
+        with open(snapshot_path, 'rb') as snapshot_file:
+            assert snapshot_file.read() == snapshot_bytes
+
+    def test_snapshot_load_resources_changed(self, snapshot_path, monkeypatch):
+        """Check that a snapshot is not loaded once the resource files that it was built from change."""
+        fingerprint = iati.snapshot.resources_fingerprint()
+        changed_fingerprint = fingerprint[1:] + ((fingerprint[0][0], fingerprint[0][1] + 1, fingerprint[0][2]),)
+        monkeypatch.setattr(iati.snapshot, 'resources_fingerprint', lambda: tuple(sorted(changed_fingerprint)))
+
+        assert iati.snapshot.load(snapshot_path) is None
+
+    def test_snapshot_load_library_version_changed(self, snapshot_path, monkeypatch):
+        """Check that a snapshot is not loaded by a different version of pyIATI to the one that built it."""
+        monkeypatch.setattr(iati, '__version__', iati.__version__ + '.dev1')
+
+        assert iati.snapshot.load(snapshot_path) is None
+
+    def test_default_uses_snapshot(self, monkeypatch):
+        """Check that default content is taken from a snapshot when one is present."""
+        version = iati.Version('2.02')
+        snapshot_codelist = iati.Codelist('Country').freeze()
+        snapshot_mapping = iati.codelists.CodelistMapping('<mappings />')
+        snapshot_ruleset = iati.Ruleset()
+        snapshot_content = {str(version): {'codelists': {'Country': snapshot_codelist}, 'codelist_mapping': snapshot_mapping, 'ruleset': pickle.dumps(snapshot_ruleset)}}
+        monkeypatch.setattr(iati.snapshot, 'load', lambda path=None: snapshot_content)
+        monkeypatch.setattr(iati.default, '_SNAPSHOT', None)
+        monkeypatch.setattr(iati.default, '_CODELIST_MAPPINGS', dict())
+        monkeypatch.setattr(iati.default, '_CODELISTS', collections.defaultdict(dict))
+        monkeypatch.setattr(iati.default, '_RULESETS', dict())
+
+        assert iati.default._codelist_mapping(version) is snapshot_mapping  # pylint: disable=protected-access
+        assert iati.default.ruleset(version) == snapshot_ruleset
+        assert iati.default.codelist('Country', version) == snapshot_codelist
+        assert len(iati.default.codelists(version)) > 1
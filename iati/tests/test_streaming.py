@@ -0,0 +1,133 @@
+"""A module containing tests for validating IATI XML files one activity or organisation at a time."""
+import collections
+import io
+import pytest
+import iati.default
+import iati.streaming
+import iati.tests.resources
+import iati.validator
+
+
+def error_summary(errors):
+    """Summarise a number of errors so that they may be compared regardless of order.
+
+    Args:
+        errors (iterable of iati.validator.ValidationError): The errors to summarise.
+
+    Returns:
+        collections.Counter: The number of errors with each combination of name, line number and context.
+
+    """
+    return collections.Counter((error.name, getattr(error, 'line_number', None), getattr(error, 'context', None)) for error in errors)
+
+
+class TestStreamingValidation:
+    """A container for tests relating to streaming validation."""
+
+    @pytest.fixture(params=[
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    def schema(self, request):
+        """Return a Schema populated with Codelists and Rulesets."""
+        return request.param('2.02')
+
+    @pytest.mark.parametrize('dataset_name', [
+        'valid_iati',
+        'valid_iati_invalid_code',
+        'valid_std_ruleset',
+        'valid_iati_codelist_mapping_element_text_invalid_code',
+        'ruleset-std/invalid_std_ruleset_bad_date_order',
+        'ruleset-std/invalid_std_ruleset_multiple_rule_errors',
+        'ssot-activity-xml-fail/18-missing-iati-activities-version.xml',
+        'ssot-org-xml-fail/01-empty-organization.xml',
+        'ssot-org-xml-fail/17-version-on-iati-organisation.xml',
+        'invalid_iati_missing_required_element',
+        'valid_iati_breaks_rule'
+    ])
+    @pytest.mark.fixed_to_202
+    def test_streaming_validation_matches_full_validation(self, schema, dataset_name):
+        """Check that streaming validation finds the same errors as full validation, with the same line numbers and context."""
+        dataset = iati.tests.resources.load_as_dataset(dataset_name, '2.02')
+
+        errors = iati.streaming.validate(io.BytesIO(dataset.xml_str.encode('utf-8')), schema)
+
+        assert error_summary(errors) == error_summary(iati.validator.full_validation(dataset, schema))
+
+    @pytest.mark.fixed_to_202
+    def test_streaming_validation_path(self, schema):
+        """Check that a file may be validated by providing its path."""
+        path = iati.tests.resources.get_test_data_path('valid_iati_invalid_code', '2.02')
+
+        with open(path, 'rb') as source_file:
+            expected_errors = error_summary(iati.streaming.validate(source_file, schema))
+
+        assert error_summary(iati.streaming.validate(path, schema)) == expected_errors
+
+    @pytest.mark.parametrize('not_xml, expected_error_name', [
+        (b'', 'err-not-xml-empty-document'),
+        (b'<iati-activities version="2.02">\\n<iati-activity>\\n</iati-activities>', 'err-not-xml-uncategorised-xml-syntax-error')
+    ])
+    def test_streaming_validation_not_xml(self, schema, not_xml, expected_error_name):
+        """Check that validation stops with an error when a file is not well-formed XML."""
+        errors = list(iati.streaming.validate(io.BytesIO(not_xml), schema))
+
+        assert [error.name for error in errors] == [expected_error_name]
+
+    @pytest.mark.fixed_to_202
+    def test_streaming_validation_discards_activities(self, monkeypatch):
+        """Check that each activity is checked alone, and that activities are discarded once they have been checked."""
+        schema = iati.default.activity_schema('2.02')
+        checked_activities = list()
+
+        def check_codelist_values(dataset, schema, element=None, codelists_to_check=None):  # pylint: disable=unused-argument
+            """Record the activities held within the Dataset being checked."""
+            checked_activities.append([activity.get('id') for activity in dataset.xml_tree.getroot().iter('iati-activity')])
+            return iati.validator.ValidationErrorLog()
+
+        monkeypatch.setattr(iati.validator, '_check_codelist_values', check_codelist_values)
+        xml = '<iati-activities version="2.02">{0}</iati-activities>'.format(''.join('<iati-activity id="{0}"/>'.format(index) for index in range(5)))
+
+        list(iati.streaming.validate(io.BytesIO(xml.encode('utf-8')), schema))
+
+        assert checked_activities == [['0'], ['1'], ['2'], ['3'], ['4'], []]
+
+
+class TestSourceReader:
+    """A container for tests relating to keeping the source of a file as it is read."""
+
+    @pytest.fixture
+    def source_reader(self):
+        """Return a reader that has read a file containing five numbered lines."""
+        source_reader = iati.streaming._SourceReader(io.BytesIO(b'1\n2\n3\n4\n5'))  # pylint: disable=protected-access
+        while source_reader.read(3):
+            pass
+
+        return source_reader
+
+    @pytest.mark.parametrize('line_number, expected_source', [
+        (1, '1\n2'),
+        (3, '2\n3\n4'),
+        (5, '4\n5'),
+        (7, '')
+    ])
+    def test_source_reader_source_around_line(self, source_reader, line_number, expected_source):
+        """Check that the source around a line is returned from the lines that have been read."""
+        assert source_reader.source_around_line(line_number) == expected_source
+
+    def test_source_reader_discard_lines_before(self, source_reader):
+        """Check that discarded lines are no longer returned, other than those that have been pinned."""
+        source_reader.pin_lines(1, 1)
+        source_reader.discard_lines_before(4)
+
+        assert source_reader.source_around_line(2) == '1'
+        assert source_reader.source_around_line(4) == '4\n5'
+
+    def test_source_reader_long_line_truncated(self, monkeypatch):
+        """Check that only the start of a line that is longer than the maximum length is kept."""
+        monkeypatch.setattr(iati.streaming, 'MAX_LINE_LENGTH', 4)
+        source_reader = iati.streaming._SourceReader(io.BytesIO(b'123456789\nabc'))  # pylint: disable=protected-access
+
+        assert source_reader.read(5) == b'12345'
+        assert source_reader.read() == b'6789\nabc'
+        assert source_reader.source_around_line(1) == '1234\nabc'
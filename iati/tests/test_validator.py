@@ -1,5 +1,7 @@
 """A module containing tests for data validation."""
 # pylint: disable=too-many-lines
+import collections
+import pickle
 import pytest
 import iati.data
 import iati.default
@@ -142,6 +144,17 @@ class TestValidationError:
         assert err.category == err_detail['category']  # pylint: disable=no-member
         assert err.description == err_detail['description']  # pylint: disable=no-member
 
+    def test_validation_error_pickle_lxml_log_entry(self):
+        """Test that a ValidationError created from an lxml log entry may be pickled, keeping the details of the entry."""
+        error = iati.validator.validate_is_xml('<a>')[0]
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+
+        assert unpickled_error.name == error.name
+        assert unpickled_error.lxml_err_code == error.lxml_err_code
+        assert unpickled_error.err.message == error.err.message
+        assert unpickled_error.err.line == error.err.line
+
 
 class TestValidationErrorLog(ValidationTestBase):  # pylint: disable=too-many-public-methods
     """A container for tests relating to Validation Error Logs."""
@@ -320,6 +333,46 @@ class TestValidationErrorLog(ValidationTestBase):  # pylint: disable=too-many-pu
 
         assert error_log == error_log_empty
 
+    def test_error_log_no_limits(self, error_log, error, warning):
+        """Test that an error log without limits keeps everything that is added to it."""
+        error_log.extend([error, warning] * 3)
+
+        assert len(error_log) == 6
+        assert not error_log.has_limits()
+        assert not error_log.is_full()
+
+    def test_error_log_max_errors(self, error, warning):
+        """Test that an error log with a maximum number of errors discards errors and warnings once it is full."""
+        error_log = iati.validator.ValidationErrorLog(max_errors=3)
+
+        error_log.extend([warning, error, warning, error, warning])
+
+        assert [value.name for value in error_log] == [warning.name, error.name, warning.name]
+        assert error_log.is_full()
+        assert not error_log.accepts(error.name)
+
+    def test_error_log_max_errors_per_code(self, err_name, error, warning):
+        """Test that an error log with a maximum number of errors per code discards errors with a name that has reached the limit."""
+        error_log = iati.validator.ValidationErrorLog(max_errors_per_code=2)
+
+        error_log.extend([error, error, error, warning])
+
+        assert [value.name for value in error_log] == [error.name, error.name, warning.name]
+        assert not error_log.accepts(err_name)
+        assert error_log.accepts(warning.name)
+        assert not error_log.is_full()
+
+    def test_error_log_stop_on_first_error(self, error, warning):
+        """Test that an error log that stops on the first error keeps warnings until an error is added."""
+        error_log = iati.validator.ValidationErrorLog(stop_on_first_error=True)
+
+        error_log.extend([warning, warning])
+        assert not error_log.is_full()
+
+        error_log.extend([error, warning, error])
+        assert [value.name for value in error_log] == [warning.name, warning.name, error.name]
+        assert error_log.is_full()
+
 
 class TestValidationAuxiliaryData:
     """A container for tests relating to auxiliary validation data."""
@@ -344,6 +397,33 @@ class TestValidationAuxiliaryData:
                 assert attr_name in code_attrs
                 assert isinstance(err_code[attr_name], attr_type)
 
+    def test_error_code_registry_is_cached(self):
+        """Check that the error code registry is only loaded once."""
+        registry = iati.validator._error_code_registry()  # pylint: disable=protected-access
+
+        assert iati.validator._error_code_registry() is registry  # pylint: disable=protected-access
+
+    def test_error_code_registry_is_immutable(self):
+        """Check that the error code registry and the templates within it cannot be modified."""
+        registry = iati.validator._error_code_registry()  # pylint: disable=protected-access
+        template = registry['err-code-not-on-codelist']
+
+        with pytest.raises(TypeError):
+            registry['err-code-not-on-codelist'] = None  # pylint: disable=unsupported-assignment-operation
+        with pytest.raises(AttributeError):
+            template.status = 'warning'
+
+    def test_error_codes_modification_does_not_affect_errors(self):
+        """Check that modifying the returned error codes does not change newly created ValidationErrors."""
+        err_name = 'err-code-not-on-codelist'
+        err_codes = iati.validator.get_error_codes()
+        original_category = err_codes[err_name]['category']
+
+        err_codes[err_name]['category'] = 'modified'
+
+        assert iati.validator.get_error_codes()[err_name]['category'] == original_category
+        assert iati.validator.ValidationError(err_name).category == original_category  # pylint: disable=no-member
+
 
 class ValidateCodelistsBase(ValidationTestBase):
     """A container for fixtures required for Codelist validation tests."""
@@ -585,6 +665,19 @@ class TestValidateIsXML(ValidationTestBase):
 
         assert result == error_log_empty
 
+    def test_xml_check_dataset_not_reparsed(self, xml_str):
+        """Perform check to ensure that the XML within a Dataset is not parsed again to determine whether it is valid XML.
+
+        The errors found when the Dataset was created should be returned in a new log.
+        """
+        data = iati.Dataset(xml_str)
+        data._xml_str = 'This is no longer XML.'  # pylint: disable=protected-access
+
+        result = iati.validator.validate_is_xml(data)
+
+        assert result == data.parse_error_log
+        assert result is not data.parse_error_log
+
     @pytest.mark.parametrize("bytes_not_xml", iati.tests.utilities.generate_test_types(['bytes']))
     def test_xml_check_bytes_not_xml_detailed_output(self, bytes_not_xml):
         """Perform check to see whether a parameter is valid XML. The parameter is a bytes object that is not valid XML.
@@ -983,6 +1076,106 @@ class TestValidationVocabularies(ValidateCodelistsBase):
         assert iati.validator.is_valid(data, schema_sectors)
 
 
+class TestValidationCodelistSinglePass(ValidateCodelistsBase):
+    """A container for tests relating to checking values for all Codelists in a single pass over a Dataset."""
+
+    @pytest.fixture
+    def schema_all_codelists(self, request):
+        """Return an Activity Schema with all Codelists added."""
+        request.applymarker(pytest.mark.fixed_to_202)
+
+        return iati.default.activity_schema('2.02', True)
+
+    def check_codes_individually(self, dataset, schema):
+        """Check Codelist values one Codelist at a time, as the single pass should be equivalent to.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check.
+            schema (iati.ActivitySchema): The Schema containing Codelists to check against.
+
+        Returns:
+            iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+        """
+        error_log = iati.validator.ValidationErrorLog()
+        for codelist in schema.codelists:
+            error_log.extend(iati.validator._check_codes(dataset, codelist))  # pylint: disable=protected-access
+
+        return error_log
+
+    def summarise(self, error_log):
+        """Return the details of each error within a log, regardless of order."""
+        return collections.Counter((err.name, err.line_number, err.actual_value, err.info, err.help, err.context) for err in error_log)
+
+    @pytest.mark.parametrize('data_name', [
+        'valid_iati',
+        'valid_iati_codelist_mapping_element_text_invalid_code',
+        'valid_iati_incomplete_codelist_code_not_present',
+        'valid_iati_invalid_codes_multiple_xpaths_for_codelist_first',
+        'valid_iati_invalid_codes_multiple_xpaths_for_codelist_second',
+        'valid_iati_use_xml_lang',
+        'valid_iati_vocab_default_implicit_invalid_code',
+        'valid_iati_vocab_multiple_different_invalid_code',
+        'valid_iati_vocab_user_defined_with_uri_readable_bad_code'
+    ])
+    def test_single_pass_matches_individual_checks(self, data_name, schema_all_codelists):
+        """Check that checking all Codelists in a single pass produces the same errors as checking each Codelist individually."""
+        data = iati.tests.resources.load_as_dataset(data_name, '2.02')
+
+        single_pass_log = iati.validator._check_codelist_values(data, schema_all_codelists)  # pylint: disable=protected-access
+        individual_log = self.check_codes_individually(data, schema_all_codelists)
+
+        assert self.summarise(single_pass_log) == self.summarise(individual_log)
+
+    def test_single_pass_matches_individual_checks_invalid_version(self, schema_version, schema_org_type):
+        """Check that checking all Codelists in a single pass produces the same errors as checking each Codelist individually when a Dataset is at an unknown version."""
+        data = iati.tests.resources.load_as_dataset('valid_iati', '2.02')
+        data.xml_tree.getroot().set('version', '2.04')
+        schema_version.codelists.update(schema_org_type.codelists)
+
+        single_pass_log = iati.validator._check_codelist_values(data, schema_version)  # pylint: disable=protected-access
+        individual_log = self.check_codes_individually(data, schema_version)
+
+        assert len(single_pass_log) == 2
+        assert self.summarise(single_pass_log) == self.summarise(individual_log)
+
+    def test_single_pass_no_codelists(self, schema_basic):
+        """Check that there are no Codelist errors when a Schema has no Codelists."""
+        data = iati.tests.resources.load_as_dataset('valid_iati_vocab_default_implicit_invalid_code', '2.02')
+
+        assert len(iati.validator._check_codelist_values(data, schema_basic)) == 0  # pylint: disable=protected-access
+
+    def test_single_pass_errors_in_document_order(self, schema_all_codelists):
+        """Check that errors are logged in the order that values are located within the Dataset."""
+        data = iati.Dataset('<iati-activities version="2.02">\n<iati-activity xml:lang="xx">\n<activity-status code="99" />\n<sector code="1" />\n<activity-scope code="99" />\n</iati-activity>\n</iati-activities>')
+
+        error_log = iati.validator._check_codelist_values(data, schema_all_codelists)  # pylint: disable=protected-access
+
+        assert [(err.line_number, err.actual_value) for err in error_log] == [(2, 'xx'), (3, '99'), (4, '1'), (5, '99')]
+
+    def test_single_pass_stops_locating_values_once_log_full(self, schema_all_codelists, monkeypatch):
+        """Check that no further values are located once the log is full."""
+        data = iati.tests.resources.load_as_dataset('valid_iati_invalid_codes_multiple_xpaths_for_codelist_second', '2.02')
+        located_values = list()
+        iter_located_codes = iati.codelists.CodelistMapping.iter_located_codes
+
+        def record_iter_located_codes(self, tree, codelist_names=None):
+            """Record each value as it is located."""
+            for located_value in iter_located_codes(self, tree, codelist_names):
+                located_values.append(located_value)
+                yield located_value
+
+        monkeypatch.setattr(iati.codelists.CodelistMapping, 'iter_located_codes', record_iter_located_codes)
+        iati.validator._check_codelist_values(data, schema_all_codelists)  # pylint: disable=protected-access
+        all_value_count = len(located_values)
+        del located_values[:]
+
+        error_log = iati.validator._check_codelist_values(data, schema_all_codelists, error_log=iati.validator.ValidationErrorLog(stop_on_first_error=True))  # pylint: disable=protected-access
+
+        assert error_log.is_full()
+        assert 0 < len(located_values) < all_value_count
+
+
 class TestValidateRulesets:
     """A container for tests relating to validation of Rulesets."""
 
@@ -1025,6 +1218,7 @@ class TestValidateRulesets:
         data_with_multiple_rule_errors = iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_multiple_rule_errors', '2.02')
         ruleset_1 = iati.default.ruleset('2.02')
         ruleset_2 = iati.default.ruleset('2.02')
+        ruleset_2.rules.add(iati.RuleAtLeastOne('//iati-activity', {'paths': ['iati-identifier']}))
         schema = iati.default.activity_schema('2.02', False)
         schema.rulesets.add(ruleset_1)
         schema.rulesets.add(ruleset_2)
@@ -1045,6 +1239,41 @@ class TestValidateRulesets:
         assert len(result.get_errors_or_warnings_by_category('rule')) >= 1
         assert result.get_errors_or_warnings_by_name('err-ruleset-conformance-fail') == []
 
+    @pytest.mark.parametrize("xml_file", [
+        'valid_std_ruleset',
+        'ruleset-std/invalid_std_ruleset_bad_date_order',
+        'ruleset-std/invalid_std_ruleset_bad_identifier',
+        'ruleset-std/invalid_std_ruleset_does_not_sum_100',
+        'ruleset-std/invalid_std_ruleset_multiple_rule_errors'
+    ])
+    @pytest.mark.fixed_to_202
+    def test_ruleset_conformance_xslt_backend(self, schema_ruleset, xml_file):
+        """Check that the XSLT backend produces the same errors as the Python backend."""
+        data = iati.tests.resources.load_as_dataset(xml_file, '2.02')
+
+        python_log = iati.validator._check_ruleset_conformance(data, schema_ruleset)  # pylint: disable=protected-access
+        xslt_log = iati.validator._check_ruleset_conformance(data, schema_ruleset, iati.validator.RULESET_BACKEND_XSLT)  # pylint: disable=protected-access
+
+        assert sorted((error.name, error.info) for error in xslt_log) == sorted((error.name, error.info) for error in python_log)
+
+    @pytest.mark.fixed_to_202
+    def test_ruleset_conformance_xslt_backend_line_numbers(self, schema_ruleset):
+        """Check that Rule errors from the XSLT backend have the line number of the element that caused the failure."""
+        data = iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_bad_date_order', '2.02')
+
+        result = iati.validator._check_ruleset_conformance(data, schema_ruleset, iati.validator.RULESET_BACKEND_XSLT)  # pylint: disable=protected-access
+        error = result.get_errors_or_warnings_by_name('err-rule-date-order-conformance-fail')[0]
+
+        assert data.xml_tree.xpath('//iati-activity')[0].sourceline == error.line_number
+        assert error.context
+
+    def test_ruleset_conformance_invalid_backend(self, schema_ruleset):
+        """Check that a ValueError is raised when an unknown Ruleset backend is requested."""
+        data = iati.tests.resources.load_as_dataset('valid_std_ruleset', '2.02')
+
+        with pytest.raises(ValueError):
+            iati.validator._check_ruleset_conformance(data, schema_ruleset, 'not-a-backend')  # pylint: disable=protected-access
+
 
 class TestValidatorFullValidation(ValidateCodelistsBase):
     """A container for tests relating to detailed error output from validation."""
@@ -1126,3 +1355,314 @@ class TestValidatorFullValidation(ValidateCodelistsBase):
 
         assert len(result.get_errors_or_warnings_by_category('rule')) > 1
         assert len(result.get_errors_or_warnings_by_name('err-ruleset-conformance-fail')) == 1
+
+
+class TestValidateMany:
+    """A container for tests relating to validating a number of Datasets in worker processes."""
+
+    @pytest.fixture
+    def schema(self):
+        """Return a Schema populated with Codelists and Rulesets."""
+        return iati.default.activity_schema('2.02')
+
+    @pytest.fixture
+    def dataset_names(self):
+        """Return the names of Datasets that produce different errors."""
+        return ['valid_iati', 'valid_iati_invalid_code', 'ruleset-std/invalid_std_ruleset_multiple_rule_errors', 'invalid_iati_missing_required_element']
+
+    @staticmethod
+    def error_summary(error_log):
+        """Summarise an error log so that it may be compared with a log created in a different process.
+
+        Args:
+            error_log (iati.validator.ValidationErrorLog): The log to summarise.
+
+        Returns:
+            collections.Counter: The number of errors with each combination of name, line number and context.
+
+        """
+        return collections.Counter((error.name, getattr(error, 'line_number', None), getattr(error, 'context', None)) for error in error_log)
+
+    @pytest.mark.fixed_to_202
+    def test_validate_many_matches_full_validation(self, schema, dataset_names):
+        """Check that paths, bytes and Datasets are each given the same errors as full validation."""
+        datasets = [iati.tests.resources.load_as_dataset(dataset_name, '2.02') for dataset_name in dataset_names]
+        sources = [iati.tests.resources.get_test_data_path(dataset_name, '2.02') for dataset_name in dataset_names]
+        sources += [dataset.xml_str.encode('utf-8') for dataset in datasets] + datasets
+
+        results = list(iati.validator.validate_many(sources, schema, workers=2))
+
+        assert [source for source, _ in results] == sources
+        for (_, error_log), dataset in zip(results, datasets * 3):
+            assert self.error_summary(error_log) == self.error_summary(iati.validator.full_validation(dataset, schema))
+
+    @pytest.mark.fixed_to_202
+    def test_validate_many_unordered(self, schema, dataset_names):
+        """Check that every source is given a result when results are yielded in the order that they complete."""
+        sources = [iati.tests.resources.get_test_data_path(dataset_name, '2.02') for dataset_name in dataset_names]
+
+        results = dict(iati.validator.validate_many(sources, schema, workers=2, ordered=False))
+
+        assert sorted(results) == sorted(sources)
+        assert results[sources[1]].contains_errors()
+
+    def test_validate_many_not_xml(self, schema):
+        """Check that a source that is not XML is given the errors that prevented it from being parsed."""
+        results = list(iati.validator.validate_many([b'<a>'], schema, workers=1))
+
+        assert [error.name for error in results[0][1]] == ['err-not-xml-uncategorised-xml-syntax-error']
+
+    def test_validate_many_reads_sources_in_batches(self, schema):
+        """Check that sources are read a batch at a time, rather than all being read before results are yielded."""
+        read_sources = []
+
+        def sources():
+            for _ in range(20):
+                read_sources.append(b'<a>')
+                yield b'<a>'
+
+        results = iati.validator.validate_many(sources(), schema, workers=1)
+        next(results)
+
+        assert len(read_sources) == 2 * iati.validator.VALIDATE_MANY_BATCH_SIZE
+        assert len(list(results)) == 19
+        assert len(read_sources) == 20
+
+    @pytest.mark.parametrize('not_source', [1, None, ['a list']])
+    def test_validate_many_invalid_source_type(self, schema, not_source):
+        """Check that sources other than paths, bytes or Datasets are rejected."""
+        with pytest.raises(TypeError):
+            list(iati.validator.validate_many([not_source], schema, workers=1))
+
+
+class TestValidateIsIATIXMLInChunks:
+    """A container for tests relating to validating chunks of a Dataset against a Schema in a number of threads."""
+
+    @pytest.fixture
+    def schema(self):
+        """Return an unpopulated Activity Schema."""
+        return iati.default.activity_schema('2.02', False)
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        """Split Datasets into chunks of two activities, so that small Datasets are split into a number of chunks."""
+        monkeypatch.setattr(iati.validator, 'XSD_CHUNK_SIZE', 2)
+
+    @staticmethod
+    def error_details(error_log):
+        """Return the details of each error in a log, in order.
+
+        Args:
+            error_log (iati.validator.ValidationErrorLog): The log to return details of.
+
+        Returns:
+            list of tuple: The name, line number and message of each error.
+
+        """
+        return [(error.name, error.line_number, error.info) for error in error_log]
+
+    @pytest.mark.parametrize('threads', [2, 3, 8])
+    def test_validate_in_chunks_matches_single_thread(self, schema, threads):
+        """Check that validating in chunks finds the same errors, in the same order, as validating the whole Dataset at once."""
+        xml_str = """<iati-activities version="2.02" generated-datetime="not-a-datetime">
+            <!-- a comment that is not an activity -->
+            <iati-activity><iati-identifier>AA-1</iati-identifier></iati-activity>
+            <iati-activity><iati-identifier>AA-2</iati-identifier><not-an-element /></iati-activity>
+            <iati-activity />
+            <iati-activity><iati-identifier>AA-4</iati-identifier></iati-activity>
+            <iati-activity last-updated-datetime="not-a-datetime"><iati-identifier>AA-5</iati-identifier></iati-activity>
+        </iati-activities>"""
+        dataset = iati.Dataset(xml_str)
+
+        expected_errors = iati.validator.validate_is_iati_xml(dataset, schema)
+        result = iati.validator.validate_is_iati_xml(dataset, schema, threads=threads)
+
+        assert len(expected_errors.get_errors_or_warnings_by_name('err-not-iati-xml-incorrect-datatype')) == 2
+        assert self.error_details(result) == self.error_details(expected_errors)
+
+    @pytest.mark.fixed_to_202
+    @pytest.mark.parametrize('dataset_name', [
+        'valid_iati',
+        'invalid_iati_missing_required_element',
+        'ssot-org-xml-fail/01-empty-organization.xml'
+    ])
+    def test_validate_in_chunks_test_data(self, schema, dataset_name):
+        """Check that validating test data in chunks finds the same errors as validating the whole Dataset at once."""
+        dataset = iati.tests.resources.load_as_dataset(dataset_name, '2.02')
+
+        result = iati.validator.validate_is_iati_xml(dataset, schema, threads=2)
+
+        assert self.error_details(result) == self.error_details(iati.validator.validate_is_iati_xml(dataset, schema))
+
+    @pytest.mark.parametrize('threads', [2, 3])
+    def test_validate_in_chunks_large_line_numbers(self, schema, threads):
+        """Check that errors beyond line 65535 are given the same line numbers as when validating the whole Dataset at once.
+
+        libxml2 does not keep line numbers above 65535 when elements are copied into chunks. The message of each error is not compared, since it contains the line number as reported by libxml2.
+
+        """
+        activity_xml = '<iati-activity last-updated-datetime="not-a-datetime"><iati-identifier>AA-1</iati-identifier><title /></iati-activity>\n'
+        xml_str = '<iati-activities version="2.02">{0}{1}</iati-activities>'.format('\n' * 65530, activity_xml * 10)
+        dataset = iati.Dataset(xml_str)
+
+        expected_errors = iati.validator.validate_is_iati_xml(dataset, schema)
+        result = iati.validator.validate_is_iati_xml(dataset, schema, threads=threads)
+
+        assert max(error.line_number for error in expected_errors) > 65535
+        assert [(error.name, error.line_number) for error in result] == [(error.name, error.line_number) for error in expected_errors]
+
+    def test_validate_in_chunks_reuses_validators(self, schema, monkeypatch):
+        """Check that the Schema is not compiled again when a Dataset is validated in chunks a second time."""
+        dataset = iati.Dataset('<iati-activities version="2.02">{0}</iati-activities>'.format('<iati-activity />' * 10))
+        iati.validator.validate_is_iati_xml(dataset, schema, threads=3)
+        compile_validator = iati.schemas.Schema._compile_validator  # pylint: disable=protected-access
+        compilations = list()
+
+        def counting_compile_validator(self):
+            """Record that the Schema has been compiled."""
+            compilations.append(self)
+            return compile_validator(self)
+
+        monkeypatch.setattr(iati.schemas.Schema, '_compile_validator', counting_compile_validator)
+        iati.validator.validate_is_iati_xml(dataset, schema, threads=3)
+
+        assert compilations == []
+
+    def test_validate_in_chunks_copies_chunks(self, schema, monkeypatch):
+        """Check that each chunk is a copy of the root element containing consecutive activities, with every other child of the root element in the first chunk."""
+        chunk_activities = list()
+
+        def check_xsd_chunk(chunk, root, children, schema, is_first_chunk):  # pylint: disable=unused-argument
+            """Record the content of the chunk."""
+            chunk_activities.append([element.get('id', element.tag) for element in chunk])
+            return iati.validator.ValidationErrorLog()
+
+        monkeypatch.setattr(iati.validator, '_check_xsd_chunk', check_xsd_chunk)
+        xml_str = '<iati-activities version="2.02">{0}<other /></iati-activities>'.format(''.join('<iati-activity id="{0}"/>'.format(index) for index in range(5)))
+        dataset = iati.Dataset(xml_str)
+
+        iati.validator.validate_is_iati_xml(dataset, schema, threads=2)
+
+        assert chunk_activities == [['0', '1', 'other'], ['2', '3'], ['4']]
+        assert len(dataset.xml_tree.getroot()) == 6
+
+
+class TestValidationLimits:
+    """A container for tests relating to validating with limits on the number of errors to find."""
+
+    @pytest.fixture
+    def schema(self):
+        """Return a Schema populated with Codelists and Rulesets."""
+        return iati.default.activity_schema('2.02')
+
+    @pytest.fixture
+    def dataset(self):
+        """Return a Dataset containing XSD, Codelist and Rule errors."""
+        return iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_multiple_rule_errors', '2.02')
+
+    @pytest.fixture
+    def checked_contexts(self, monkeypatch):
+        """Record the contexts that Rules are checked against."""
+        contexts = list()
+        results_for_context = iati.rulesets._results_for_context  # pylint: disable=protected-access
+
+        def record_results_for_context(dataset, context, rules):
+            """Record the context before checking the Rules."""
+            contexts.append(context)
+            return results_for_context(dataset, context, rules)
+
+        monkeypatch.setattr(iati.rulesets, '_results_for_context', record_results_for_context)
+
+        return contexts
+
+    @staticmethod
+    def error_details(error_log):
+        """Return the details of each error in a log, in order.
+
+        Args:
+            error_log (iati.validator.ValidationErrorLog): The log to return details of.
+
+        Returns:
+            list of tuple: The name, line number and message of each error.
+
+        """
+        return [(error.name, getattr(error, 'line_number', None), error.info) for error in error_log]
+
+    @pytest.mark.fixed_to_202
+    @pytest.mark.parametrize('max_errors', [1, 2, 5, 10])
+    def test_full_validation_max_errors(self, schema, dataset, max_errors):
+        """Check that validation with a maximum number of errors finds the errors that full validation finds first."""
+        full_error_log = iati.validator.full_validation(dataset, schema)
+
+        result = iati.validator.full_validation(dataset, schema, max_errors=max_errors)
+
+        assert len(full_error_log) > max_errors
+        assert self.error_details(result) == self.error_details(full_error_log)[:max_errors]
+
+    @pytest.mark.fixed_to_202
+    def test_full_validation_max_errors_per_code(self, schema, dataset):
+        """Check that validation with a maximum number of errors per code finds the first errors with each name that full validation finds."""
+        full_error_log = iati.validator.full_validation(dataset, schema)
+        expected_errors = list()
+        for error in full_error_log:
+            if [expected_error.name for expected_error in expected_errors].count(error.name) < 1:
+                expected_errors.append(error)
+
+        result = iati.validator.full_validation(dataset, schema, max_errors_per_code=1)
+
+        assert len(expected_errors) < len(full_error_log)
+        assert self.error_details(result) == self.error_details(expected_errors)
+
+    @pytest.mark.fixed_to_202
+    def test_full_validation_stop_on_first_error(self, schema, checked_contexts):
+        """Check that validation stops at the first error, without checking any Rules when a Codelist error is found."""
+        dataset = iati.tests.resources.load_as_dataset('valid_iati_invalid_code', '2.02')
+        full_error_log = iati.validator.full_validation(dataset, schema)
+        del checked_contexts[:]
+
+        result = iati.validator.full_validation(dataset, schema, stop_on_first_error=True)
+
+        assert self.error_details(result) == self.error_details(full_error_log.get_errors()[:1])
+        assert checked_contexts == []
+
+    @pytest.mark.fixed_to_202
+    def test_full_validation_max_errors_stops_checking_rules(self, schema, checked_contexts):
+        """Check that Rules stop being checked once the maximum number of errors has been found."""
+        dataset = iati.tests.resources.load_as_dataset('valid_iati', '2.02')
+        iati.validator.full_validation(dataset, schema)
+        all_context_count = len(checked_contexts)
+        del checked_contexts[:]
+
+        iati.validator.full_validation(dataset, schema, max_errors=1)
+
+        assert 0 < len(checked_contexts) < all_context_count
+
+    @pytest.mark.fixed_to_202
+    @pytest.mark.parametrize('dataset_name, expected_validity', [
+        ('valid_iati_minimal_file', True),
+        ('valid_iati', False),
+        ('valid_iati_invalid_code', False),
+        ('invalid_iati_missing_required_element', False)
+    ])
+    def test_is_valid_stops_on_first_error(self, schema, checked_contexts, dataset_name, expected_validity):
+        """Check that determining validity gives the same result as full validation, without checking Rules once an error has been found."""
+        dataset = iati.tests.resources.load_as_dataset(dataset_name, '2.02')
+        full_error_log = iati.validator.full_validation(dataset, schema)
+        first_error_is_rule_error = full_error_log.contains_errors() and full_error_log.get_errors()[0].category == 'rule'  # pylint: disable=no-member
+        del checked_contexts[:]
+
+        assert iati.validator.is_valid(dataset, schema) is expected_validity
+        assert not full_error_log.contains_errors() is expected_validity
+        assert bool(checked_contexts) is (expected_validity or first_error_is_rule_error)
+
+    @pytest.mark.fixed_to_202
+    def test_limits_do_not_split_into_chunks(self, schema, dataset, monkeypatch):
+        """Check that a Dataset is not split into chunks when validated with limits in a single thread."""
+        def check_is_iati_xml_in_chunks(*args):  # pylint: disable=unused-argument
+            """Fail, since the Dataset should be validated at once."""
+            raise AssertionError('The Dataset was validated in chunks.')
+
+        monkeypatch.setattr(iati.validator, '_check_is_iati_xml_in_chunks', check_is_iati_xml_in_chunks)
+
+        assert not iati.validator.is_valid(dataset, schema)
+        assert len(iati.validator.full_validation(dataset, schema, max_errors=2)) == 2
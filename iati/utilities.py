@@ -12,7 +12,6 @@ Example:
 import logging
 import os
 from io import StringIO
-import chardet
 from lxml import etree
 import iati
 
@@ -230,6 +229,7 @@ def load_as_string(path):
     except UnicodeDecodeError:
         # the file was not UTF-8, so perform a (slow) test to detect encoding
         # only use the first section of the file since this is generally enough and prevents big files taking ages
+        import chardet  # imported here since it is slow to import and rarely required
         detected_info = chardet.detect(loaded_bytes[:25000])
         try:
             loaded_str = loaded_bytes.decode(detected_info['encoding'])
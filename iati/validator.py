@@ -1,10 +1,86 @@
 """A module containing validation functionality."""
 
+import collections
+import concurrent.futures
+import copy
+import itertools
+import multiprocessing
+import os
 import sys
+import threading
+import types
 from lxml import etree
-import yaml
+import iati.constants
 import iati.default
 import iati.resources
+import iati.ruleset_xslt
+
+
+class _ErrorCodeTemplate:
+    """An immutable, pre-processed definition of a type of ValidationError.
+
+    Templates are built once when the error codes are loaded. A ValidationError then only needs to bind the values that are specific to its instance.
+
+    """
+
+    __slots__ = ('name', 'attributes', 'status')
+
+    def __init__(self, name, err_detail):
+        """Create a template for the error code with the given name.
+
+        Args:
+            name (str): The name of the error code.
+            err_detail (dict): The attributes of the error code, as defined in the error code file. The `base_exception` must already be resolved to a class.
+
+        """
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'attributes', tuple(err_detail.items()))
+        object.__setattr__(self, 'status', 'error' if name.split('-')[0] == 'err' else 'warning')
+
+    def __setattr__(self, name, value):
+        """Prevent modification of the template."""
+        raise AttributeError('Error code templates cannot be modified.')
+
+    def as_dict(self):
+        """Return a new dictionary containing the attributes of the error code.
+
+        Returns:
+            dict: The attributes of the error code.
+
+        """
+        return dict(self.attributes)
+
+
+RULESET_BACKEND_PYTHON = 'python'
+"""The Ruleset backend that checks each Rule in Python."""
+
+RULESET_BACKEND_XSLT = 'xslt'
+"""The Ruleset backend that checks Rules with an XSLT stylesheet that is compiled from the Ruleset. See `iati.ruleset_xslt`."""
+
+RULESET_BACKENDS = [RULESET_BACKEND_PYTHON, RULESET_BACKEND_XSLT]
+"""The permitted backends for checking Rulesets."""
+
+XSD_CHUNK_SIZE = 1000
+"""The maximum number of activities or organisations in each chunk of a Dataset that is validated against a Schema by a separate thread."""
+
+VALIDATE_MANY_BATCH_SIZE = 2
+"""The number of Datasets per worker process in each batch of work sent to the workers by `validate_many()`."""
+
+_ERROR_CODES = None
+"""A cache of the loaded error codes.
+
+This is a read-only mapping from error code names to `_ErrorCodeTemplate` instances. It is populated the first time that an error code is required and is shared between all threads.
+
+"""
+
+_ERROR_CODES_LOCK = threading.Lock()
+"""A lock to prevent the error codes being loaded multiple times by concurrent threads."""
+
+_LOG_ENTRY_ATTRIBUTES = ['column', 'domain', 'domain_name', 'filename', 'level', 'level_name', 'line', 'message', 'path', 'type', 'type_name']
+"""The attributes of an lxml log entry that are kept when a ValidationError is pickled."""
+
+_WORKER_SCHEMA = None
+"""The Schema that Datasets are validated against within a worker process started by `validate_many()`. `None` outside of worker processes."""
 
 
 class ValidationError:
@@ -32,7 +108,7 @@ class ValidationError:
             calling_locals = dict()
 
         try:
-            err_detail = get_error_codes()[err_name]
+            template = _error_code_registry()[err_name]
         except (KeyError, TypeError):
             raise ValueError('{err_name} is not a known type of ValidationError.'.format(**locals()))
 
@@ -40,10 +116,10 @@ class ValidationError:
         self.name = err_name
         self.actual_value = None
 
-        for key, val in err_detail.items():
+        for key, val in template.attributes:
             setattr(self, key, val)
 
-        self.status = 'error' if err_name.split('-')[0] == 'err' else 'warning'
+        self.status = template.status
 
         # format error messages with context-specific info
         try:
@@ -69,6 +145,18 @@ class ValidationError:
         except (AttributeError, KeyError):
             pass
 
+    def __getstate__(self):
+        """Return the state of the ValidationError for pickling.
+
+        lxml log entries cannot be pickled, so an `err` that is a log entry is replaced with a namespace holding the same attributes.
+
+        """
+        state = self.__dict__.copy()
+        if isinstance(state.get('err'), etree._LogEntry):  # pylint: disable=protected-access
+            state['err'] = types.SimpleNamespace(**{attr_name: getattr(self.err, attr_name) for attr_name in _LOG_ENTRY_ATTRIBUTES})
+
+        return state
+
 
 class ValidationErrorLog:
     """A container to keep track of a set of ValidationErrors.
@@ -85,9 +173,24 @@ class ValidationErrorLog:
 
     """
 
-    def __init__(self):
-        """Initialise the error log."""
+    def __init__(self, max_errors=None, max_errors_per_code=None, stop_on_first_error=False):
+        """Initialise the error log.
+
+        Args:
+            max_errors (int): The maximum number of ValidationErrors to keep, including warnings. Default is no limit.
+            max_errors_per_code (int): The maximum number of ValidationErrors with each name to keep. Default is no limit.
+            stop_on_first_error (bool): Whether to stop keeping ValidationErrors once one with a status of `error` has been added. Default `False`.
+
+        Note:
+            ValidationErrors that are added beyond these limits are discarded. Validation functions that are given a log to add to stop checking for errors once it is full.
+
+        """
         self._values = []
+        self.max_errors = max_errors
+        self.max_errors_per_code = max_errors_per_code
+        self.stop_on_first_error = stop_on_first_error
+        self._counts_by_name = collections.Counter()
+        self._error_added = False
 
     def __iter__(self):
         """Return an iterator."""
@@ -121,11 +224,53 @@ class ValidationErrorLog:
         Raises:
             TypeError: When attempting to set an item that is not a ValidationError.
 
+        Note:
+            The ValidationError is discarded when the log does not accept errors with its name. See `accepts()`.
+
         """
         if not isinstance(value, iati.validator.ValidationError):
             raise TypeError('Only ValidationErrors may be added to a ValidationErrorLog.')
 
+        if not self.accepts(value.name):
+            return
+
         self._values.append(value)
+        self._counts_by_name[value.name] += 1
+        if value.status == 'error':
+            self._error_added = True
+
+    def accepts(self, err_name):
+        """Determine whether a ValidationError with the specified name would be kept if it were added to the log.
+
+        Args:
+            err_name (str): The name of the error.
+
+        Returns:
+            bool: Whether the error would be kept. `False` when the log is full, or already contains the maximum number of errors with the name.
+
+        """
+        if self.is_full():
+            return False
+
+        return self.max_errors_per_code is None or self._counts_by_name[err_name] < self.max_errors_per_code
+
+    def has_limits(self):
+        """Determine whether the log has limits on the ValidationErrors that it keeps.
+
+        Returns:
+            bool: Whether any of `max_errors`, `max_errors_per_code` or `stop_on_first_error` are set.
+
+        """
+        return self.max_errors is not None or self.max_errors_per_code is not None or self.stop_on_first_error
+
+    def is_full(self):
+        """Determine whether the log has reached its limits, so that no further ValidationErrors will be kept.
+
+        Returns:
+            bool: Whether the log contains `max_errors` ValidationErrors, or contains an error when `stop_on_first_error` is set.
+
+        """
+        return (self.max_errors is not None and len(self._values) >= self.max_errors) or (self.stop_on_first_error and self._error_added)
 
     def contains_error_called(self, err_name):
         """Check the log for an error or warning with the specified name.
@@ -272,166 +417,161 @@ class ValidationErrorLog:
         return [err for err in self if err.status == 'warning']
 
 
-def _extract_codes_from_attrib(dataset, parent_el_xpath, attr_name, condition=None):
-    """Extract codes for checking from a Dataset. The codes are being extracted from attributes.
+def _check_codes(dataset, codelist):
+    """Determine whether a given Dataset has values from the specified Codelist where expected.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        parent_el_xpath (str): An XPath to locate the element(s) with the attribute of interest.
-        attr_name (str): The name of the attribute to extract a code from.
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+        codelist (iati.codelists.Codelist): The Codelist to check values from.
 
     Returns:
-        list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
-    """
-    if condition is None:
-        parent_el_xpath = parent_el_xpath + '[@' + attr_name + ']'
-    else:
-        parent_el_xpath = parent_el_xpath + '[' + condition + ' and @' + attr_name + ']'
+    Raises:
+        ValueError: When a path in a mapping is looking for a type of information that is not supported.
 
-    # some nasty string manipulation to make the `//@xml:lang` mapping work
-    while not parent_el_xpath.startswith('//'):
-        parent_el_xpath = '/' + parent_el_xpath
-    if parent_el_xpath.startswith('//['):
-        parent_el_xpath = '//*[' + parent_el_xpath[3:]
-    # provide a secondary cludge to deal with the 'xml' namespace
-    if attr_name == 'xml:lang':
-        attr_name = '{http://www.w3.org/XML/1998/namespace}lang'
+    Note:
+        This code assumes that the Version codelist acts as a list of all possible version numbers.
 
-    parents_to_check = dataset.xml_tree.xpath(parent_el_xpath)
+    """
+    error_log = ValidationErrorLog()
+    mappings, (codelist,) = _codelists_to_check(dataset, [codelist])
 
-    located_codes = list()
-    for parent in parents_to_check:
-        located_codes.append((parent.attrib[attr_name], parent.sourceline))
+    for mapping in mappings[codelist.name]:
+        error_log.extend(_check_located_codes(dataset, codelist, mapping, mapping.extract_codes(dataset.xml_tree)))
 
-    return located_codes
+    return error_log
 
 
-def _extract_codes_from_element_text(dataset, parent_el_xpath, condition=None):  # pylint: disable=invalid-name
-    """Extract codes for checking from a Dataset. The codes are being extracted from element text.
+def _check_codelist_values(dataset, schema, element=None, codelists_to_check=None, error_log=None):
+    """Check whether a given Dataset has values from Codelists that have been added to a Schema where expected.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        parent_el_xpath (str): An XPath to locate the element(s) with the attribute of interest.
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+        schema (iati.schemas.Schema): The Schema to locate Codelists within.
+        element (etree._Element): The element within the Dataset to check values within, including its descendants. Default is the whole Dataset.
+        codelists_to_check (tuple): The Codelist mapping and Codelists to check values against, in the format returned by `_codelists_to_check()`. Default is to determine these from the version of the Dataset.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. Checking stops once it is full. Default is a new log.
 
     Returns:
-        list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
-
-    """
-    # include the condition
-    if condition:
-        parent_el_xpath = parent_el_xpath + '[' + condition + ']'
-
-    parents_to_check = dataset.xml_tree.xpath(parent_el_xpath)
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
-    located_codes = list()
-    for parent in parents_to_check:
-        located_codes.append((parent.text, parent.sourceline))
+    Raises:
+        ValueError: When a path in a mapping is looking for a type of information that is not supported.
 
-    return located_codes
+    Note:
+        Values for every Codelist are located in a single pass over the Dataset, and each value is checked as soon as it is located. As such, no more of the Dataset is walked once the log is full.
 
+        The resulting log contains the same errors as when each Codelist is checked in turn with `_check_codes()`. Errors are in the order that values are located by `iati.codelists.CodelistMapping.iter_located_codes()`.
 
-def _extract_codes(dataset, parent_el_xpath, last_xpath_section, condition=None):
-    """Extract codes for checking from a Dataset.
+    """
+    if error_log is None:
+        error_log = ValidationErrorLog()
 
-    Args:
-        dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        parent_el_xpath (str): An XPath to locate the element(s) with the code of interest.
-        last_xpath_section (str): The last section of the XPath, detailing how to find the code on the identified element(s).
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+    if not schema.codelists or error_log.is_full():
+        return error_log
 
-    list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+    mappings, codelists = _codelists_to_check(dataset, list(schema.codelists)) if codelists_to_check is None else codelists_to_check
+    codelists_by_name = collections.defaultdict(list)
+    for codelist in codelists:
+        codelists_by_name[codelist.name].append((codelist, codelist.code_values))
 
-    Raises:
-        ValueError: When a path in a mapping is not looking for an attribute value or element text.
+    for mapping, code, line_number in mappings.iter_located_codes(dataset.xml_tree if element is None else element, codelists_by_name.keys()):
+        for codelist, code_values in codelists_by_name[mapping.codelist_name]:
+            if code not in code_values:
+                _add_code_not_on_codelist_error(error_log, dataset, codelist, mapping, code, line_number)
+                if error_log.is_full():
+                    return error_log
 
-    """
-    if last_xpath_section.startswith('@'):
-        attr_name = last_xpath_section[1:]
-        return _extract_codes_from_attrib(dataset, parent_el_xpath, attr_name, condition)
-    elif last_xpath_section == 'text()':
-        return _extract_codes_from_element_text(dataset, parent_el_xpath, condition)
-    else:
-        raise ValueError('mapping path does not locate attribute value or element text')
+    return error_log
 
 
-def _check_codes(dataset, codelist):
-    """Determine whether a given Dataset has values from the specified Codelist where expected.
+def _check_located_codes(dataset, codelist, mapping, located_codes, error_log=None):
+    """Check whether values located by a Codelist mapping are on the relevant Codelist.
 
     Args:
-        dataset (iati.data.Dataset): The Dataset to check Codelist values within.
+        dataset (iati.data.Dataset): The Dataset that the values were located within.
         codelist (iati.codelists.Codelist): The Codelist to check values from.
+        mapping (iati.codelists.CodelistMappingEntry): The mapping that located the values.
+        located_codes (list of tuple): The located values, in the format returned by `mapping.extract_codes()`.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. Checking stops once it is full. Default is a new log.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
-    Raises:
-        ValueError: When a path in a mapping is looking for a type of information that is not supported.
+    """
+    if error_log is None:
+        error_log = ValidationErrorLog()
 
-    Note:
-        This code assumes that the Version codelist acts as a list of all possible version numbers.
+    code_values = codelist.code_values
 
-    """
-    error_log = ValidationErrorLog()
+    for (code, line_number) in located_codes:
+        if code not in code_values:
+            _add_code_not_on_codelist_error(error_log, dataset, codelist, mapping, code, line_number)
+            if error_log.is_full():
+                break
 
-    # clunky workaround due to pre-#230 behavior of `iati.Dataset().version`
-    if dataset.version in iati.version.STANDARD_VERSIONS:
-        mappings = iati.default.codelist_mapping(dataset.version)
-    else:
-        # rather than attempting general checks, ensure version number errors occur
-        codelist = iati.default.codelist('Version', iati.version.STANDARD_VERSION_LATEST)
-        mappings = iati.default.codelist_mapping(iati.version.STANDARD_VERSION_LATEST)
+    return error_log
 
-    err_name_prefix = 'err' if codelist.complete else 'warn'
 
-    for mapping in mappings[codelist.name]:
-        parent_el_xpath, last_xpath_section = mapping['xpath'].rsplit('/', 1)
+def _add_code_not_on_codelist_error(error_log, dataset, codelist, mapping, code, line_number):  # `dataset` and `line_number` used via `locals()` # pylint: disable=unused-argument
+    """Log that a value located by a Codelist mapping is not on the relevant Codelist.
 
-        located_codes = _extract_codes(dataset, parent_el_xpath, last_xpath_section, mapping['condition'])
+    Args:
+        error_log (iati.validator.ValidationErrorLog): The log to add the error to. No error is created when the log does not accept it.
+        dataset (iati.data.Dataset): The Dataset that the value was located within.
+        codelist (iati.codelists.Codelist): The Codelist that the value should be on.
+        mapping (iati.codelists.CodelistMappingEntry): The mapping that located the value.
+        code (str): The value.
+        line_number (int): The sourceline of the element that the value was located on.
 
-        for (code, line_number) in located_codes:  # `line_number` used via `locals()` # pylint: disable=unused-variable
-            if code not in codelist.codes:
-                if last_xpath_section.startswith('@'):
-                    attr_name = last_xpath_section[1:]  # used via `locals()`  # pylint: disable=unused-variable
-                    error = ValidationError(err_name_prefix + '-code-not-on-codelist', locals())
-                else:
-                    _, el_name = parent_el_xpath.rsplit('/', 1)  # used via `locals()` # pylint: disable=unused-variable
-                    error = ValidationError(err_name_prefix + '-code-not-on-codelist-element-text', locals())
+    """
+    err_name_prefix = 'err' if codelist.complete else 'warn'
+    err_name = err_name_prefix + ('-code-not-on-codelist' if mapping.attr_name is not None else '-code-not-on-codelist-element-text')
 
-                error.actual_value = code
+    if not error_log.accepts(err_name):
+        return
 
-                error_log.add(error)
+    if mapping.attr_name is not None:
+        attr_name = mapping.attr_name  # used via `locals()`  # pylint: disable=unused-variable
+    else:
+        el_name = mapping.el_name  # used via `locals()` # pylint: disable=unused-variable
 
-    return error_log
+    error = ValidationError(err_name, locals())
+    error.actual_value = code
 
+    error_log.add(error)
 
-def _check_codelist_values(dataset, schema):
-    """Check whether a given Dataset has values from Codelists that have been added to a Schema where expected.
+
+def _codelists_to_check(dataset, codelists):
+    """Determine the Codelist mapping and Codelists to use when checking values within a Dataset.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        schema (iati.schemas.Schema): The Schema to locate Codelists within.
+        codelists (list of iati.codelists.Codelist): The Codelists that values are to be checked against.
 
     Returns:
-        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+        tuple: A tuple in the format: `(iati.codelists.CodelistMapping, list of iati.codelists.Codelist)`. The list contains one Codelist for each of the input Codelists.
 
     """
-    error_log = ValidationErrorLog()
-
-    for codelist in schema.codelists:
-        error_log.extend(_check_codes(dataset, codelist))
+    # clunky workaround due to pre-#230 behavior of `iati.Dataset().version`
+    if dataset.version in iati.version.STANDARD_VERSIONS:
+        return iati.default._codelist_mapping(dataset.version), codelists  # pylint: disable=protected-access
 
-    return error_log
+    # rather than attempting general checks, ensure version number errors occur
+    version_codelist = iati.default.codelist('Version', iati.version.STANDARD_VERSION_LATEST)
+    return iati.default._codelist_mapping(iati.version.STANDARD_VERSION_LATEST), [version_codelist] * len(codelists)  # pylint: disable=protected-access
 
 
-def _check_is_iati_xml(dataset, schema):
+def _check_is_iati_xml(dataset, schema, element=None, threads=1, error_log=None):
     """Check whether a given Dataset contains valid IATI XML.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check validity of.
         schema (iati.schemas.Schema): The Schema to validate the Dataset against.
+        element (etree._Element): An element within the Dataset to validate as though it were the root element. Default is the whole Dataset.
+        threads (int): The number of threads to validate the Dataset with. Default 1.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. Default is a new log.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
@@ -440,11 +580,29 @@ def _check_is_iati_xml(dataset, schema):
         TypeError: Something was provided as a Dataset that is not a Dataset.
         iati.exceptions.SchemaError: An error occurred in the parsing of the Schema.
 
+    Note:
+        When more than one thread is specified, the whole Dataset is validated in chunks of activities or organisations. See `_check_is_iati_xml_in_chunks()`. A Dataset with a root element other than that of the Schema is validated in a single thread.
+
+        Within a single thread, the Dataset is validated at once. Errors stop being added once the log is full.
+
     Todo:
         Create test against a bad Schema.
 
     """
-    error_log = ValidationErrorLog()
+    if error_log is None:
+        error_log = ValidationErrorLog()
+
+    if error_log.is_full():
+        return error_log
+
+    if element is None and threads > 1:
+        try:
+            root = dataset.xml_tree.getroot()
+        except AttributeError:
+            raise TypeError('Unexpected argument: {0} is not an iati.Dataset'.format(type(dataset)))
+
+        if root.tag == schema.ROOT_ELEMENT_NAME:
+            return _check_is_iati_xml_in_chunks(root, schema, threads, error_log)
 
     try:
         validator = schema.validator()
@@ -452,26 +610,198 @@ def _check_is_iati_xml(dataset, schema):
         raise err
 
     try:
-        validator.assertValid(dataset.xml_tree)
+        validator.assertValid(dataset.xml_tree if element is None else element)
     except etree.DocumentInvalid as doc_invalid:
         for log_entry in doc_invalid.error_log:  # pylint: disable=no-member
             error = _create_error_for_lxml_log_entry(log_entry)
             error_log.add(error)
+            if error_log.is_full():
+                break
     except AttributeError:
         raise TypeError('Unexpected argument: {0} is not an iati.Dataset'.format(type(dataset)))
 
     return error_log
 
 
+def _check_is_iati_xml_in_chunks(root, schema, threads, error_log=None):
+    """Check whether a tree contains valid IATI XML, validating chunks of its activities or organisations in a number of threads.
+
+    Args:
+        root (etree._Element): The root element of the tree to check validity of.
+        schema (iati.schemas.Schema): The Schema to validate the tree against.
+        threads (int): The number of threads to validate the chunks with.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. No further chunks are validated once it is full. Default is a new log.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred. This contains the same errors, with the same line numbers, as when the whole tree is validated at once.
+
+    Note:
+        Each chunk is validated against a compiled Schema that is borrowed from the pool of the Schema, so that no two threads use the same one at once. lxml releases the GIL while validating, so chunks are validated in parallel.
+
+        The pool is kept between calls, so the Schema is only compiled again when more threads are used than ever before.
+
+        Chunks are copied from the tree as they are required, so that a limited number are held in memory at a time. The errors from each chunk are added to the log in document order.
+
+    Warning:
+        Elements other than activities or organisations are all validated within the first chunk. Errors for any that follow the first chunk are therefore logged ahead of those for the activities or organisations that precede them.
+
+    """
+    if error_log is None:
+        error_log = ValidationErrorLog()
+
+    record_tag = iati.constants.RECORD_TAGS[root.tag]
+    record_count = sum(1 for _ in root.iterchildren(record_tag))
+    chunk_size = max(min(XSD_CHUNK_SIZE, -(-record_count // threads)), 1)
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        pending_chunks = collections.deque()
+        for chunk_index, (chunk, children) in enumerate(_xsd_chunks(root, record_tag, chunk_size)):
+            pending_chunks.append(executor.submit(_check_xsd_chunk, chunk, root, children, schema, chunk_index == 0))
+            if len(pending_chunks) > threads * 2:
+                error_log.extend(pending_chunks.popleft().result())
+            if error_log.is_full():
+                break
+
+        while pending_chunks and not error_log.is_full():
+            error_log.extend(pending_chunks.popleft().result())
+
+        for pending_chunk in pending_chunks:
+            pending_chunk.cancel()
+
+    return error_log
+
+
+def _xsd_chunks(root, record_tag, chunk_size):
+    """Split a tree into chunks that may be validated against a Schema independently.
+
+    Args:
+        root (etree._Element): The root element of the tree to split.
+        record_tag (str): The tag of the activities or organisations within the root element.
+        chunk_size (int): The maximum number of activities or organisations in each chunk.
+
+    Yields:
+        tuple: A tuple in the format: `(etree._Element, list of etree._Element)` - The `etree._Element` is a chunk in the format returned by `_xsd_chunk()`; The list contains the children of the root element that the chunk contains copies of.
+
+    Note:
+        The first chunk contains a number of consecutive activities or organisations, plus every other child of the root element. Later chunks contain consecutive activities or organisations only.
+
+    """
+    children = list()
+    record_count = 0
+    for child in root:
+        if child.tag != record_tag:
+            children.append(child)
+        elif record_count < chunk_size:
+            children.append(child)
+            record_count += 1
+    yield _xsd_chunk(root, children), children
+
+    records = root.iterchildren(record_tag)
+    for _ in range(chunk_size):
+        next(records, None)
+
+    children = list()
+    for record in records:
+        children.append(record)
+        if len(children) == chunk_size:
+            yield _xsd_chunk(root, children), children
+            children = list()
+
+    if children:
+        yield _xsd_chunk(root, children), children
+
+
+def _xsd_chunk(root, children):
+    """Create a copy of a root element, containing copies of some of its children.
+
+    Args:
+        root (etree._Element): The root element to copy.
+        children (list of etree._Element): The children of the root element to copy into the chunk.
+
+    Returns:
+        etree._Element: The copy, which has the same tag, attributes, namespaces, text and line number as the root element.
+
+    Warning:
+        Line numbers above 65535 are not kept when an element is copied. See `_copied_line_numbers()`.
+
+    """
+    chunk = etree.Element(root.tag, root.attrib, nsmap=root.nsmap)
+    chunk.sourceline = root.sourceline
+    chunk.text = root.text
+    for child in children:
+        chunk.append(copy.deepcopy(child))
+
+    return chunk
+
+
+def _copied_line_numbers(chunk, root, children):
+    """Determine the line numbers of the original elements that a chunk contains copies of, where these were not kept when copying.
+
+    libxml2 does not store line numbers above 65535 on the elements themselves. These line numbers are lost when an element is copied, so must be taken from the original element instead.
+
+    Args:
+        chunk (etree._Element): A chunk in the format returned by `_xsd_chunk()`.
+        root (etree._Element): The root element that the chunk is a copy of.
+        children (list of etree._Element): The children of the root element that the chunk contains copies of, in the same order.
+
+    Returns:
+        dict: A dictionary mapping the path of each element within the chunk that has a different line number to its original element, in the format used by lxml log entries, to the line number of the original element.
+
+    """
+    line_numbers = dict()
+    chunk_tree = chunk.getroottree()
+
+    if chunk.sourceline != root.sourceline:
+        line_numbers[chunk_tree.getpath(chunk)] = root.sourceline
+    for child_copy, child in zip(chunk, children):
+        for element_copy, element in zip(child_copy.iter(), child.iter()):
+            if element_copy.sourceline != element.sourceline:
+                line_numbers[chunk_tree.getpath(element_copy)] = element.sourceline
+
+    return line_numbers
+
+
+def _check_xsd_chunk(chunk, root, children, schema, is_first_chunk):
+    """Validate a chunk of a tree against a Schema, within the current thread.
+
+    Args:
+        chunk (etree._Element): The chunk to validate, in the format returned by `_xsd_chunk()`.
+        root (etree._Element): The root element that the chunk is a copy of.
+        children (list of etree._Element): The children of the root element that the chunk contains copies of, in the same order.
+        schema (iati.schemas.Schema): The Schema to validate the chunk against.
+        is_first_chunk (bool): Whether this is the first chunk of the tree. Errors for the root element itself are logged for the first chunk only, since every chunk contains a copy of it.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred. Errors have the line numbers of the original elements.
+
+    """
+    error_log = ValidationErrorLog()
+    root_path = '/' + chunk.tag
+
+    try:
+        with schema.borrowed_validator() as validator:
+            validator.assertValid(chunk)
+    except etree.DocumentInvalid as doc_invalid:
+        line_numbers = _copied_line_numbers(chunk, root, children)
+        for log_entry in doc_invalid.error_log:  # pylint: disable=no-member
+            if is_first_chunk or log_entry.path != root_path:
+                error_log.add(_create_error_for_lxml_log_entry(log_entry, line_numbers.get(log_entry.path)))
+
+    return error_log
+
+
 def _check_is_xml(maybe_xml):
     """Check whether a given parameter is valid XML.
 
     Args:
-        maybe_xml (str / bytes): A string that may or may not contain valid XML.
+        maybe_xml (str / bytes / iati.data.Dataset): A string that may or may not contain valid XML, or a Dataset.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    Note:
+        A Dataset is not parsed again. The errors found when its XML was parsed are returned instead.
+
     Todo:
         Consider how a Dataset may be passed when creating errors so that context can be obtained.
 
@@ -479,11 +809,33 @@ def _check_is_xml(maybe_xml):
     error_log = ValidationErrorLog()
 
     if isinstance(maybe_xml, iati.data.Dataset):
-        maybe_xml = maybe_xml.xml_str
+        error_log.extend(maybe_xml.parse_error_log)
+    else:
+        _, parse_error_log = _parse_xml(maybe_xml)
+        error_log.extend(parse_error_log)
+
+    return error_log
+
+
+def _parse_xml(maybe_xml):
+    """Parse a given parameter as XML, logging any reasons that it is not valid XML.
+
+    Args:
+        maybe_xml (str / bytes): A string that may or may not contain valid XML.
+
+    Returns:
+        tuple: A tuple in the format: `(etree._Element, iati.validator.ValidationErrorLog)`. The element is the root of the parsed XML, or `None` when it could not be parsed. The log contains the errors that occurred.
+
+    Warning:
+        Does not fully hide the lxml internal workings.
+
+    """
+    error_log = ValidationErrorLog()
+    tree = None
 
     try:
         parser = etree.XMLParser()
-        _ = etree.fromstring(maybe_xml.strip(), parser)
+        tree = etree.fromstring(maybe_xml.strip(), parser)
     except etree.XMLSyntaxError:
         for log_entry in parser.error_log:
             error = _create_error_for_lxml_log_entry(log_entry)
@@ -509,32 +861,116 @@ def _check_is_xml(maybe_xml):
         error = ValidationError(err_name, locals())
         error_log.add(error)
 
-    return error_log
+    return tree, error_log
 
 
-def _check_rules(dataset, ruleset):
+def _check_rules(dataset, ruleset, backend=RULESET_BACKEND_PYTHON, error_log=None):
     """Determine whether a given Dataset conforms with a provided Ruleset.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check Ruleset conformance with.
         ruleset (iati.code.Ruleset): The Ruleset to check conformance with.
+        backend (str): The backend to check the Ruleset with. One of `RULESET_BACKENDS`. Default is `RULESET_BACKEND_PYTHON`.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. Checking stops once it is full. Default is a new log.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    Raises:
+        ValueError: When the backend is not permitted.
+
+    Note:
+        With `RULESET_BACKEND_XSLT`, errors for Rules that do not pass have the line number of the element that caused the failure, where this is known.
+
+        With `RULESET_BACKEND_PYTHON`, Rules are checked a context at a time as their results are required. Rules with contexts that are not reached before the log is full are not checked.
+
     """
-    error_log = ValidationErrorLog()
+    if backend == RULESET_BACKEND_PYTHON:
+        results = _RuleResults(dataset, ruleset)
+    elif backend == RULESET_BACKEND_XSLT:
+        results = iati.ruleset_xslt.compiled_ruleset(ruleset).evaluate(dataset)
+    else:
+        raise ValueError('The Ruleset backend must be one of: {0}'.format(', '.join(RULESET_BACKENDS)))
+
+    return _check_rule_results(dataset, ruleset, results, error_log)
+
+
+class _RuleResults(dict):
+    """The results of checking a Dataset against the Rules in a Ruleset, in the format used by `_check_rule_results()`.
+
+    The Rules that share a context are checked when the result for the first of them is looked up, so that no Rules are checked until their results are required.
+
+    """
+
+    def __init__(self, dataset, ruleset):
+        """Initialise the results.
+
+        Args:
+            dataset (iati.data.Dataset): The Dataset to check.
+            ruleset (iati.code.Ruleset): The Ruleset to check the Dataset against.
+
+        """
+        super(_RuleResults, self).__init__()
+        self._dataset = dataset
+        self._rules_by_context = collections.defaultdict(list)
+        for rule in ruleset.rules:
+            self._rules_by_context[rule.context].append(rule)
+
+    def __missing__(self, rule):
+        """Check the Rules that share a context with the specified Rule, and return the result for the Rule.
+
+        Args:
+            rule (iati.Rule): A Rule within the Ruleset.
+
+        Returns:
+            tuple: A tuple in the format: `(result, None)`. The result is in the format returned by `iati.Ruleset.results_for()`.
+
+        """
+        context_results = iati.rulesets._results_for_context(self._dataset, rule.context, self._rules_by_context[rule.context])  # pylint: disable=protected-access
+        for context_rule, result in context_results.items():
+            self[context_rule] = (result, None)
+
+        return self[rule]
+
+
+def _check_rule_results(dataset, ruleset, results, error_log=None):
+    """Convert the results of checking a Dataset against a Ruleset into errors.
+
+    Args:
+        dataset (iati.data.Dataset): The Dataset that was checked.
+        ruleset (iati.code.Ruleset): The Ruleset that the Dataset was checked against.
+        results (dict): A dictionary mapping each Rule in the Ruleset to a `(result, line)` tuple. The result is in the format returned by `iati.Ruleset.results_for()`. The line is that of the element that caused a Rule to fail, or `None`.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. No further results are looked up once it is full. Default is a new log.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+    Raises:
+        Exception: The exception that was the result for a Rule, other than a skip or failure.
+
+    """
+    if error_log is None:
+        error_log = ValidationErrorLog()
     error_found = False
 
     for rule in ruleset.rules:
-        validation_status = rule.is_valid_for(dataset)
-        if validation_status is None:
+        if error_log.is_full():
+            return error_log
+
+        # the line number is not named `line_number` since `locals()` is used to create errors
+        validation_status, failure_line = results[rule]
+        if isinstance(validation_status, Exception):
+            raise validation_status
+        elif validation_status is None:
             # A result of `None` signifies that a rule was skipped.
             error = ValidationError('warn-rule-skipped', locals())
             error_log.add(error)
         elif validation_status is False:
             # A result of `False` signifies that a rule did not pass.
             error = _create_error_for_rule(rule)
+            if failure_line is not None:
+                error.line_number = failure_line
+                error.context = dataset.source_around_line(failure_line)
             error_log.add(error)
             error_found = True
 
@@ -546,21 +982,29 @@ def _check_rules(dataset, ruleset):
     return error_log
 
 
-def _check_ruleset_conformance(dataset, schema):
+def _check_ruleset_conformance(dataset, schema, backend=RULESET_BACKEND_PYTHON, error_log=None):
     """Check whether a given Dataset conforms with Rulesets that have been added to a Schema.
 
     Args:
         dataset (iati.data.Dataset): The Dataset to check Ruleset conformance with.
         schema (iati.schemas.Schema): The Schema to locate Rulesets within.
+        backend (str): The backend to check Rulesets with. One of `RULESET_BACKENDS`. Default is `RULESET_BACKEND_PYTHON`.
+        error_log (iati.validator.ValidationErrorLog): The log to add errors to. Checking stops once it is full. Default is a new log.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    Raises:
+        ValueError: When the backend is not permitted.
+
     """
-    error_log = ValidationErrorLog()
+    if error_log is None:
+        error_log = ValidationErrorLog()
 
     for ruleset in schema.rulesets:
-        error_log.extend(_check_rules(dataset, ruleset))
+        if error_log.is_full():
+            break
+        _check_rules(dataset, ruleset, backend, error_log)
 
     return error_log
 
@@ -576,7 +1020,7 @@ def _conforms_with_ruleset(dataset, schema):
         bool: A boolean indicating whether the given Dataset conforms with Rulesets attached to the given Schema.
 
     """
-    error_log = _check_ruleset_conformance(dataset, schema)
+    error_log = _check_ruleset_conformance(dataset, schema, error_log=ValidationErrorLog(stop_on_first_error=True))
 
     return not error_log.contains_errors()
 
@@ -592,16 +1036,17 @@ def _correct_codelist_values(dataset, schema):
         bool: A boolean indicating whether the given Dataset has values from the specified Codelists where they should be.
 
     """
-    error_log = _check_codelist_values(dataset, schema)
+    error_log = _check_codelist_values(dataset, schema, error_log=ValidationErrorLog(stop_on_first_error=True))
 
     return not error_log.contains_errors()
 
 
-def _create_error_for_lxml_log_entry(log_entry):  # pylint: disable=invalid-name
+def _create_error_for_lxml_log_entry(log_entry, line_number=None):  # pylint: disable=invalid-name
     """Parse a log entry from an lxml error log and convert it to a IATI ValidationError.
 
     Args:
         log_entry (etree._LogEntry): A log entry from an `etree.XMLSyntaxError` or `etree.DocumentInvalid`.
+        line_number (int): The line number to give the error, where this differs from that of the log entry. Default is the line number of the log entry.
 
     Returns:
         ValidationError: An IATI ValidationError that contains the information from the log entry.
@@ -616,7 +1061,8 @@ def _create_error_for_lxml_log_entry(log_entry):  # pylint: disable=invalid-name
     err = log_entry
 
     # configure local variables for the creation of the error
-    line_number = err.line  # used via `locals()`# pylint: disable=unused-variable
+    if line_number is None:
+        line_number = err.line  # used via `locals()`# pylint: disable=unused-variable
     column_number = err.column  # used via `locals()`# pylint: disable=unused-variable
 
     # undertake the mapping between error name formats
@@ -682,12 +1128,16 @@ def _create_error_for_rule(rule):
     return error
 
 
-def full_validation(dataset, schema):
+def full_validation(dataset, schema, threads=1, stop_on_first_error=False, max_errors=None, max_errors_per_code=None):
     """Perform full validation on a Dataset against the provided Schema.
 
     Args:
         dataset (iati.Dataset): The Dataset to check validity of.
         schema (iati.Schema): The Schema to validate the Dataset against.
+        threads (int): The number of threads to validate the Dataset against the XSD of the Schema with. Default 1. See `validate_is_iati_xml()`.
+        stop_on_first_error (bool): Whether to stop validating once an error has been found. Default `False`.
+        max_errors (int): The maximum number of errors and warnings to find before validation stops. Default is no limit.
+        max_errors_per_code (int): The maximum number of errors or warnings with each name to find. Default is no limit.
 
     Warning:
         Parameters are likely to change in some manner.
@@ -695,26 +1145,194 @@ def full_validation(dataset, schema):
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    Note:
+        Validation stops as soon as the log is full, without checking the remaining Codelist values or Rules. When more than one thread is used, the remaining XSD chunks are not validated either. The log contains the errors that were found first.
+
+        Errors are found in the same order as when no limits are set, so the log begins with the same errors as a full log would.
+
     Todo:
         Create test against a bad Schema.
 
     """
-    error_log = ValidationErrorLog()
+    error_log = ValidationErrorLog(max_errors, max_errors_per_code, stop_on_first_error)
 
     error_log.extend(_check_is_xml(dataset))
     try:
-        error_log.extend(_check_is_iati_xml(dataset, schema))
+        _check_is_iati_xml(dataset, schema, threads=threads, error_log=error_log)
     except TypeError:
         return error_log
-    error_log.extend(_check_codelist_values(dataset, schema))
-    error_log.extend(_check_ruleset_conformance(dataset, schema))
+    _check_codelist_values(dataset, schema, error_log=error_log)
+    _check_ruleset_conformance(dataset, schema, error_log=error_log)
 
     return error_log
 
 
+def validate_many(sources, schema, workers=None, ordered=True):
+    """Perform full validation on a number of Datasets against the provided Schema, using a pool of worker processes.
+
+    Args:
+        sources (iterable): The Datasets to validate. Each may be the path to a file, the bytes of a file, or an `iati.Dataset`.
+        schema (iati.Schema): The Schema to validate the Datasets against.
+        workers (int): The number of worker processes to start. Default is the number of CPUs.
+        ordered (bool): Whether results are yielded in the order of `sources`. When `False`, each result is yielded as soon as it is available. Default `True`.
+
+    Yields:
+        tuple: A tuple in the format `(source, iati.validator.ValidationErrorLog)`. The `source` is the item of `sources` that was validated. The log contains the errors that `full_validation()` finds for it.
+
+    Raises:
+        FileNotFoundError: When a file at a specified path does not exist.
+        TypeError: When a source is not a path, bytes or a Dataset.
+
+    Note:
+        Each worker builds the Schema from the file it was loaded from, adds its Codelists and Rulesets, and compiles its validator when it starts. The same Schema is then used for every Dataset that the worker validates.
+
+        Datasets are sent to workers as paths, or as the bytes of their XML, rather than as parsed trees. Line numbers are those of `Dataset.xml_str`. For a Dataset that was created from a tree, this is a pretty-printed serialisation of the tree.
+
+        Sources are read in batches of `VALIDATE_MANY_BATCH_SIZE` per worker. At most two batches are sent to the workers at a time, so sources may be a generator over more Datasets than fit in memory.
+
+        When a source is not XML, its log contains the errors that prevented it from being parsed.
+
+    Warning:
+        Changes made to the base tree of the Schema after it was loaded are not seen by the workers.
+
+    """
+    indexed_sources = enumerate(sources)
+    batch_size = VALIDATE_MANY_BATCH_SIZE * (workers or os.cpu_count() or 1)
+    worker_schema = (type(schema), schema._source_path, list(schema.codelists), list(schema.rulesets))  # pylint: disable=protected-access
+
+    with multiprocessing.Pool(workers, _initialise_worker, worker_schema) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        batches = collections.deque()
+
+        def send_batch():
+            """Send the next batch of sources to the workers, keeping each source until its result is yielded."""
+            batch = dict(itertools.islice(indexed_sources, batch_size))
+            if batch:
+                batches.append((batch, imap(_validate_in_worker, [(index,) + _worker_task(source) for index, source in batch.items()])))
+
+        # a second batch is kept queued so that workers do not wait while the results of the first are yielded
+        send_batch()
+        send_batch()
+        while batches:
+            batch, results = batches.popleft()
+            for index, error_log in results:
+                yield batch.pop(index), error_log
+            send_batch()
+
+
+def _worker_task(source):
+    """Convert a source to be validated into a form that may be sent to a worker process.
+
+    Args:
+        source (str / bytes / iati.Dataset): The path to a file, the bytes of a file, or a Dataset.
+
+    Returns:
+        tuple: A tuple in the format `(bool, str / bytes)`. The bool indicates whether the value is a path to load, rather than the bytes of a file.
+
+    Raises:
+        TypeError: When the source is not a path, bytes or a Dataset.
+
+    """
+    if isinstance(source, str):
+        return True, source
+    elif isinstance(source, bytes):
+        return False, source
+    elif isinstance(source, iati.data.Dataset):
+        # the XML of a Dataset cannot contain an encoding declaration when it is a str, so is encoded as UTF-8 without changing its line numbers
+        xml_str = source.xml_str
+        return False, xml_str.encode('utf-8') if isinstance(xml_str, str) else xml_str
+
+    raise TypeError('Only paths, bytes and Datasets may be validated. Actual type: {0}'.format(type(source)))
+
+
+def _initialise_worker(schema_class, schema_path, codelists, rulesets):
+    """Prepare a worker process started by `validate_many()` to validate Datasets.
+
+    The Schema is built and its validator compiled, and the data that is cached on first use is loaded, so that this is done once per worker rather than for each Dataset.
+
+    Args:
+        schema_class (type): The class of the Schema to validate against.
+        schema_path (str): The path that the Schema was loaded from.
+        codelists (list of iati.Codelist): The Codelists to add to the Schema.
+        rulesets (list of iati.Ruleset): The Rulesets to add to the Schema.
+
+    """
+    global _WORKER_SCHEMA  # pylint: disable=global-statement
+
+    schema = schema_class(schema_path)
+    schema.codelists.update(codelists)
+    schema.rulesets.update(rulesets)
+    schema.validator()
+
+    _error_code_registry()
+    for version in iati.version.STANDARD_VERSIONS_SUPPORTED:
+        iati.default._codelist_mapping(version)  # pylint: disable=protected-access
+
+    _WORKER_SCHEMA = schema
+
+
+def _validate_in_worker(task):
+    """Validate a Dataset within a worker process started by `validate_many()`.
+
+    Args:
+        task (tuple): A tuple in the format `(int, bool, str / bytes)`. The int is the index of the source. The remainder is in the format returned by `_worker_task()`.
+
+    Returns:
+        tuple: A tuple in the format `(int, iati.validator.ValidationErrorLog)`. The int is the index of the source.
+
+    """
+    index, is_path, source = task
+
+    try:
+        dataset = iati.utilities.load_as_dataset(source) if is_path else iati.Dataset(source)
+    except iati.exceptions.ValidationError as parse_error:
+        return index, parse_error.error_log
+
+    return index, full_validation(dataset, _WORKER_SCHEMA)
+
+
+def _error_code_registry():
+    """Return the cached, read-only registry of error code templates.
+
+    The error codes are loaded from disk the first time that this is called. Subsequent calls return the same registry.
+
+    Returns:
+        types.MappingProxyType: A read-only mapping from error code names to `_ErrorCodeTemplate` instances.
+
+    Raises:
+        KeyError: When a specified base_exception is not a valid type of exception.
+
+    """
+    global _ERROR_CODES  # pylint: disable=global-statement
+
+    if _ERROR_CODES is None:
+        with _ERROR_CODES_LOCK:
+            if _ERROR_CODES is None:
+                templates = {name: _ErrorCodeTemplate(name, err_detail) for name, err_detail in _load_error_codes().items()}
+                _ERROR_CODES = types.MappingProxyType(templates)
+
+    return _ERROR_CODES
+
+
 def get_error_codes():
     """Return a dictionary of the possible error codes and their information.
 
+    Returns:
+        dict: A dictionary of error codes.
+
+    Raises:
+        KeyError: When a specified base_exception is not a valid type of exception.
+
+    Note:
+        The returned dictionary is a copy of the cached error codes. It may be modified without affecting the creation of ValidationErrors.
+
+    """
+    return {name: template.as_dict() for name, template in _error_code_registry().items()}
+
+
+def _load_error_codes():
+    """Load the possible error codes and their information from disk.
+
     Returns:
         dict: A dictionary of error codes.
 
@@ -727,6 +1345,7 @@ def get_error_codes():
 
     """
     err_codes_str = iati.utilities.load_as_string(iati.resources.create_lib_data_path('validation_err_codes.yaml'))
+    import yaml  # imported here since it is slow to import and only required once
     err_codes_list_of_dict = yaml.safe_load(err_codes_str)
     # yaml parses the values into a list of dicts, so they need combining into one
     err_codes_dict = {k: v for code in err_codes_list_of_dict for k, v in code.items()}
@@ -774,21 +1393,23 @@ def is_valid(dataset, schema):
     Returns:
         bool: A boolean indicating whether the given Dataset is valid against the given Schema.
 
+    Note:
+        Validation stops at the first error that is found.
+
     Todo:
         Create test against a bad Schema.
 
     """
+    error_log = ValidationErrorLog(stop_on_first_error=True)
+
     try:
-        iati_xml = is_iati_xml(dataset, schema)
-        if not iati_xml:
-            return False
+        _check_is_iati_xml(dataset, schema, error_log=error_log)
     except iati.exceptions.SchemaError:
         return False
+    _check_codelist_values(dataset, schema, error_log=error_log)
+    _check_ruleset_conformance(dataset, schema, error_log=error_log)
 
-    correct_codelist_values = _correct_codelist_values(dataset, schema)
-    conforms_with_ruleset = _conforms_with_ruleset(dataset, schema)
-
-    return correct_codelist_values and conforms_with_ruleset
+    return not error_log.contains_errors()
 
 
 def is_xml(maybe_xml):
@@ -806,17 +1427,23 @@ def is_xml(maybe_xml):
     return not error_log.contains_errors()
 
 
-def validate_is_iati_xml(dataset, schema):
+def validate_is_iati_xml(dataset, schema, threads=1):
     """Check whether a Dataset contains valid IATI XML.
 
     Args:
         dataset (iati.Dataset): The Dataset to check validity of.
+        threads (int): The number of threads to validate the Dataset with. Default 1.
 
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    Note:
+        With more than one thread, the activities or organisations within the Dataset are split into chunks of up to `XSD_CHUNK_SIZE`, which are validated in parallel. The same errors are returned, with the same line numbers.
+
+        Validating in chunks is also faster within a single thread when the Dataset contains many errors.
+
     """
-    return _check_is_iati_xml(dataset, schema)
+    return _check_is_iati_xml(dataset, schema, threads=threads)
 
 
 def validate_is_xml(maybe_xml):